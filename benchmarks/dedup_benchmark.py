@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+유사 중복 감지 벤치마크
+최근 기사 윈도우를 채운 뒤 기사 하나당 추가/조회 시간과 중복 감지율 측정
+
+사용법:
+    python benchmarks/dedup_benchmark.py [-n 윈도우크기] [-q 조회수]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawler.dedup import NearDuplicateIndex
+
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]  # 임의 한글 음절 풀
+PREFIXES = ['[속보]', '[단독]', '[특징주]', '']
+
+
+def make_headline(rng: random.Random) -> str:
+    """임의 제목 (2~4음절 단어 4~7개)"""
+    words = [''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))) for _ in range(rng.randint(4, 7))]
+    return ' '.join(words)
+
+
+def make_variant(title: str, rng: random.Random) -> str:
+    """같은 기사의 다른 언론사 제목 흉내 (말머리 추가, 단어 하나 교체 또는 문장부호 변경)"""
+    words = title.split()
+    choice = rng.random()
+    if choice < 0.4:
+        return f"{rng.choice(PREFIXES)} {title}"
+    elif choice < 0.7:
+        words[rng.randrange(len(words))] = ''.join(rng.choice(SYLLABLES) for _ in range(2))
+        return ' '.join(words)
+    return '"' + '…'.join(words[:2]) + ' ' + ' '.join(words[2:]) + '"'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="유사 중복 감지 추가/조회 시간 측정")
+    parser.add_argument("-n", "--window", type=int, default=100000, help="윈도우에 채울 기사 수")
+    parser.add_argument("-q", "--queries", type=int, default=10000, help="조회 수 (중복/새 기사 절반씩)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    headlines = [make_headline(rng) for _ in range(args.window)]
+    index = NearDuplicateIndex(window_size=args.window)
+
+    start = time.perf_counter()
+    for key, title in enumerate(headlines):
+        index.add(key, title)
+    insert_elapsed = time.perf_counter() - start
+
+    duplicates = [make_variant(rng.choice(headlines), rng) for _ in range(args.queries // 2)]
+    fresh = [make_headline(rng) for _ in range(args.queries // 2)]
+
+    start = time.perf_counter()
+    detected = sum(1 for title in duplicates if index.find(title) is not None)
+    false_positives = sum(1 for title in fresh if index.find(title) is not None)
+    query_elapsed = time.perf_counter() - start
+    queries = len(duplicates) + len(fresh)
+
+    print(f"윈도우 {len(index):,}건, 조회 {queries:,}건")
+    print(f"추가: {insert_elapsed / args.window * 1e6:.1f}µs/건 ({args.window / insert_elapsed:,.0f}건/초)")
+    print(f"조회: {query_elapsed / queries * 1e6:.1f}µs/건 ({queries / query_elapsed:,.0f}건/초)")
+    print(f"중복 감지율: {detected / len(duplicates):.1%}, 오탐률: {false_positives / len(fresh):.2%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+이벤트 루프 지연 벤치마크
+크롤링 파싱이 진행되는 동안 명령어 핸들러가 얼마나 늦게 실행되는지 파싱 풀 모드별로 측정
+
+사용법:
+    python benchmarks/loop_latency_benchmark.py [--backend bs4] [--rounds 10]
+
+'inline'은 풀 도입 전(이벤트 루프에서 직접 파싱)과 같은 동작입니다.
+"""
+
+import argparse
+import asyncio
+import glob
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger
+
+from src.crawler.news_crawler import process_page
+from src.crawler.parse_pool import ParsePool
+
+
+PROBE_INTERVAL = 0.005  # 가상 명령어 핸들러 실행 간격 (초)
+
+
+async def probe_handler_latency(samples: list, stop: asyncio.Event):
+    """주기적으로 깨어나 예정 시각보다 얼마나 늦었는지 기록 (명령어 핸들러 대기 시간 근사)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def run_mode(mode: str, pages: list, rounds: int, workers: int) -> dict:
+    """한 가지 풀 모드로 파싱 부하를 주면서 핸들러 지연 측정"""
+    pool = ParsePool(mode=mode, workers=workers, queue_size=8)
+    crawl_time = datetime.now()
+
+    # 프로세스 풀 기동 비용은 측정에서 제외
+    await pool.run(process_page, pages[0][0], pages[0][1], crawl_time, None)
+
+    samples = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_handler_latency(samples, stop))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        # 한 번의 크롤링처럼 모든 페이지를 동시에 파싱
+        await asyncio.gather(*(
+            pool.run(process_page, source_key, html, crawl_time, None)
+            for source_key, html in pages
+        ))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await probe
+    pool.shutdown()
+
+    samples.sort()
+    return {
+        'p50': statistics.median(samples),
+        'p95': statistics.quantiles(samples, n=20, method='inclusive')[18],
+        'max': samples[-1],
+        'crawls_per_sec': rounds / elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파싱 풀 모드별 이벤트 루프 지연 측정")
+    parser.add_argument("--backend", default="bs4", help="HTML 파서 백엔드 (auto, selectolax, lxml, bs4)")
+    parser.add_argument("--rounds", type=int, default=10, help="크롤링 반복 횟수")
+    parser.add_argument("--workers", type=int, default=2, help="워커 수")
+    parser.add_argument("--modes", default="inline,thread,process", help="측정할 풀 모드")
+    args = parser.parse_args()
+
+    logger.remove()  # 벤치마크 중 로그 출력 억제
+    os.environ["HTML_PARSER_BACKEND"] = args.backend  # 프로세스 워커에도 전달
+    os.environ["LOG_LEVEL"] = "WARNING"
+
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+
+    print(f"백엔드: {args.backend}, 크롤링 {args.rounds}회 x 페이지 {len(pages)}개")
+    print(f"{'모드':<10}{'p50':>10}{'p95':>10}{'max':>10}{'크롤링/초':>12}")
+    for mode in args.modes.split(","):
+        result = asyncio.run(run_mode(mode, pages, args.rounds, args.workers))
+        print(f"{mode:<10}{result['p50']:>8.1f}ms{result['p95']:>8.1f}ms{result['max']:>8.1f}ms"
+              f"{result['crawls_per_sec']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
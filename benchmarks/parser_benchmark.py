@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+HTML 추출 엔진 벤치마크
+저장된 HTML 페이지로 백엔드별 페이지당 파싱 시간을 측정
+
+사용법:
+    python benchmarks/parser_benchmark.py [-n 반복횟수] [HTML 파일 ...]
+
+파일명(확장자 제외)이 크롤러 소스 키(naver_finance, naver_stock, daum_finance 등)와 같아야 합니다.
+파일을 지정하지 않으면 benchmarks/fixtures/*.html 을 사용합니다.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger
+
+from src.crawler.extractors import EXTRACTOR_CLASSES, get_extractor
+from src.crawler.news_crawler import NEWS_SOURCES, extract_news
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 추출 엔진 벤치마크")
+    parser.add_argument("files", nargs="*", help="저장된 HTML 파일")
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="페이지별 반복 횟수")
+    args = parser.parse_args()
+
+    logger.remove()  # 벤치마크 중 로그 출력 억제
+
+    fixture_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+    files = args.files or sorted(glob.glob(os.path.join(fixture_dir, "*.html")))
+
+    crawl_time = datetime.now()
+
+    backends = []
+    for name in EXTRACTOR_CLASSES:
+        extractor = get_extractor(name)
+        if extractor.name == name:  # 설치되지 않아 대체된 백엔드는 제외
+            backends.append(extractor)
+
+    print(f"{'페이지':<20}{'크기':>10}" + "".join(f"{b.name:>14}" for b in backends) + "   결과 일치")
+
+    for path in files:
+        source_key = os.path.splitext(os.path.basename(path))[0]
+        source = NEWS_SOURCES.get(source_key)
+        if source is None:
+            print(f"{source_key:<20} (알 수 없는 소스, 건너뜀)")
+            continue
+
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+
+        timings = []
+        results = []
+        for extractor in backends:
+            news = extract_news(extractor, source, html, crawl_time)  # 워밍업 및 결과 비교용
+            results.append(news)
+
+            start = time.perf_counter()
+            for _ in range(args.iterations):
+                extract_news(extractor, source, html, crawl_time)
+            timings.append((time.perf_counter() - start) / args.iterations * 1000)
+
+        identical = all(result == results[0] for result in results)
+        print(f"{source_key:<20}{len(html) // 1024:>8}KB" + "".join(f"{t:>12.2f}ms" for t in timings)
+              + f"   {'예' if identical else '아니오'} ({len(results[0])}건)")
+
+
+if __name__ == "__main__":
+    main()
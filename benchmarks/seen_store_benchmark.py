@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+본 뉴스 저장소 메모리 벤치마크
+기존 md5 16진 문자열 set과 회전식 블룸 필터(SeenStore)의 메모리, 처리 시간, 오탐률 비교
+
+사용법:
+    python benchmarks/seen_store_benchmark.py [-n 기사수] [--error-rate 0.001]
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawler.article_id import article_key
+from src.utils.seen_store import SeenStore
+
+
+def measure_memory(build) -> int:
+    """구조를 만드는 동안 늘어난 메모리 (바이트)"""
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return memory
+
+
+def measure_time(build) -> float:
+    """구조를 만드는 데 걸린 시간 (초)"""
+    start = time.perf_counter()
+    build()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본 뉴스 저장소 메모리 비교")
+    parser.add_argument("-n", "--count", type=int, default=1000000, help="기사 수")
+    parser.add_argument("--error-rate", type=float, default=0.001, help="필터 하나의 오탐률")
+    args = parser.parse_args()
+
+    titles = [f"기사 제목 {i}" for i in range(args.count)]
+    ids = [f"naver:{i % 1000:03d}:{i:010d}" for i in range(args.count)]
+    keys = [article_key(article_id) for article_id in ids]
+
+    def build_set():
+        known = set()
+        for title in titles:
+            known.add(hashlib.md5(f"{title}09:00".encode()).hexdigest())
+        return known
+
+    def build_store():
+        store = SeenStore(capacity=args.count, error_rate=args.error_rate)
+        for key in keys:
+            store.add(key)
+        return store
+
+    set_memory = measure_memory(build_set)
+    set_elapsed = measure_time(build_set)
+    # SeenStore는 생성 시점에 필터를 모두 할당하고 이후 늘어나지 않음
+    store_memory = measure_memory(lambda: SeenStore(capacity=args.count, error_rate=args.error_rate))
+    start = time.perf_counter()
+    store = build_store()
+    store_elapsed = time.perf_counter() - start
+
+    # 추가하지 않은 키로 오탐률 측정
+    probes = [article_key(f"daum:{i:017d}") for i in range(100000)]
+    false_positives = sum(1 for key in probes if key in store)
+
+    print(f"기사 {args.count:,}건")
+    print(f"{'방식':<16}{'메모리':>12}{'추가 시간':>12}")
+    print(f"{'set(md5 hex)':<16}{set_memory / 1024 / 1024:>10.1f}MB{set_elapsed:>11.2f}s")
+    print(f"{'SeenStore':<16}{store_memory / 1024 / 1024:>10.1f}MB{store_elapsed:>11.2f}s")
+    print(f"SeenStore 필터 크기: {store.nbytes / 1024 / 1024:.1f}MB (최대 {args.count:,}건 x 2세대)")
+    print(f"오탐률: {false_positives / len(probes):.4%} (필터 하나 기준 {args.error_rate:.4%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+감정 분석 벤치마크
+기존 키워드 반복 방식과 컴파일된 감정 사전(score, score_batch)의 초당 처리 제목 수 비교
+
+사용법:
+    python benchmarks/sentiment_benchmark.py [-n 제목수]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.crawler.sentiment import SentimentScorer
+
+
+def legacy_analyze_sentiment(title: str) -> str:
+    """기존 구현 (호출마다 키워드 목록 생성 후 부분 문자열 검사)"""
+    positive_keywords = [
+        '상승', '급등', '호재', '성장', '증가', '확대', '개선', '호조',
+        '플러스', '상향', '돌파', '신고가', '최고', '강세', '반등',
+        '급증', '폭등', '수익', '성과', '흑자', '실적', '성공'
+    ]
+
+    negative_keywords = [
+        '하락', '급락', '악재', '감소', '하향', '위험', '부진', '약세',
+        '마이너스', '손실', '적자', '하락세', '폭락', '최저', '부정적',
+        '우려', '불안', '리스크', '문제', '지연', '취소'
+    ]
+
+    title_lower = title.lower()
+
+    positive_score = sum(1 for keyword in positive_keywords if keyword in title_lower)
+    negative_score = sum(1 for keyword in negative_keywords if keyword in title_lower)
+
+    if positive_score > negative_score:
+        return 'positive'
+    elif negative_score > positive_score:
+        return 'negative'
+    else:
+        return 'neutral'
+
+
+def make_headlines(count: int) -> list:
+    """벤치마크용 임의 제목 생성"""
+    random.seed(42)
+    words = ['삼성전자', 'SK하이닉스', '코스피', '외국인', '순매수', '반도체', '2차전지', '환율', '금리',
+             '연준', '배당', '공시', '목표가', '전망', '수출', '상승', '하락세', '급등', '우려', '흑자']
+    return [' '.join(random.choice(words) for _ in range(random.randint(4, 9))) for _ in range(count)]
+
+
+def measure(func, repeat: int = 3) -> float:
+    """가장 빠른 실행 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="감정 분석 처리량 비교")
+    parser.add_argument("-n", "--count", type=int, default=100000, help="제목 수")
+    args = parser.parse_args()
+
+    headlines = make_headlines(args.count)
+    scorer = SentimentScorer()
+
+    results = [
+        ('기존 구현', measure(lambda: [legacy_analyze_sentiment(t) for t in headlines])),
+        ('score', measure(lambda: [scorer.score(t) for t in headlines])),
+        ('score_batch', measure(lambda: scorer.score_batch(headlines))),
+    ]
+
+    baseline = results[0][1]
+    print(f"제목 {args.count:,}건")
+    print(f"{'방식':<14}{'초당 제목 수':>16}{'배율':>8}")
+    for name, elapsed in results:
+        print(f"{name:<14}{args.count / elapsed:>16,.0f}{baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
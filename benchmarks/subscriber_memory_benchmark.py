@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+구독자 메모리 벤치마크
+같은 수의 정기 알림 구독자를 이전 형식(사용자마다 dict + times 목록 + datetime, 분 -> 사용자 색인)과
+현재 형식(__slots__ 레코드 + 공유 시간표, 시간표 -> 사용자 색인)으로 올렸을 때의 메모리 비교
+
+사용법:
+    python benchmarks/subscriber_memory_benchmark.py [-n 구독자수]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger
+
+from src.utils.scheduler import NewsScheduler
+from src.utils.subscriber_records import SubscriberRecord, minute_of_day
+
+
+def measure(build) -> tuple:
+    """build()가 만든 객체의 메모리 (바이트)와 걸린 시간"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    gc.collect()
+    return size, elapsed
+
+
+def build_legacy(count: int, default_times: list):
+    """이전 형식: 사용자마다 times 목록/datetime을 가진 dict + 분 -> 사용자 집합 색인"""
+    subscribers, index = {}, {}
+    for user_id in range(1, count + 1):
+        times = list(default_times)
+        subscribers[user_id] = {'times': times, 'enabled': True, 'added_at': datetime.now()}
+        for value in times:
+            index.setdefault(minute_of_day(value), set()).add(user_id)
+    return subscribers, index
+
+
+def build_records(count: int, scheduler: NewsScheduler):
+    """현재 형식: 레코드 + 시간표 -> 사용자 집합 색인"""
+    schedule = scheduler.default_schedule
+    now = time.time()
+    for user_id in range(1, count + 1):
+        scheduler.subscribers[user_id] = SubscriberRecord(schedule, True, now)
+        scheduler._index_subscriber(user_id, schedule)
+    return scheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구독자 레코드 메모리 측정")
+    parser.add_argument("-n", "--users", type=int, default=1000000, help="구독자 수")
+    args = parser.parse_args()
+
+    logger.remove()
+    scheduler = NewsScheduler(None)
+
+    legacy_size, legacy_elapsed = measure(lambda: build_legacy(args.users, scheduler.default_times))
+    record_size, record_elapsed = measure(lambda: build_records(args.users, scheduler))
+
+    print(f"구독자 {args.users:,}명 (기본 알림 시간 {len(scheduler.default_times)}개)")
+    print(f"이전 형식: {legacy_size / 1024 / 1024:,.0f}MB ({legacy_size / args.users:,.0f}B/명), "
+          f"구성 {legacy_elapsed:.1f}초")
+    print(f"레코드 형식: {record_size / 1024 / 1024:,.0f}MB ({record_size / args.users:,.0f}B/명), "
+          f"구성 {record_elapsed:.1f}초")
+    print(f"절감: {1 - record_size / legacy_size:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+구독자 저장소 벤치마크
+- 시작시 불러오기: 저장소에 구독자를 채운 뒤 스케줄러로 불러오는 시간
+- 그룹 커밋: 동시에 들어온 명령어 변경을 몇 번의 커밋으로 기록하는지와 처리량
+- 강제 종료: 응답(sync 완료)한 변경이 프로세스를 죽여도 남아 있는지 확인
+
+사용법:
+    python benchmarks/subscriber_store_benchmark.py [-n 구독자수] [-c 동시명령수]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from loguru import logger
+
+from src.database.subscriber_store import SubscriberStore, UserRow
+from src.utils.scheduler import NewsScheduler
+
+
+def fill(store: SubscriberStore, count: int, rng: random.Random):
+    """구독자 채우기 (10%는 직접 정한 알림 시간, 5%는 비활성)"""
+    custom = ['08:30,12:00,15:40', '09:00,15:30', '07:50,18:10']
+    now = time.time()
+    users = {
+        user_id: UserRow(user_id, rng.random() >= 0.05, rng.choice(custom) if rng.random() < 0.1 else None, now)
+        for user_id in range(1, count + 1)
+    }
+    store.write(users, {})
+
+
+async def group_commit(store: SubscriberStore, commands: int, rng: random.Random) -> float:
+    """명령어 commands개가 동시에 변경 후 sync를 기다리는 시간"""
+    store.start()
+
+    async def command(user_id: int):
+        store.put_user(UserRow(user_id, rng.random() < 0.5, None, time.time()))
+        await store.sync()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(command(rng.randrange(1, 10 ** 6)) for _ in range(commands)))
+    elapsed = time.perf_counter() - start
+    await store.stop()
+    return elapsed
+
+
+def crash_child(path: str):
+    """변경을 계속 기록하면서 sync가 끝난 사용자 ID를 출력 (부모가 강제 종료)"""
+    async def run():
+        store = SubscriberStore(path, flush_interval=0.01)
+        store.start()
+        user_id = 10 ** 7
+        while True:
+            user_id += 1
+            store.put_user(UserRow(user_id, True, None, time.time()))
+            await store.sync()
+            print(user_id, flush=True)
+    asyncio.run(run())
+
+
+def crash_check(path: str) -> bool:
+    process = subprocess.Popen([sys.executable, __file__, "--crash-child", path], stdout=subprocess.PIPE, text=True)
+    acknowledged = 0
+    start = time.time()
+    for line in process.stdout:
+        acknowledged = int(line)
+        if time.time() - start > 1.0:
+            break
+    process.send_signal(signal.SIGKILL)
+    process.wait()
+
+    store = SubscriberStore(path)
+    stored = {row.id for row in store.load_users()}
+    store.close()
+    missing = [user_id for user_id in range(10 ** 7 + 1, acknowledged + 1) if user_id not in stored]
+    print(f"강제 종료: 응답한 변경 {acknowledged - 10 ** 7:,}건 중 유실 {len(missing)}건")
+    return not missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구독자 저장소 불러오기/그룹 커밋 측정")
+    parser.add_argument("-n", "--users", type=int, default=1000000, help="구독자 수")
+    parser.add_argument("-c", "--commands", type=int, default=10000, help="동시 명령어 수")
+    parser.add_argument("--crash-child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.crash_child:
+        crash_child(args.crash_child)
+        return
+
+    logger.remove()  # 구독자 추가 로그 생략
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "subscribers.db")
+        store = SubscriberStore(path)
+
+        start = time.perf_counter()
+        fill(store, args.users, rng)
+        print(f"구독자 {args.users:,}명 기록: {time.perf_counter() - start:.2f}초, "
+              f"파일 {os.path.getsize(path) / 1024 / 1024:.1f}MB (WAL 제외)")
+
+        scheduler = NewsScheduler(None)
+        start = time.perf_counter()
+        asyncio.run(scheduler.load_subscribers(store))
+        print(f"시작시 불러오기: {time.perf_counter() - start:.2f}초 "
+              f"(활성 {scheduler.enabled_count:,}명, 시간표 {len(scheduler.schedule_groups)}종)")
+
+        elapsed = asyncio.run(group_commit(store, args.commands, rng))
+        print(f"동시 명령어 {args.commands:,}개: {elapsed:.2f}초, 커밋 {store.commits - 1}회 "
+              f"({args.commands / elapsed:,.0f}건/초)")
+        store.close()
+
+        crash_check(os.path.join(directory, "crash.db"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+종목/키워드 구독 매칭 벤치마크
+구독자를 채운 뒤 한 시간 분량의 기사를 역색인으로 나눌 때와 구독자 전체를 훑을 때의 시간 비교
+
+사용법:
+    python benchmarks/subscription_benchmark.py [-u 구독자수] [-a 기사수] [-k 키워드수]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.subscriptions import KEYWORD, STOCK, STOCK_NAMES, SubscriptionIndex, _search_terms
+
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xD7A4, 37)]  # 임의 한글 음절 풀
+
+
+def make_word(rng: random.Random) -> str:
+    return ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구독 매칭 시간 측정 (역색인 vs 전체 탐색)")
+    parser.add_argument("-u", "--users", type=int, default=100000, help="구독자 수")
+    parser.add_argument("-a", "--articles", type=int, default=1000, help="기사 수 (시간당)")
+    parser.add_argument("-k", "--keywords", type=int, default=5000, help="키워드 종류 수")
+    parser.add_argument("-s", "--per-user", type=int, default=5, help="사용자당 구독 수")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    keywords = list({make_word(rng) for _ in range(args.keywords)})
+    stocks = list(STOCK_NAMES)
+
+    user_subscriptions = {}
+    for user_id in range(args.users):
+        subscriptions = {(STOCK, rng.choice(stocks))}
+        while len(subscriptions) < args.per_user:
+            subscriptions.add((KEYWORD, rng.choice(keywords)))
+        user_subscriptions[user_id] = subscriptions
+
+    # 제목: 임의 단어 + 가끔 종목명/구독 키워드
+    articles = []
+    for _ in range(args.articles):
+        words = [make_word(rng) for _ in range(rng.randint(5, 8))]
+        if rng.random() < 0.5:
+            words.insert(0, rng.choice(STOCK_NAMES[rng.choice(stocks)]))
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        articles.append({'title': ' '.join(words)})
+
+    index = SubscriptionIndex(max_per_user=args.per_user)
+    start = time.perf_counter()
+    for user_id, subscriptions in user_subscriptions.items():
+        for subscription in subscriptions:
+            index.add(user_id, subscription)
+    build_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    routed = index.route(articles)
+    index_elapsed = time.perf_counter() - start
+    deliveries = sum(len(news_list) for news_list in routed.values())
+
+    # 비교: 기사마다 모든 구독자의 구독 항목을 제목과 대조
+    sample = articles[:max(1, args.articles // 100)]
+    start = time.perf_counter()
+    scan_deliveries = 0
+    for news in sample:
+        title = news['title'].lower()
+        for subscriptions in user_subscriptions.values():
+            if any(term in title for subscription in subscriptions for term in _search_terms(subscription)):
+                scan_deliveries += 1
+    scan_elapsed = (time.perf_counter() - start) / len(sample) * len(articles)
+
+    expected = sum(len(index.match(news)) for news in sample)
+    stats = index.get_stats()
+    print(f"구독자 {stats['users']:,}명, 구독 {stats['subscriptions']:,}건, 검색어 {stats['terms']:,}개")
+    print(f"색인 구축: {build_elapsed:.2f}초 ({stats['subscriptions'] / build_elapsed:,.0f}건/초)")
+    print(f"기사 {len(articles):,}건 -> 전달 {deliveries:,}건 (사용자 {len(routed):,}명)")
+    print(f"역색인: {index_elapsed:.3f}초 ({index_elapsed / len(articles) * 1e6:.0f}µs/기사)")
+    print(f"전체 탐색: {scan_elapsed:.1f}초 추정 ({len(sample)}건 측정, {scan_elapsed / len(articles) * 1e3:.0f}ms/기사)")
+    print(f"결과 일치: {'예' if expected == scan_deliveries else '아니오'} (표본 전달 {scan_deliveries:,}건)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,371 @@
+"""
+메시지 일괄 전송 엔진
+정기 알림과 긴급 알림을 텔레그램 전송 한도 안에서 최대한 빠르게 보내는 공용 전송기
+- 전체 한도: 토큰 버킷 (기본 초당 30건)
+- 채팅별 한도: 같은 채팅에는 per_chat_interval초에 1건
+- RetryAfter를 받으면 전체 전송을 그 시간만큼 멈춘 뒤 다시 시도
+- 알림은 발송 대기열(아웃박스)에 먼저 기록하고 OutboxWorker가 꺼내 보냄 (재시작 후에도 이어서 전송)
+- DELIVERY_MODE로 알림 대상 선택: dm(구독자별 개인 메시지), channel(채널/그룹에 한 번 게시), both
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from loguru import logger
+from telegram import InlineKeyboardMarkup
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter, TimedOut
+
+from src.bot.news_cards import NewsCard
+from src.database.outbox import Outbox, OutboxCard, OutboxMessage
+from src.utils.config import get_env_float, get_env_int, get_env_str
+
+
+# 알림 전달 방식
+DM = 'dm'              # 구독자마다 개인 메시지 (구독자 수만큼 API 호출)
+CHANNEL = 'channel'    # TELEGRAM_CHAT_ID 채널/그룹에 한 번 게시 (API 호출 1회)
+BOTH = 'both'          # 채널 게시 + 개인 메시지
+DELIVERY_MODES = (DM, CHANNEL, BOTH)
+
+# 전송 결과
+SENT = 'sent'      # 전송 완료
+RETRY = 'retry'    # 일시 오류 (나중에 다시 시도)
+FAILED = 'failed'  # 다시 시도해도 실패 (봇 차단, 없는 채팅 등)
+
+
+class TokenBucket:
+    """초당 rate개, 최대 capacity개까지 모아 둘 수 있는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds: float):
+        """seconds초 동안 토큰 발급 중지 (RetryAfter 대응)"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = self._paused_until  # 멈춘 동안은 토큰을 채우지 않음 (재개 직후 몰아서 보내지 않도록)
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class BroadcastEngine:
+    """텔레그램 전송 한도를 지키는 동시 전송기"""
+
+    def __init__(self, global_rate: float = 30, per_chat_interval: float = 1.0,
+                 concurrency: int = 16, max_retries: int = 3):
+        self.bucket = TokenBucket(global_rate)
+        self.per_chat_interval = per_chat_interval
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self._chat_last_sent: Dict[Any, float] = {}  # 채팅 ID -> 마지막 전송 시각
+
+    async def _wait_for_chat(self, chat_id: Any):
+        """같은 채팅에 보내는 간격 유지"""
+        last_sent = self._chat_last_sent.get(chat_id)
+        if last_sent is not None:
+            wait = last_sent + self.per_chat_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self._chat_last_sent[chat_id] = time.monotonic()
+
+    def forget_idle_chats(self):
+        """전송 간격이 지난 채팅 기록 정리 (구독자 수만큼 쌓이지 않도록)"""
+        cutoff = time.monotonic() - self.per_chat_interval
+        for chat_id in [c for c, sent_at in self._chat_last_sent.items() if sent_at < cutoff]:
+            del self._chat_last_sent[chat_id]
+
+    async def deliver(self, chat_id: Any, send: Callable[[Any], Awaitable[Any]]) -> str:
+        """한 채팅에 전송하고 결과(SENT, RETRY, FAILED) 반환 (한도 대기, RetryAfter/일시 오류 재시도 포함)"""
+        for attempt in range(self.max_retries + 1):
+            await self._wait_for_chat(chat_id)
+            await self.bucket.acquire()
+            try:
+                await send(chat_id)
+                return SENT
+            except RetryAfter as e:
+                # 전체 전송 한도 초과: 모든 전송을 멈추고 같은 채팅부터 다시 시도
+                logger.warning(f"텔레그램 전송 한도 초과, {e.retry_after}초 대기")
+                self.bucket.pause(e.retry_after)
+            except (Forbidden, BadRequest) as e:
+                # 봇 차단, 없는 채팅 등은 재시도해도 실패
+                logger.info(f"채팅 {chat_id} 전송 불가: {e}")
+                return FAILED
+            except (TimedOut, NetworkError) as e:
+                logger.debug(f"채팅 {chat_id} 전송 일시 오류 (시도 {attempt + 1}): {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(min(2 ** attempt, 10))
+            except Exception as e:
+                logger.error(f"채팅 {chat_id} 전송 오류: {e}")
+                return FAILED
+        return RETRY
+
+
+# 전역 전송 엔진 인스턴스
+broadcast_engine = None
+
+def get_broadcast_engine() -> BroadcastEngine:
+    """전송 엔진 조회 (최초 호출시 생성)"""
+    global broadcast_engine
+    if broadcast_engine is None:
+        broadcast_engine = BroadcastEngine(
+            global_rate=get_env_float("DELIVERY_GLOBAL_RATE", 30),
+            per_chat_interval=get_env_float("DELIVERY_PER_CHAT_INTERVAL", 1.0),
+            concurrency=get_env_int("DELIVERY_CONCURRENCY", 16),
+            max_retries=get_env_int("DELIVERY_MAX_RETRIES", 3)
+        )
+    return broadcast_engine
+
+
+class OutboxWorker:
+    """
+    발송 대기열 전송 워커
+    - 보낼 때가 된 메시지를 batch_size개씩 조회해 BroadcastEngine으로 동시 전송
+    - 메시지는 전송 요청 직전에 sending으로 표시 (비정상 종료시 unknown이 되는 메시지는 전송 중이던 것뿐)
+    - 일시 오류는 대기열의 지수 백오프로 재시도, 영구 오류는 failed로 기록
+    - 시작할 때 이전 실행에서 전송 중이던 메시지를 정리하고 남은 대기 메시지부터 이어서 전송
+    """
+
+    def __init__(self, bot, outbox: Outbox, engine: BroadcastEngine, batch_size: int = 200,
+                 idle_interval: float = 1.0, retention_seconds: float = 7 * 86400, progress_interval: float = 5.0):
+        self.bot = bot  # telegram.Bot
+        self.outbox = outbox
+        self.engine = engine
+        self.batch_size = batch_size
+        self.idle_interval = idle_interval  # 보낼 메시지가 없을 때 재확인 간격 (초)
+        self.retention_seconds = retention_seconds  # 처리가 끝난 메시지 보관 기간
+        self.progress_interval = progress_interval  # 진행 상황 로그 간격 (초)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._cards: Dict[str, Tuple[str, Optional[InlineKeyboardMarkup], Optional[str]]] = {}
+        self._last_purge = 0.0
+        self._drain: Optional[Dict[str, int]] = None  # 보낼 메시지가 없어질 때까지의 결과별 건수
+        self._drain_started = 0.0
+        self._last_progress = 0.0
+
+    async def start(self):
+        await asyncio.to_thread(self.outbox.recover)
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"발송 대기열 워커 시작: {self.outbox.path}")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def wake(self):
+        """새 메시지 등록 알림"""
+        self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                messages = await asyncio.to_thread(self.outbox.fetch_due, self.batch_size)
+                if messages:
+                    if self._drain is None:
+                        self._drain = {'sent': 0, 'retry': 0, 'failed': 0}
+                        self._drain_started = self._last_progress = time.monotonic()
+                    await self._process(messages)
+                    await self._report_progress()
+                    continue
+                if self._drain is not None:
+                    self._finish_drain()
+
+                if time.time() - self._last_purge >= 3600:
+                    self._last_purge = time.time()
+                    await asyncio.to_thread(self.outbox.purge, self.retention_seconds)
+
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.idle_interval)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"발송 대기열 처리 오류: {e}")
+                await asyncio.sleep(5)
+
+    async def _report_progress(self):
+        """progress_interval마다 진행 상황 로그"""
+        now = time.monotonic()
+        if now - self._last_progress < self.progress_interval:
+            return
+        self._last_progress = now
+        drain = self._drain
+        done = drain['sent'] + drain['failed']
+        remaining = await asyncio.to_thread(self.outbox.count_pending)
+        logger.info(f"📤 발송 진행: 전송 {drain['sent']:,}건, 실패 {drain['failed']:,}건 "
+                    f"({done / (now - self._drain_started):.1f}건/초), 남은 대기 {remaining:,}건")
+
+    def _finish_drain(self):
+        """보낼 때가 된 메시지를 모두 처리하면 결과 로그"""
+        drain, self._drain = self._drain, None
+        elapsed = time.monotonic() - self._drain_started
+        logger.info(f"📤 발송 완료: 전송 {drain['sent']:,}건, 재시도 예정 {drain['retry']:,}건, "
+                    f"실패 {drain['failed']:,}건, {elapsed:.1f}초")
+
+    async def _get_card(self, card_id: str):
+        card = self._cards.get(card_id)
+        if card is None:
+            stored = await asyncio.to_thread(self.outbox.get_card, card_id)
+            if stored is None:
+                return None
+            markup = InlineKeyboardMarkup.de_json(stored.reply_markup, self.bot) if stored.reply_markup else None
+            card = (stored.text, markup, stored.parse_mode)
+            self._cards[card_id] = card
+            if len(self._cards) > 32:
+                self._cards.pop(next(iter(self._cards)))
+        return card
+
+    async def _process(self, messages: List[OutboxMessage]):
+        sent: List[int] = []
+        retry: List[OutboxMessage] = []
+        failed: List[int] = []
+        started = set()  # sending으로 표시한 메시지
+        semaphore = asyncio.Semaphore(self.engine.concurrency)
+
+        async def deliver(message: OutboxMessage):
+            card = await self._get_card(message.card_id)
+            if card is None:
+                failed.append(message.id)
+                return
+            text, markup, parse_mode = card
+
+            async def send(chat_id):
+                if message.id not in started:
+                    started.add(message.id)
+                    await asyncio.to_thread(self.outbox.mark_sending, message.id)
+                await self.bot.send_message(chat_id=chat_id, text=text, reply_markup=markup, parse_mode=parse_mode)
+
+            async with semaphore:
+                result = await self.engine.deliver(message.chat_id, send)
+            if result == SENT:
+                sent.append(message.id)
+            elif result == RETRY:
+                retry.append(message)
+            else:
+                failed.append(message.id)
+
+        try:
+            await asyncio.gather(*(deliver(message) for message in messages))
+        finally:
+            # 취소되더라도 이미 끝난 메시지는 기록 (보내기 전인 메시지는 pending 그대로,
+            # 전송 요청 도중 취소된 메시지만 sending으로 남아 재시작시 unknown 처리)
+            await asyncio.to_thread(self.outbox.complete, sent, retry, failed, "전송 실패")
+            self.engine.forget_idle_chats()
+
+        if self._drain is not None:
+            self._drain['sent'] += len(sent)
+            self._drain['retry'] += len(retry)
+            self._drain['failed'] += len(failed)
+        logger.debug(f"발송 대기열 처리: 전송 {len(sent)}건, 재시도 예정 {len(retry)}건, 실패 {len(failed)}건")
+
+
+# 전역 발송 대기열/워커 인스턴스
+outbox = None
+outbox_worker = None
+
+def get_outbox() -> Outbox:
+    """발송 대기열 조회 (최초 호출시 생성)"""
+    global outbox
+    if outbox is None:
+        outbox = Outbox(
+            path=get_env_str("OUTBOX_PATH", "data/outbox.db"),
+            max_attempts=get_env_int("OUTBOX_MAX_ATTEMPTS", 5),
+            backoff_base=get_env_float("OUTBOX_BACKOFF_BASE", 2.0),
+            backoff_max=get_env_float("OUTBOX_BACKOFF_MAX", 300)
+        )
+    return outbox
+
+async def start_outbox_worker(bot) -> OutboxWorker:
+    """발송 대기열 워커 시작"""
+    global outbox_worker
+    outbox_worker = OutboxWorker(
+        bot, get_outbox(), get_broadcast_engine(),
+        batch_size=get_env_int("OUTBOX_BATCH_SIZE", 200),
+        retention_seconds=get_env_float("OUTBOX_RETENTION_DAYS", 7) * 86400
+    )
+    await outbox_worker.start()
+    return outbox_worker
+
+async def stop_outbox_worker():
+    """발송 대기열 워커 중지"""
+    global outbox_worker, outbox
+    if outbox_worker:
+        await outbox_worker.stop()
+        outbox_worker = None
+    if outbox:
+        outbox.close()
+        outbox = None
+
+def get_channel_id() -> Optional[Union[int, str]]:
+    """알림 채널/그룹 ID (TELEGRAM_CHAT_ID, 숫자 ID 또는 @채널명, 미설정시 None)"""
+    value = get_env_str("TELEGRAM_CHAT_ID", "")
+    if not value or value == "your_chat_id_here":
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value if value.startswith('@') else f"@{value}"
+
+# 알림 전달 방식 (설정은 최초 조회시 한 번만 확인)
+delivery_mode = None
+
+def get_delivery_mode() -> str:
+    """알림 전달 방식 (채널 방식인데 채널이 없으면 dm)"""
+    global delivery_mode
+    if delivery_mode is not None:
+        return delivery_mode
+
+    mode = get_env_str("DELIVERY_MODE", DM).lower()
+    if mode not in DELIVERY_MODES:
+        logger.warning(f"알 수 없는 DELIVERY_MODE '{mode}', dm 방식 사용")
+        mode = DM
+    elif mode != DM and get_channel_id() is None:
+        logger.warning(f"DELIVERY_MODE={mode}이지만 TELEGRAM_CHAT_ID가 없어 dm 방식 사용")
+        mode = DM
+    delivery_mode = mode
+    return delivery_mode
+
+def broadcast_targets(subscriber_ids: Iterable[int]) -> List[Union[int, str]]:
+    """
+    알림을 보낼 채팅 목록
+    채널 방식이면 구독자 수와 관계없이 채널 하나에만 게시 (개인 메시지는 개인화된 내용에만 사용)
+    """
+    mode = get_delivery_mode()
+    targets: List[Union[int, str]] = []
+    if mode in (CHANNEL, BOTH):
+        targets.append(get_channel_id())
+    if mode in (DM, BOTH):
+        targets.extend(subscriber_ids)
+    return targets
+
+async def enqueue_broadcast(broadcast_id: str, card: NewsCard, chat_ids: Iterable[Union[int, str]]) -> int:
+    """
+    알림을 발송 대기열에 등록하고 워커를 깨움 (새로 등록한 메시지 수 반환)
+    broadcast_id가 같으면 이미 등록된 채팅은 다시 등록하지 않음
+    """
+    stored = OutboxCard(card.text, card.reply_markup.to_dict() if card.reply_markup else None, card.parse_mode)
+    added = await asyncio.to_thread(get_outbox().enqueue, broadcast_id, stored, list(chat_ids))
+    if outbox_worker:
+        outbox_worker.wake()
+    return added
@@ -0,0 +1,119 @@
+"""
+뉴스 카드 렌더링
+/news 응답, 정기 알림, 긴급 알림의 메시지 텍스트와 인라인 버튼을 한 곳에서 생성
+- 같은 뉴스 목록/종류/표시 시각이면 한 번만 만들고 캐시 (일괄 전송시 채팅 ID만 달라짐)
+- 제목 등 외부 문자열은 Markdown 특수문자를 이스케이프해서 파싱 오류로 전송이 실패하지 않게 함
+"""
+
+import hashlib
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Tuple
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+from telegram.helpers import escape_markdown
+
+
+class NewsCard(NamedTuple):
+    """전송할 카드 (send_message/edit_message_text 인자)"""
+    text: str
+    reply_markup: InlineKeyboardMarkup
+    parse_mode: str = 'Markdown'
+
+
+# 카드 종류별 머리말/꼬리말/추가 버튼
+CARD_VARIANTS = {
+    'update': {
+        'header': "📰 주식 뉴스 업데이트 ({time})\n\n🔥 주요 뉴스 {count}건:\n\n",
+        'footer': "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.",
+        'actions': [("🔄 새로고침", "refresh"), ("⚙️ 설정", "settings")],
+    },
+    'scheduled': {
+        'header': "📰 주식 뉴스 알림 ({time})\n\n🔥 주요 뉴스 {count}건:\n\n",
+        'footer': "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.\n📲 정기 알림을 받고 계십니다.",
+        'actions': [("🔄 새로고침", "refresh"), ("⚙️ 알림설정", "notification_settings")],
+    },
+    'urgent': {
+        'header': "🚨 *긴급 뉴스 알림* ({time})\n\n📈 *새로운 주요 뉴스 {count}건 감지!*\n\n",
+        'footer': "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.\n🔍 새로운 뉴스가 감지되어 즉시 알림을 보내드렸습니다.",
+        'actions': [("🔄 새로고침", "refresh"), ("⚙️ 알림설정", "notification_settings")],
+    },
+    'subscription': {
+        'header': "📌 *구독 종목/키워드 뉴스* ({time})\n\n🔔 *새 기사 {count}건:*\n\n",
+        'footer': "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.\n📮 구독 현황: /status",
+        'actions': [("🔄 새로고침", "refresh")],
+    },
+}
+
+SENTIMENT_LABELS = {
+    'positive': ("📈", "긍정적"),
+    'negative': ("📉", "부정적"),
+    'neutral': ("📊", "중립"),
+}
+
+
+def escape(text: str) -> str:
+    """Markdown(v1) 특수문자 이스케이프"""
+    return escape_markdown(str(text), version=1)
+
+
+def news_set_key(news_list: List[Dict[str, Any]]) -> str:
+    """뉴스 목록 해시 (카드 내용에 영향을 주는 필드만 사용)"""
+    digest = hashlib.blake2b(digest_size=8)
+    for news in news_list:
+        for field in (news.get('article_id', ''), news.get('url', ''), news.get('title', ''),
+                      news.get('sentiment', ''), news.get('time', '')):
+            digest.update(str(field).encode())
+            digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+def _build_card(variant: str, news_list: List[Dict[str, Any]], time_label: str) -> NewsCard:
+    config = CARD_VARIANTS[variant]
+    parts = [config['header'].format(time=time_label, count=len(news_list))]
+    buttons = []
+
+    for i, news in enumerate(news_list, 1):
+        sentiment_icon, sentiment_text = SENTIMENT_LABELS.get(news.get('sentiment'), SENTIMENT_LABELS['neutral'])
+        parts.append(f"{i}️⃣ {escape(news['title'])}\n   {sentiment_icon} {sentiment_text} | ⏰ {escape(news['time'])}\n\n")
+        buttons.append([InlineKeyboardButton(f"{i}️⃣ 뉴스 보기", url=news["url"])])
+
+    buttons.append([InlineKeyboardButton(text, callback_data=data) for text, data in config['actions']])
+    parts.append(config['footer'])
+
+    return NewsCard(''.join(parts), InlineKeyboardMarkup(buttons))
+
+
+class NewsCardCache:
+    """렌더링한 카드 LRU 캐시 (종류, 뉴스 목록 해시, 표시 시각) -> 카드"""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self._cards: "OrderedDict[Tuple[str, str, str], NewsCard]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, variant: str, news_list: List[Dict[str, Any]], now: datetime = None) -> NewsCard:
+        """카드 조회 (없으면 생성)"""
+        time_label = (now or datetime.now()).strftime("%m월 %d일 %H:%M")
+        key = (variant, news_set_key(news_list), time_label)
+
+        card = self._cards.get(key)
+        if card is not None:
+            self._cards.move_to_end(key)
+            self.hits += 1
+            return card
+
+        self.misses += 1
+        card = _build_card(variant, news_list, time_label)
+        self._cards[key] = card
+        while len(self._cards) > self.capacity:
+            self._cards.popitem(last=False)
+        return card
+
+
+# 전역 카드 캐시
+card_cache = NewsCardCache()
+
+def render_card(variant: str, news_list: List[Dict[str, Any]], now: datetime = None) -> NewsCard:
+    """뉴스 카드 렌더링 (캐시 사용)"""
+    return card_cache.render(variant, news_list, now)
@@ -1,7 +1,7 @@
 import os
 from datetime import datetime, time
 from typing import List, Dict, Any
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+from telegram import Update
 from telegram.ext import (
     Application, 
     CommandHandler, 
@@ -13,6 +13,8 @@ from telegram.ext import (
 from loguru import logger
 from dotenv import load_dotenv
 
+from src.bot.news_cards import render_card
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -43,6 +45,9 @@ class StockNewsBot:
         self.news_monitor = None
         self._init_news_monitor()
         
+        # 공유 HTTP 커넥션 풀 (post_init에서 생성)
+        self.http_session = None
+        
         # 핸들러 설정
         self._setup_handlers()
         
@@ -65,17 +70,46 @@ class StockNewsBot:
         """뉴스 모니터 초기화"""
         try:
             from src.utils.news_monitor import init_news_monitor
-            self.news_monitor = init_news_monitor(self, check_interval=300)  # 5분마다 체크
+            self.news_monitor = init_news_monitor(self)  # 체크 간격은 장 운영 시간/새 뉴스 도착률에 따라 자동 조정
             logger.info("뉴스 모니터 초기화 완료")
         except Exception as e:
             logger.error(f"뉴스 모니터 초기화 실패: {e}")
 
     async def _post_init(self, app):
         """봇 초기화 후 실행"""
+        try:
+            from src.crawler.news_crawler import init_http_session
+            self.http_session = await init_http_session()
+        except Exception as e:
+            logger.error(f"HTTP 커넥션 풀 생성 실패: {e}")
+        
+        try:
+            from src.database.subscriber_store import get_subscriber_store
+            from src.utils.subscriptions import get_subscription_index
+            store = get_subscriber_store()
+            if self.scheduler:
+                await self.scheduler.load_subscribers(store)
+            await get_subscription_index().load(store)
+            store.start()
+        except Exception as e:
+            logger.error(f"구독자 저장소 불러오기 실패 (이번 실행의 구독 변경은 저장되지 않음): {e}")
+        
         if self.scheduler:
             await self.scheduler.start()
             logger.info("뉴스 스케줄러 시작됨")
         
+        try:
+            from src.bot.delivery import start_outbox_worker
+            await start_outbox_worker(self.app.bot)
+        except Exception as e:
+            logger.error(f"발송 대기열 워커 시작 실패: {e}")
+        
+        from src.utils.news_metrics import get_news_metrics
+        get_news_metrics().start()
+        
+        from src.utils.subscriptions import get_subscription_notifier
+        get_subscription_notifier().start()
+        
         if self.news_monitor:
             await self.news_monitor.start_monitoring()
             logger.info("뉴스 모니터링 시작됨")
@@ -89,6 +123,23 @@ class StockNewsBot:
         if self.scheduler:
             await self.scheduler.stop()
             logger.info("뉴스 스케줄러 정지됨")
+        
+        from src.utils.news_bus import get_news_bus
+        await get_news_bus().close()
+        
+        from src.database.subscriber_store import stop_subscriber_store
+        await stop_subscriber_store()
+        
+        from src.bot.delivery import stop_outbox_worker
+        await stop_outbox_worker()
+        
+        if self.http_session:
+            from src.crawler.news_crawler import close_http_session
+            await close_http_session()
+            self.http_session = None
+        
+        from src.crawler.parse_pool import shutdown_parse_pool
+        shutdown_parse_pool()
 
     def _setup_handlers(self):
         """명령어 핸들러 설정"""
@@ -126,13 +177,14 @@ class StockNewsBot:
 
 **주요 기능:**
 • `/news` - 최신 주식 뉴스 5건 보기
-• `/subscribe [종목코드]` - 특정 종목 구독
-• `/unsubscribe [종목코드]` - 구독 해제
+• `/subscribe [종목코드/키워드]` - 종목 또는 키워드 구독
+• `/unsubscribe [종목코드/키워드]` - 구독 해제
 • `/status` - 내 구독 현황 확인
 • `/help` - 도움말 보기
 
 **사용 예시:**
 • `/subscribe 005930` - 삼성전자 구독
+• `/subscribe 반도체` - '반도체' 키워드 구독
 • `/news` - 최신 뉴스 받기
 
 시작하려면 `/news` 명령어를 입력하세요! 📰
@@ -158,6 +210,7 @@ class StockNewsBot:
 🔸 `/notify_off` - 정기 알림 비활성화  
 🔸 `/notifications` - 알림 현황 확인
 🔸 `/schedule` - 알림 시간표 확인
+🔸 `/schedule 08:30 12:00` - 내 알림 시간 직접 설정
 
 🚨 **스마트 이벤트 알림:**
 🔸 `/monitor_on` - 새 뉴스 감지 알림 활성화
@@ -166,8 +219,8 @@ class StockNewsBot:
 🔸 `/set_threshold 3` - 알림 임계값 설정
 
 📮 **구독 관리:**
-🔸 `/subscribe [종목코드]` - 특정 종목 뉴스 구독
-🔸 `/unsubscribe [종목코드]` - 구독 해제
+🔸 `/subscribe [종목코드/키워드]` - 종목/키워드 뉴스 구독 (새 기사가 나오면 개인 메시지로 알림)
+🔸 `/unsubscribe [종목코드/키워드]` - 구독 해제
 🔸 `/status` - 현재 구독 상태 확인
 🔸 `/help` - 이 도움말 보기
 
@@ -181,7 +234,7 @@ class StockNewsBot:
 • 오전 9:00 ~ 오후 6:00 (30분마다)
 
 🚨 **스마트 이벤트 알림:**
-• 5분마다 새로운 뉴스 자동 감지
+• 장 운영 시간과 뉴스 흐름에 맞춰 새로운 뉴스 자동 감지 (장중 최소 30초 간격)
 • 설정한 개수 이상 새 뉴스 쌓이면 즉시 알림
 • 스팸 방지를 위한 최소 10분 간격 제한
 
@@ -213,63 +266,87 @@ class StockNewsBot:
             await update.message.reply_text("뉴스를 가져오는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
 
     async def subscribe_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """종목 구독 명령어"""
+        """종목/키워드 구독 명령어"""
         if not context.args:
             await update.message.reply_text(
-                "종목코드를 입력해주세요.\n예: `/subscribe 005930`",
+                "종목코드 또는 키워드를 입력해주세요.\n예: `/subscribe 005930`, `/subscribe 반도체`",
                 parse_mode='Markdown'
             )
             return
         
-        stock_code = context.args[0]
+        from src.bot.news_cards import escape
+        from src.utils.subscriptions import get_subscription_index, parse_subscription, subscription_label
+        index = get_subscription_index()
         user_id = update.effective_user.id
         
-        # TODO: 데이터베이스에 구독 정보 저장
+        added, skipped = [], []
+        for arg in context.args:
+            subscription = parse_subscription(arg)
+            if subscription and index.add(user_id, subscription):
+                added.append(subscription_label(subscription))
+            else:
+                skipped.append(arg)
+        saved = await index.sync()  # 저장된 뒤에 응답
         
-        await update.message.reply_text(
-            f"✅ **{stock_code}** 종목 구독이 완료되었습니다!\n"
-            f"해당 종목의 뉴스를 실시간으로 받아보실 수 있습니다.",
-            parse_mode='Markdown'
-        )
+        if added:
+            message = (f"✅ **{escape(', '.join(added))}** 구독이 완료되었습니다!\n"
+                       f"새 기사가 나오면 개인 메시지로 알려드립니다.")
+        else:
+            message = "구독할 항목이 없습니다."
+        if skipped:
+            message += (f"\n\n⚠️ 추가하지 못한 항목: {escape(', '.join(skipped))}\n"
+                        f"(이미 구독 중, 한 글자 키워드, 또는 최대 {index.max_per_user}개 초과)")
         
-        logger.info(f"사용자 {user_id} - 종목 {stock_code} 구독")
+        await update.message.reply_text(message, parse_mode='Markdown')
+        await self._warn_if_unsaved(update, saved)
+        
+        logger.info(f"사용자 {user_id} - {added} 구독")
 
     async def unsubscribe_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """구독 해제 명령어"""
         if not context.args:
             await update.message.reply_text(
-                "종목코드를 입력해주세요.\n예: `/unsubscribe 005930`",
+                "종목코드 또는 키워드를 입력해주세요.\n예: `/unsubscribe 005930`",
                 parse_mode='Markdown'
             )
             return
         
-        stock_code = context.args[0]
+        from src.bot.news_cards import escape
+        from src.utils.subscriptions import get_subscription_index, parse_subscription, subscription_label
+        index = get_subscription_index()
         user_id = update.effective_user.id
         
-        # TODO: 데이터베이스에서 구독 정보 삭제
+        removed = []
+        for arg in context.args:
+            subscription = parse_subscription(arg)
+            if subscription and index.remove(user_id, subscription):
+                removed.append(subscription_label(subscription))
+        saved = await index.sync()
         
-        await update.message.reply_text(
-            f"❌ **{stock_code}** 종목 구독이 해제되었습니다.",
-            parse_mode='Markdown'
-        )
+        if removed:
+            message = f"❌ **{escape(', '.join(removed))}** 구독이 해제되었습니다."
+        else:
+            message = "구독 중인 항목이 아닙니다. `/status`로 구독 현황을 확인하세요."
         
-        logger.info(f"사용자 {user_id} - 종목 {stock_code} 구독 해제")
+        await update.message.reply_text(message, parse_mode='Markdown')
+        await self._warn_if_unsaved(update, saved)
+        
+        logger.info(f"사용자 {user_id} - {removed} 구독 해제")
 
     async def status_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """구독 상태 확인"""
+        from src.bot.news_cards import escape
+        from src.utils.subscriptions import get_subscription_index, subscription_label
         user_id = update.effective_user.id
+        subscriptions = get_subscription_index().get_user_subscriptions(user_id)
         
-        # TODO: 데이터베이스에서 구독 정보 조회
-        # 임시 데이터
-        subscribed_stocks = ["005930", "000660", "035420"]
-        
-        if not subscribed_stocks:
-            status_message = "현재 구독 중인 종목이 없습니다.\n`/subscribe [종목코드]`로 구독을 시작하세요!"
+        if not subscriptions:
+            status_message = "현재 구독 중인 종목/키워드가 없습니다.\n`/subscribe [종목코드/키워드]`로 구독을 시작하세요!"
         else:
-            status_message = f"📊 **구독 현황** ({len(subscribed_stocks)}개)\n\n"
-            for stock in subscribed_stocks:
-                status_message += f"• {stock}\n"
-            status_message += "\n구독 해제: `/unsubscribe [종목코드]`"
+            status_message = f"📊 **구독 현황** ({len(subscriptions)}개)\n\n"
+            for subscription in subscriptions:
+                status_message += f"• {escape(subscription_label(subscription))}\n"
+            status_message += "\n구독 해제: `/unsubscribe [종목코드/키워드]`"
         
         await update.message.reply_text(status_message, parse_mode='Markdown')
         
@@ -312,8 +389,9 @@ class StockNewsBot:
         user_id = update.effective_user.id
         
         if self.scheduler:
-            # 기본 알림 시간으로 구독자 추가
-            self.scheduler.add_subscriber(user_id)
+            # 처음이면 기본 알림 시간으로 구독자 추가 (직접 정한 알림 시간은 유지)
+            self.scheduler.enable_subscriber(user_id)
+            saved = await self.scheduler.sync()  # 저장된 뒤에 응답
             
             await update.message.reply_text(
                 "🔔 **30분 간격 알림이 활성화되었습니다!**\n\n"
@@ -326,6 +404,7 @@ class StockNewsBot:
                 "• `/notifications` - 알림 현황 확인",
                 parse_mode='Markdown'
             )
+            await self._warn_if_unsaved(update, saved)
             
             logger.info(f"사용자 {user_id} 알림 활성화")
         else:
@@ -340,6 +419,7 @@ class StockNewsBot:
             
             if subscriber_info:
                 self.scheduler.toggle_subscriber(user_id, False)
+                saved = await self.scheduler.sync()
                 
                 await update.message.reply_text(
                     "🔕 **알림이 비활성화되었습니다.**\n\n"
@@ -348,6 +428,7 @@ class StockNewsBot:
                     "• `/news` - 수동으로 뉴스 확인",
                     parse_mode='Markdown'
                 )
+                await self._warn_if_unsaved(update, saved)
                 
                 logger.info(f"사용자 {user_id} 알림 비활성화")
             else:
@@ -360,7 +441,11 @@ class StockNewsBot:
             await update.message.reply_text("⚠️ 알림 시스템이 현재 비활성화되어 있습니다.")
 
     async def schedule_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """알림 스케줄 확인"""
+        """알림 스케줄 확인 (인자로 알림 시간을 주면 개인 알림 시간 설정)"""
+        if context.args:
+            await self._set_notification_times(update, context.args)
+            return
+        
         message = "⏰ **뉴스 알림 스케줄**\n\n"
         message += "📅 **30분 간격 알림 시간:**\n"
         message += "• 🌅 오전 09:00, 09:30\n"
@@ -373,14 +458,77 @@ class StockNewsBot:
         message += "• 🌆 오후 16:00, 16:30\n"
         message += "• 🌆 오후 17:00, 17:30\n"
         message += "• 🌃 오후 18:00\n\n"
+        
+        # 장 운영 달력 기준 다음 알림 시각 (주말/KRX 휴장일 반영)
+        record = self.scheduler.subscribers.get(update.effective_user.id) if self.scheduler else None
+        if record and record.enabled:
+            from src.utils.market_calendar import holiday_name
+            weekdays = "월화수목금토일"
+            message += "🗓️ **내 다음 알림:**\n"
+            for moment in self.scheduler.next_fire_times(5, schedule=record.schedule):
+                holiday = holiday_name(moment)
+                suffix = f" ({holiday})" if holiday else ""
+                message += f"• {moment.strftime('%m/%d')}({weekdays[moment.weekday()]}) {moment.strftime('%H:%M')}{suffix}\n"
+            message += "\n"
+        
         message += "💡 **알림 관리:**\n"
         message += "• `/notify_on` - 알림 활성화\n"
         message += "• `/notify_off` - 알림 비활성화\n"
-        message += "• `/notifications` - 내 알림 현황\n\n"
-        message += "📱 **총 19회** 알림이 활성화되면 매일 30분마다 최신 주식 뉴스를 자동으로 받아보실 수 있습니다."
+        message += "• `/notifications` - 내 알림 현황\n"
+        message += "• `/schedule 08:30 12:00 15:40` - 원하는 시간으로 변경\n"
+        message += "• `/schedule default` - 기본 시간으로 되돌리기\n\n"
+        message += "📱 **총 19회** 알림이 활성화되면 거래일마다 30분 간격으로 최신 주식 뉴스를 자동으로 받아보실 수 있습니다.\n"
+        message += "🏖️ 주말과 증시 휴장일에는 정기 알림을 보내지 않거나 줄여서 보냅니다."
         
         await update.message.reply_text(message, parse_mode='Markdown')
 
+    async def _set_notification_times(self, update: Update, args: List[str]):
+        """개인 알림 시간 설정 (/schedule HH:MM ... 또는 /schedule default)"""
+        if not self.scheduler:
+            await update.message.reply_text("⚠️ 알림 시스템이 현재 비활성화되어 있습니다.")
+            return
+        
+        from src.utils.scheduler import parse_notification_time
+        user_id = update.effective_user.id
+        
+        if args[0].lower() == 'default':
+            times = list(self.scheduler.default_times)
+        else:
+            times = [parse_notification_time(arg) for arg in args]
+            if None in times:
+                await update.message.reply_text(
+                    "시간은 `HH:MM` 형식으로 입력해주세요.\n예: `/schedule 08:30 12:00 15:40`",
+                    parse_mode='Markdown'
+                )
+                return
+            times = sorted(set(times))
+        
+        if self.scheduler.get_subscriber_info(user_id):
+            self.scheduler.update_subscriber_times(user_id, times)
+            self.scheduler.toggle_subscriber(user_id, True)
+        else:
+            self.scheduler.add_subscriber(user_id, times)
+        saved = await self.scheduler.sync()
+        
+        await update.message.reply_text(
+            f"⏰ **알림 시간이 설정되었습니다!** (총 {len(times)}회/일)\n\n"
+            f"• {', '.join(t.strftime('%H:%M') for t in times)}\n\n"
+            "• `/notifications` - 알림 현황 확인\n"
+            "• `/notify_off` - 알림 비활성화",
+            parse_mode='Markdown'
+        )
+        await self._warn_if_unsaved(update, saved)
+        
+        logger.info(f"사용자 {user_id} 알림 시간 설정: {len(times)}개")
+
+    async def _warn_if_unsaved(self, update: Update, saved: bool):
+        """구독 변경 저장이 늦어지면 안내 (변경은 이미 적용됐고 저장은 계속 재시도)"""
+        if not saved:
+            await update.message.reply_text(
+                "⚠️ 변경 내용을 아직 저장하지 못했습니다.\n"
+                "지금은 적용되어 있지만 봇이 재시작되면 사라질 수 있으니 잠시 후 다시 확인해주세요."
+            )
+
     async def button_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """인라인 버튼 클릭 처리"""
         query = update.callback_query
@@ -490,48 +638,19 @@ class StockNewsBot:
 
     async def _send_news_card(self, update: Update, news_list: List[Dict[str, Any]], edit_message: bool = False):
         """뉴스 카드 전송"""
-        current_time = datetime.now().strftime("%m월 %d일 %H:%M")
-        
-        # 메시지 텍스트 생성
-        message_text = f"📰 주식 뉴스 업데이트 ({current_time})\n\n🔥 주요 뉴스 {len(news_list)}건:\n\n"
-        
-        # 인라인 버튼 생성
-        buttons = []
-        
-        for i, news in enumerate(news_list, 1):
-            # 감정 분석 아이콘
-            sentiment_icon = "📈" if news["sentiment"] == "positive" else "📉" if news["sentiment"] == "negative" else "📊"
-            sentiment_text = "긍정적" if news["sentiment"] == "positive" else "부정적" if news["sentiment"] == "negative" else "중립"
-            
-            # 메시지 텍스트에 뉴스 추가
-            message_text += f"{i}️⃣ {news['title']}\n   {sentiment_icon} {sentiment_text} | ⏰ {news['time']}\n\n"
-            
-            # 각 뉴스별 버튼 생성
-            button_text = f"{i}️⃣ 뉴스 보기"
-            buttons.append([InlineKeyboardButton(button_text, url=news["url"])])
-        
-        # 추가 액션 버튼
-        action_buttons = [
-            InlineKeyboardButton("🔄 새로고침", callback_data="refresh"),
-            InlineKeyboardButton("⚙️ 설정", callback_data="settings")
-        ]
-        buttons.append(action_buttons)
-        
-        message_text += "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다."
-        
-        keyboard = InlineKeyboardMarkup(buttons)
+        card = render_card('update', news_list)
         
         if edit_message and update.callback_query:
             await update.callback_query.edit_message_text(
-                text=message_text,
-                reply_markup=keyboard,
-                parse_mode='Markdown'
+                text=card.text,
+                reply_markup=card.reply_markup,
+                parse_mode=card.parse_mode
             )
         else:
             await update.message.reply_text(
-                text=message_text,
-                reply_markup=keyboard,
-                parse_mode='Markdown'
+                text=card.text,
+                reply_markup=card.reply_markup,
+                parse_mode=card.parse_mode
             )
 
     async def monitor_on_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -544,14 +663,15 @@ class StockNewsBot:
                 return
             
             # 구독자 목록에 추가 (스케줄러 시스템 재활용)
+            saved = True
             if self.scheduler:
-                self.scheduler.add_subscriber(user_id)
-                self.scheduler.toggle_subscriber(user_id, True)
+                self.scheduler.enable_subscriber(user_id)
+                saved = await self.scheduler.sync()
             
             await update.message.reply_text(
                 "🔍 **스마트 뉴스 모니터링 활성화!**\n\n"
                 "✨ **작동 방식:**\n"
-                "• 5분마다 새로운 뉴스 자동 감지\n"
+                "• 장 운영 시간과 뉴스 흐름에 맞춰 새로운 뉴스 자동 감지 (장중 최소 30초 간격)\n"
                 "• 새 뉴스 3개 이상 쌓이면 즉시 알림\n"
                 "• 최소 10분 간격으로 알림 전송\n\n"
                 "🚨 **긴급 뉴스 알림**이 설정되었습니다!\n\n"
@@ -560,6 +680,7 @@ class StockNewsBot:
                 "• `/set_threshold 5` - 알림 임계값 변경 (기본 3개)",
                 parse_mode='Markdown'
             )
+            await self._warn_if_unsaved(update, saved)
             
             logger.info(f"사용자 {user_id} 뉴스 모니터링 활성화")
             
@@ -572,8 +693,10 @@ class StockNewsBot:
         user_id = update.effective_user.id
         
         try:
+            saved = True
             if self.scheduler:
                 self.scheduler.toggle_subscriber(user_id, False)
+                saved = await self.scheduler.sync()
             
             await update.message.reply_text(
                 "🔕 **스마트 뉴스 모니터링 비활성화**\n\n"
@@ -584,6 +707,7 @@ class StockNewsBot:
                 "• `/monitor_on` - 다시 스마트 모니터링 시작",
                 parse_mode='Markdown'
             )
+            await self._warn_if_unsaved(update, saved)
             
             logger.info(f"사용자 {user_id} 뉴스 모니터링 비활성화")
             
@@ -612,7 +736,8 @@ class StockNewsBot:
             # 전체 시스템 상태
             system_status = "🟢 실행 중" if status["is_running"] else "🔴 정지됨"
             message += f"• 시스템 상태: {system_status}\n"
-            message += f"• 체크 간격: {status['check_interval']}초 (5분)\n"
+            session_names = {'pre_market': '장 시작 전', 'regular': '정규장', 'after_hours': '장 마감 후', 'closed': '휴장'}
+            message += f"• 체크 간격: {status['check_interval']:.0f}초 ({session_names.get(status['market_session'], '-')}, 수집당 새 뉴스 {status['arrival_rate']:.1f}건)\n"
             message += f"• 알림 임계값: {status['min_news_threshold']}개 뉴스\n"
             message += f"• 추적 중인 뉴스: {status['known_news_count']}건\n"
             message += f"• 새 뉴스 버퍼: {status['new_news_buffer_count']}건\n"
@@ -622,6 +747,29 @@ class StockNewsBot:
             else:
                 message += "• 마지막 알림: 없음\n"
             
+            # 뉴스 캐시 효율
+            from src.crawler.news_crawler import get_news_cache
+            cache_stats = get_news_cache().get_stats()
+            message += f"• 뉴스 캐시: 적중률 {cache_stats['hit_rate'] * 100:.0f}% (크롤링 {cache_stats['crawls']}회, {cache_stats['crawls_saved']}회 절약)\n"
+            
+            if self.scheduler:
+                prewarm = self.scheduler.get_prewarm_stats()
+                if prewarm['last_lead'] is not None:
+                    message += (f"• 정기 알림 미리 수집: 알림 {prewarm['last_lead']:.0f}초 전 준비 "
+                                f"(평균 {prewarm['avg_lead']:.0f}초, 사용 {prewarm['hits']}회/미사용 {prewarm['misses']}회)\n")
+            
+            # 뉴스 버스 전달 현황
+            from src.utils.news_bus import get_news_bus
+            from src.utils.news_metrics import get_news_metrics
+            bus_stats = get_news_bus().get_stats()
+            metrics = get_news_metrics().get_stats()
+            dropped = sum(sub['dropped'] for sub in bus_stats['subscribers'].values())
+            message += f"• 뉴스 버스: 발행 {bus_stats['published']}회, 새 기사 {metrics['new_articles']}건, 구독자 {len(bus_stats['subscribers'])}개 (버림 {dropped}회)\n"
+            
+            from src.utils.subscriptions import get_subscription_index
+            subscription_stats = get_subscription_index().get_stats()
+            message += f"• 종목/키워드 구독: 사용자 {subscription_stats['users']}명, 구독 {subscription_stats['subscriptions']}건 (검색어 {subscription_stats['terms']}개)\n"
+            
             message += "\n"
             
             # 개인 구독 상태
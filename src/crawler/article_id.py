@@ -0,0 +1,137 @@
+"""
+기사 식별자
+링크를 정규화해 크롤링 시각과 무관한 고정 기사 ID를 만들고, 목록 페이지에서 실제 발행 시각을 추출
+- 네이버 뉴스: naver:{oid}:{aid} (finance.naver.com news_read 링크와 news.naver.com 링크가 같은 ID)
+- 다음 뉴스: daum:{기사번호}
+- 그 외: url:{정규화한 URL 해시}
+"""
+
+import hashlib
+import re
+import time
+import urllib.parse as urlparse
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Optional
+
+from src.utils.market_calendar import KST
+
+
+# 추적용이라 같은 기사에서도 달라지는 쿼리 파라미터
+IGNORED_PARAMS = {'mode', 'mid', 'sid1', 'sid2', 'page', 'type', 'section_id', 'utm_source',
+                  'utm_medium', 'utm_campaign', 'utm_content', 'utm_term', 'ref', 'from'}
+
+NAVER_PATH_PATTERN = re.compile(r'/(?:mnews/)?article/(?:\d+/)?(\d{3})/(\d{10})')
+DAUM_PATH_PATTERN = re.compile(r'/v/(\d{14,})')
+
+# 목록 페이지의 발행 시각 표기 (2024.01.15 09:30, 2024-01-15 09:30:12, 3분 전, 1시간 전)
+ABSOLUTE_TIME_PATTERN = re.compile(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})\.?\s+(\d{1,2}):(\d{2})')
+RELATIVE_TIME_PATTERN = re.compile(r'(\d+)\s*(분|시간)\s*전')
+TIME_SEARCH_WINDOW = 600  # 링크 뒤에서 발행 시각을 찾을 범위 (문자 수)
+
+
+def canonical_article_id(url: str) -> str:
+    """링크의 고정 기사 ID (링크 형태가 달라도 같은 기사면 같은 ID)"""
+    parsed = urlparse.urlsplit(url.strip())
+    host = parsed.netloc.lower()
+    params = urlparse.parse_qs(parsed.query)
+
+    if 'naver.com' in host:
+        oid = params.get('oid') or params.get('office_id')
+        aid = params.get('aid') or params.get('article_id')
+        if oid and aid:
+            return f"naver:{oid[0]}:{aid[0]}"
+        match = NAVER_PATH_PATTERN.search(parsed.path)
+        if match:
+            return f"naver:{match.group(1)}:{match.group(2)}"
+
+    if 'daum.net' in host:
+        match = DAUM_PATH_PATTERN.search(parsed.path)
+        if match:
+            return f"daum:{match.group(1)}"
+
+    # 호스트 소문자화, www/모바일 접두사와 추적 파라미터/프래그먼트 제거, 파라미터 정렬
+    host = re.sub(r'^(?:www|m|mobile)\.', '', host)
+    query = urlparse.urlencode(sorted(
+        (key, value) for key, values in params.items() if key.lower() not in IGNORED_PARAMS for value in values
+    ))
+    normalized = f"{host}{parsed.path.rstrip('/')}?{query}"
+    return f"url:{hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()}"
+
+
+def article_key(article_id: str) -> int:
+    """기사 ID의 64비트 정수 키 (인덱스 저장용)"""
+    return int.from_bytes(hashlib.blake2b(article_id.encode(), digest_size=8).digest(), 'big')
+
+
+def parse_publish_time(text: str, now: datetime) -> Optional[datetime]:
+    """
+    텍스트에서 발행 시각 추출 (한국 시각, 없으면 None)
+    목록 페이지는 한국 시각으로 표기하므로 서버 시간대와 관계없이 KST로 해석
+    """
+    match = ABSOLUTE_TIME_PATTERN.search(text)
+    if match:
+        try:
+            return datetime(*(int(part) for part in match.groups()), tzinfo=KST)
+        except ValueError:
+            return None
+
+    match = RELATIVE_TIME_PATTERN.search(text)
+    if match:
+        amount = int(match.group(1))
+        delta = timedelta(minutes=amount) if match.group(2) == '분' else timedelta(hours=amount)
+        return (now.astimezone(KST) - delta).replace(second=0, microsecond=0)
+
+    return None
+
+
+def find_publish_time(html: str, href: str, now: datetime) -> Optional[datetime]:
+    """목록 페이지에서 링크 바로 뒤에 표시된 발행 시각 추출"""
+    position = html.find(href)
+    if position < 0:
+        position = html.find(href.replace('&', '&amp;'))
+    if position < 0:
+        return None
+
+    window = html[position:position + TIME_SEARCH_WINDOW]
+    # 다음 기사 링크부터는 다른 기사의 시각이므로 제외
+    next_link = window.find('<a ', len(href))
+    if next_link > 0:
+        window = window[:next_link]
+    return parse_publish_time(re.sub(r'<[^>]+>', ' ', window), now)
+
+
+class ArticleIndex:
+    """
+    기사 키 -> 처음 본 시각 인덱스
+    - 키는 64비트 정수, 시각은 초 단위 정수로 저장
+    - capacity를 넘으면 가장 오래전에 추가된 기사부터 제거
+    """
+
+    def __init__(self, capacity: int = 50000):
+        self.capacity = capacity
+        self._first_seen: "OrderedDict[int, int]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._first_seen)
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._first_seen
+
+    def add(self, key: int, seen_at: float = None) -> bool:
+        """기사 추가 (새 기사면 True)"""
+        if key in self._first_seen:
+            return False
+        self._first_seen[key] = int(time.time() if seen_at is None else seen_at)
+        while len(self._first_seen) > self.capacity:
+            self._first_seen.popitem(last=False)
+        return True
+
+    def first_seen(self, key: int, seen_at: float = None) -> int:
+        """처음 본 시각 (처음 보는 기사면 seen_at으로 기록)"""
+        self.add(key, seen_at)
+        return self._first_seen[key]
+
+
+# 전역 기사 인덱스 (발행 시각을 모르는 기사의 최초 수집 시각 기록)
+article_index = ArticleIndex()
@@ -0,0 +1,147 @@
+"""
+유사 중복 뉴스 감지
+문자 n-gram MinHash와 LSH 밴드 인덱스로 표현만 조금 다른 같은 기사를 걸러냄
+"""
+
+import hashlib
+import re
+import time
+from array import array
+from collections import deque
+from typing import Dict, Hashable, List, Optional
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (공백/문장부호 제거, 소문자)"""
+    return re.sub(r'[^\w]', '', title).lower()
+
+
+class MinHasher:
+    """
+    제목을 문자 n-gram 집합으로 보고 MinHash 서명 계산
+    n-gram마다 SHAKE-128 한 번으로 num_perm개의 독립 32비트 해시를 만들고 자리별 최솟값을 취함
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 2):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self._digest_size = num_perm * 4
+
+    def _shingles(self, title: str) -> set:
+        text = normalize_title(title)
+        size = self.shingle_size
+        if len(text) <= size:
+            return {text}
+        return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+    def signature(self, title: str) -> array:
+        """MinHash 서명 (num_perm개의 32비트 값)"""
+        rows = [
+            array('I', hashlib.shake_128(shingle.encode()).digest(self._digest_size))
+            for shingle in self._shingles(title)
+        ]
+        return array('I', map(min, zip(*rows)))
+
+    def similarity(self, left: array, right: array) -> float:
+        """두 서명으로 추정한 자카드 유사도"""
+        return sum(map(int.__eq__, left, right)) / self.num_perm
+
+
+class NearDuplicateIndex:
+    """
+    최근 기사 MinHash-LSH 슬라이딩 윈도우 인덱스
+    - threshold: 중복으로 볼 최소 자카드 유사도 (문자 2-gram 기준, 기본 0.6)
+    - 서명을 bands개 밴드로 나눠 한 밴드라도 같은 기사만 후보로 보고, 후보는 서명으로 유사도 검증
+      (64개 해시, 16밴드 x 4행: 유사도 0.6인 쌍이 후보가 될 확률 약 0.89, 0.3이면 약 0.12)
+    - window_size개 또는 window_seconds초가 지난 기사는 인덱스에서 제거
+    """
+
+    def __init__(self, threshold: float = 0.6, window_size: int = 10000,
+                 window_seconds: float = 86400, num_perm: int = 64, bands: int = 16,
+                 shingle_size: int = 2):
+        self.threshold = threshold
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        self._signatures: Dict[Hashable, array] = {}  # 키 -> 서명
+        self._added_at: Dict[Hashable, float] = {}  # 키 -> 추가 시각
+        self._buckets: List[Dict[int, List[Hashable]]] = [{} for _ in range(bands)]  # 밴드별 밴드 해시 -> 키
+        self._window: deque = deque()  # (추가 시각, 키)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
+
+    def _band_hashes(self, signature: array) -> List[int]:
+        rows = self.rows
+        return [hash(tuple(signature[band * rows:(band + 1) * rows])) for band in range(self.bands)]
+
+    def _expire(self, now: float):
+        """윈도우를 벗어난 기사 제거"""
+        while self._window and (len(self._signatures) > self.window_size
+                                or now - self._window[0][0] > self.window_seconds):
+            added_at, key = self._window.popleft()
+            if self._added_at.get(key) == added_at:  # 다시 추가된 키의 이전 항목은 무시
+                self._remove(key)
+
+    def _remove(self, key: Hashable):
+        signature = self._signatures.pop(key, None)
+        self._added_at.pop(key, None)
+        if signature is None:
+            return
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(signature)):
+            bucket = buckets.get(band_hash)
+            if bucket is not None:
+                bucket.remove(key)
+                if not bucket:
+                    del buckets[band_hash]
+
+    def signature(self, title: str) -> array:
+        return self.hasher.signature(title)
+
+    def find(self, title: str = None, signature: array = None) -> Optional[Hashable]:
+        """유사한 기사가 있으면 그 키 반환"""
+        if signature is None:
+            signature = self.hasher.signature(title)
+
+        checked = set()
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(signature)):
+            for key in buckets.get(band_hash, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if self.hasher.similarity(self._signatures[key], signature) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: Hashable, title: str = None, signature: array = None,
+            timestamp: float = None) -> array:
+        """기사 추가 (같은 키가 있으면 교체)"""
+        if signature is None:
+            signature = self.hasher.signature(title)
+        now = time.time() if timestamp is None else timestamp
+
+        if key in self._signatures:
+            self._remove(key)
+        self._signatures[key] = signature
+        self._added_at[key] = now
+        for buckets, band_hash in zip(self._buckets, self._band_hashes(signature)):
+            buckets.setdefault(band_hash, []).append(key)
+        self._window.append((now, key))
+
+        self._expire(now)
+        return signature
+
+    def check_and_add(self, key: Hashable, title: str, timestamp: float = None) -> Optional[Hashable]:
+        """유사 기사가 있으면 그 키를 반환하고, 없으면 새로 추가 후 None 반환"""
+        signature = self.hasher.signature(title)
+        duplicate = self.find(signature=signature)
+        if duplicate is None:
+            self.add(key, signature=signature, timestamp=timestamp)
+        return duplicate
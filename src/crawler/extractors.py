@@ -0,0 +1,142 @@
+"""
+HTML 추출 엔진
+뉴스 링크 추출에 사용할 파서 백엔드 (selectolax, lxml, BeautifulSoup)
+빠른 백엔드가 없으면 BeautifulSoup으로 대체
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+from loguru import logger
+
+from src.utils.config import get_env_str
+
+
+# (셀렉터, [(텍스트, href), ...])
+Candidates = Tuple[str, List[Tuple[str, str]]]
+
+
+class BaseExtractor:
+    """추출 엔진 기본 클래스"""
+
+    name = 'base'
+
+    def iter_candidates(self, html: str, selectors: List[str], limit: int = 10) -> Iterator[Candidates]:
+        """문서를 한 번만 파싱하고 셀렉터 순서대로 (텍스트, 링크) 후보 반환"""
+        tree = self._parse(html)  # 문서 파싱 실패는 호출자에게 전달 (대체 엔진 사용)
+        
+        for selector in selectors:
+            try:
+                candidates = self._select(tree, selector, limit)
+            except Exception as e:
+                logger.debug(f"[{self.name}] 셀렉터 '{selector}' 처리 오류: {e}")
+                candidates = []
+            yield selector, candidates
+
+    def _parse(self, html: str) -> Any:
+        raise NotImplementedError
+
+    def _select(self, tree: Any, selector: str, limit: int) -> List[Tuple[str, str]]:
+        raise NotImplementedError
+
+
+class SelectolaxExtractor(BaseExtractor):
+    """selectolax(lexbor) 기반 추출 엔진"""
+
+    name = 'selectolax'
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+        self._parser_class = LexborHTMLParser
+
+    def _parse(self, html: str) -> Any:
+        return self._parser_class(html)
+
+    def _select(self, tree: Any, selector: str, limit: int) -> List[Tuple[str, str]]:
+        nodes = tree.css(selector)[:limit]
+        return [(node.text(), node.attributes.get('href') or '') for node in nodes]
+
+
+class LxmlExtractor(BaseExtractor):
+    """lxml + 미리 컴파일한 CSS 셀렉터(XPath) 기반 추출 엔진"""
+
+    name = 'lxml'
+
+    def __init__(self):
+        import lxml.html
+        from lxml.cssselect import CSSSelector
+        self._html = lxml.html
+        self._parser = lxml.html.HTMLParser(encoding='utf-8')
+        self._selector_class = CSSSelector
+        self._compiled: Dict[str, object] = {}  # 셀렉터 문자열 -> 컴파일된 셀렉터
+
+    def _compile(self, selector: str):
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = self._selector_class(selector)
+            self._compiled[selector] = compiled
+        return compiled
+
+    def _parse(self, html: str) -> Any:
+        return self._html.fromstring(html.encode('utf-8'), parser=self._parser)
+
+    def _select(self, tree: Any, selector: str, limit: int) -> List[Tuple[str, str]]:
+        elements = self._compile(selector)(tree)[:limit]
+        return [(elem.text_content(), elem.get('href') or '') for elem in elements]
+
+
+class BeautifulSoupExtractor(BaseExtractor):
+    """BeautifulSoup(html.parser) 기반 추출 엔진 (기본 대체 경로)"""
+
+    name = 'bs4'
+
+    def __init__(self):
+        from bs4 import BeautifulSoup
+        self._soup_class = BeautifulSoup
+
+    def _parse(self, html: str) -> Any:
+        return self._soup_class(html, 'html.parser')
+
+    def _select(self, tree: Any, selector: str, limit: int) -> List[Tuple[str, str]]:
+        elements = tree.select(selector)[:limit]
+        return [(elem.text, elem.get('href', '')) for elem in elements]
+
+
+EXTRACTOR_CLASSES = {
+    'selectolax': SelectolaxExtractor,
+    'lxml': LxmlExtractor,
+    'bs4': BeautifulSoupExtractor,
+}
+
+# 'auto'일 때 시도하는 순서
+AUTO_ORDER = ['selectolax', 'lxml', 'bs4']
+
+# 백엔드별 인스턴스 (컴파일된 셀렉터 재사용)
+_extractors: Dict[str, BaseExtractor] = {}
+
+
+def get_extractor(name: str = None) -> BaseExtractor:
+    """추출 엔진 조회 (설치되지 않은 백엔드는 다음 순서로 대체)"""
+    if name is None:
+        name = get_env_str("HTML_PARSER_BACKEND", "auto")
+
+    candidates = AUTO_ORDER if name == 'auto' else [name, 'bs4']
+
+    for candidate in candidates:
+        if candidate in _extractors:
+            return _extractors[candidate]
+
+        extractor_class = EXTRACTOR_CLASSES.get(candidate)
+        if extractor_class is None:
+            logger.warning(f"알 수 없는 HTML 파서 백엔드: {candidate}")
+            continue
+
+        try:
+            extractor = extractor_class()
+        except ImportError as e:
+            logger.debug(f"HTML 파서 백엔드 '{candidate}' 사용 불가: {e}")
+            continue
+
+        _extractors[candidate] = extractor
+        logger.info(f"HTML 파서 백엔드: {candidate}")
+        return extractor
+
+    raise RuntimeError("사용 가능한 HTML 파서 백엔드가 없습니다")
@@ -0,0 +1,161 @@
+"""
+모델 기반 감정 분석 (선택 기능)
+CPU에서 양자화된 소형 분류 모델로 한 번의 크롤링 제목 전체를 묶어서 추론
+- 모델은 처음 사용할 때 로드 (기능이 꺼져 있으면 torch/transformers를 import하지 않음)
+- 정규화한 제목의 해시로 결과를 캐시해서 같은 제목은 다시 추론하지 않음
+"""
+
+import asyncio
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from loguru import logger
+
+from src.utils.config import get_env_bool, get_env_int, get_env_str
+
+
+# 모델 라벨 -> 봇 감정 라벨
+LABEL_MAP = {
+    'positive': 'positive', 'pos': 'positive', 'label_2': 'positive',
+    'negative': 'negative', 'neg': 'negative', 'label_0': 'negative',
+    'neutral': 'neutral', 'neu': 'neutral', 'label_1': 'neutral',
+}
+
+
+def title_key(title: str) -> int:
+    """정규화한 제목의 64비트 해시 (공백/문장부호/대소문자 차이 무시)"""
+    normalized = re.sub(r'[^\w]', '', title).lower()
+    return int.from_bytes(hashlib.blake2b(normalized.encode(), digest_size=8).digest(), 'big')
+
+
+class ModelSentimentStage:
+    """배치 추론 + 결과 캐시를 갖춘 모델 감정 분석 단계"""
+
+    def __init__(self, model_name: str, batch_size: int = 64, cache_size: int = 50000,
+                 quantize: bool = True, threads: int = 2):
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.cache_size = cache_size
+        self.quantize = quantize
+        self.threads = threads
+        self._tokenizer = None
+        self._model = None
+        self._torch = None
+        self._failed = False  # 로드 실패시 더 이상 시도하지 않음
+        self._lock = threading.Lock()  # 모델 로드/추론/캐시 갱신 직렬화
+        self._cache: "OrderedDict[int, str]" = OrderedDict()  # 제목 해시 -> 감정 라벨
+        self.stats = {'cached': 0, 'inferred': 0, 'batches': 0}
+
+    def _load(self) -> bool:
+        """모델 로드 (최초 1회)"""
+        if self._model is not None:
+            return True
+        if self._failed:
+            return False
+
+        try:
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+            torch.set_num_threads(self.threads)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            model.eval()
+
+            if self.quantize:
+                # Linear 계층 int8 동적 양자화 (CPU 추론 속도/메모리 개선)
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+            self._torch = torch
+            self._tokenizer = tokenizer
+            self._model = model
+            logger.info(f"감정 분석 모델 로드 완료: {self.model_name} (양자화: {self.quantize})")
+            return True
+
+        except Exception as e:
+            self._failed = True
+            logger.error(f"감정 분석 모델 로드 실패, 키워드 분석만 사용: {e}")
+            return False
+
+    def _infer(self, titles: List[str]) -> List[str]:
+        """제목 묶음 추론"""
+        labels = []
+        id2label = self._model.config.id2label
+
+        for start in range(0, len(titles), self.batch_size):
+            batch = titles[start:start + self.batch_size]
+            encoded = self._tokenizer(batch, padding=True, truncation=True, max_length=64, return_tensors='pt')
+            with self._torch.no_grad():
+                logits = self._model(**encoded).logits
+            for label_id in logits.argmax(dim=-1).tolist():
+                labels.append(LABEL_MAP.get(str(id2label[label_id]).lower(), 'neutral'))
+            self.stats['batches'] += 1
+
+        return labels
+
+    def score_titles(self, titles: List[str]) -> List[Optional[str]]:
+        """제목별 감정 라벨 (모델 사용 불가시 None)"""
+        with self._lock:
+            return self._score_titles(titles)
+
+    def _score_titles(self, titles: List[str]) -> List[Optional[str]]:
+        keys = [title_key(title) for title in titles]
+        results: List[Optional[str]] = [self._cache.get(key) for key in keys]
+
+        # 캐시에 없는 제목만 (중복 제거 후) 한 번에 추론
+        pending: Dict[int, str] = {}
+        for key, title, result in zip(keys, titles, results):
+            if result is None:
+                pending.setdefault(key, title)
+            else:
+                self._cache.move_to_end(key)
+                self.stats['cached'] += 1
+
+        if pending:
+            if not self._load():
+                return results
+
+            labels = self._infer(list(pending.values()))
+            self.stats['inferred'] += len(labels)
+            for key, label in zip(pending, labels):
+                self._cache[key] = label
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+            results = [self._cache.get(key) for key in keys]
+
+        return results
+
+    async def enrich(self, news_list: List[Dict[str, Any]]):
+        """뉴스 목록의 감정 라벨을 모델 결과로 갱신 (추론은 스레드에서 실행)"""
+        if not news_list or self._failed:
+            return
+
+        try:
+            labels = await asyncio.to_thread(self.score_titles, [news['title'] for news in news_list])
+        except Exception as e:
+            logger.error(f"모델 감정 분석 오류: {e}")
+            return
+
+        for news, label in zip(news_list, labels):
+            if label is not None:
+                news['sentiment'] = label
+
+
+# 전역 모델 감정 분석 인스턴스
+model_stage = None
+
+def get_model_stage() -> Optional[ModelSentimentStage]:
+    """모델 감정 분석 단계 조회 (비활성화시 None)"""
+    global model_stage
+    if model_stage is None and get_env_bool("SENTIMENT_MODEL_ENABLED", False):
+        model_stage = ModelSentimentStage(
+            model_name=get_env_str("SENTIMENT_MODEL_NAME", "snunlp/KR-FinBert-SC"),
+            batch_size=get_env_int("SENTIMENT_MODEL_BATCH_SIZE", 64),
+            cache_size=get_env_int("SENTIMENT_MODEL_CACHE_SIZE", 50000),
+            quantize=get_env_bool("SENTIMENT_MODEL_QUANTIZE", True),
+            threads=get_env_int("SENTIMENT_MODEL_THREADS", 2)
+        )
+    return model_stage
@@ -7,253 +7,439 @@ import asyncio
 import aiohttp
 from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
 import re
+import hashlib
+import urllib.parse as urlparse
+
+from src.crawler.article_id import article_index, article_key, canonical_article_id, find_publish_time
+from src.crawler.dedup import NearDuplicateIndex
+from src.crawler.extractors import BaseExtractor, get_extractor
+from src.crawler.model_sentiment import get_model_stage
+from src.crawler.parse_pool import get_parse_pool
+from src.crawler.sentiment import default_scorer
+from src.utils.config import get_env_int, get_env_float
+from src.utils.market_calendar import KST, now_kst
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """커넥션 풀(keep-alive, DNS 캐시, 호스트별 연결 제한)을 갖춘 HTTP 세션 생성"""
+    connector = aiohttp.TCPConnector(
+        limit=get_env_int("HTTP_POOL_LIMIT", 20),  # 전체 동시 연결 수
+        limit_per_host=get_env_int("HTTP_POOL_LIMIT_PER_HOST", 4),  # 호스트별 동시 연결 수
+        ttl_dns_cache=get_env_int("HTTP_DNS_CACHE_TTL", 300),  # DNS 캐시 유지 시간 (초)
+        keepalive_timeout=get_env_int("HTTP_KEEPALIVE_TIMEOUT", 60)  # 유휴 연결 유지 시간 (초)
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers=DEFAULT_HEADERS
+    )
+
+
+# 크롤링 대상 소스 설정 (우선순위 순서)
+# - selectors: 앞에서부터 시도하여 처음으로 뉴스를 찾은 셀렉터만 사용
+# - link_pattern: 변경 감지용 해시에 포함할 뉴스 링크 패턴
+# - max_items: 소스별 최대 수집 개수
+NEWS_SOURCES = {
+    'naver_finance': {
+        'name': '네이버증권',
+        'url': 'https://finance.naver.com',
+        'base_url': 'https://finance.naver.com',
+        'selectors': [
+            'a[href*="news.naver.com/main/read"]',  # 실제 네이버 뉴스 기사 링크 우선
+            'a[href*="/news/news_read"]',  # 증권 뉴스 상세 링크
+            '.news_area a',      # 뉴스 영역
+            'ul.newsList li a',  # 뉴스 리스트
+            'a[href*="/item/news"]',  # 종목 뉴스 링크
+        ],
+        'link_pattern': re.compile(r'news_read|news\.naver\.com/main/read|/item/news'),
+        'max_items': 5
+    },
+    'naver_stock': {
+        'name': '네이버증권',
+        'url': 'https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258',
+        'base_url': 'https://finance.naver.com',
+        'selectors': [
+            'dd.articleSubject a',  # 기사 제목 (썸네일 있는 경우)
+            'dt.articleSubject a',  # 기사 제목 (썸네일 없는 경우)
+        ],
+        'link_pattern': re.compile(r'news_read'),
+        'max_items': 5
+    },
+    'naver_economy': {
+        'name': '네이버뉴스',
+        'url': 'https://news.naver.com/main/list.naver?mode=LS2D&mid=shm&sid1=101&sid2=258',
+        'base_url': 'https://news.naver.com',
+        'selectors': [
+            'ul.type06_headline dt a',
+            'ul.type06 dt a',
+            '.sa_text_title',
+        ],
+        'link_pattern': re.compile(r'/article/|/main/read'),
+        'max_items': 5
+    },
+    'hankyung': {
+        'name': '한국경제',
+        'url': 'https://www.hankyung.com/finance/stock-market',
+        'base_url': 'https://www.hankyung.com',
+        'selectors': [
+            'h3.news-tit a',
+            '.news-list .tit a',
+        ],
+        'link_pattern': re.compile(r'/article/'),
+        'max_items': 5
+    },
+    'mk': {
+        'name': '매일경제',
+        'url': 'https://www.mk.co.kr/news/stock/',
+        'base_url': 'https://www.mk.co.kr',
+        'selectors': [
+            'a.news_item',
+            'h3.news_ttl a',
+        ],
+        'link_pattern': re.compile(r'/news/'),
+        'max_items': 5
+    },
+    'daum_finance': {
+        'name': '다음증권',
+        'url': 'https://finance.daum.net/news',
+        'base_url': 'https://finance.daum.net',
+        'selectors': [
+            'ul.list_news li a',  # 뉴스 리스트
+            '.news_list a',       # 뉴스 영역
+            'a[href*="/news/"]',  # 뉴스 링크
+        ],
+        'link_pattern': re.compile(r'/news/'),
+        'max_items': 3  # 다음에서는 3개만
+    },
+}
+
+
+# 변경 감지용 앵커 태그 패턴 (href, 텍스트)
+ANCHOR_PATTERN = re.compile(r'<a\s[^>]*?href=["\']([^"\']*)["\'][^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+
+# URL별 마지막 응답 상태 (ETag/Last-Modified, 뉴스 영역 해시, 파싱 결과)
+page_states: Dict[str, Dict[str, Any]] = {}
+
+
+# ---------------------------------------------------------------------------
+# 페이지 처리 함수 (파싱 워커 풀에서 실행되므로 모듈 수준 함수로 유지)
+# ---------------------------------------------------------------------------
+
+def process_page(source_key: str, html: str, crawl_time: datetime,
+                 previous_hash: Optional[str] = None) -> Tuple[str, Optional[List[Dict[str, Any]]]]:
+    """뉴스 영역 해시 계산 후 변경된 경우에만 파싱 (변경 없으면 뉴스 목록 None)"""
+    source = NEWS_SOURCES[source_key]
+    page_hash = fragment_hash(source, html)
+    
+    if previous_hash == page_hash:
+        return page_hash, None
+    
+    return page_hash, parse_news_list(source, html, crawl_time)
+
+
+def fragment_hash(source: Dict[str, Any], html: str) -> str:
+    """뉴스 링크 영역만 정규식으로 추려 해시 (전체 파싱보다 훨씬 가벼움)"""
+    link_pattern = source['link_pattern']
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for match in ANCHOR_PATTERN.finditer(html):
+        href, text = match.group(1), match.group(2)
+        if link_pattern.search(href):
+            digest.update(href.encode())
+            digest.update(text.encode())
+    
+    return digest.hexdigest()
+
+
+def parse_news_list(source: Dict[str, Any], html: str, crawl_time: datetime) -> List[Dict[str, Any]]:
+    """소스 HTML에서 뉴스 항목 추출 (빠른 추출 엔진 실패시 BeautifulSoup으로 재시도)"""
+    extractor = get_extractor()
+    try:
+        return extract_news(extractor, source, html, crawl_time)
+    except Exception as e:
+        if extractor.name == 'bs4':
+            raise
+        logger.warning(f"{extractor.name} 파싱 실패, BeautifulSoup으로 재시도: {e}")
+        return extract_news(get_extractor('bs4'), source, html, crawl_time)
+
+
+def extract_news(extractor: BaseExtractor, source: Dict[str, Any], html: str,
+                 crawl_time: datetime) -> List[Dict[str, Any]]:
+    """추출 엔진이 돌려준 (제목, 링크) 후보를 뉴스 항목으로 변환"""
+    news_list = []
+    
+    for selector, candidates in extractor.iter_candidates(html, source['selectors']):
+        if not candidates:
+            continue
+        
+        logger.debug(f"{source['name']}에서 '{selector}' 셀렉터로 {len(candidates)}개 뉴스 발견")
+        
+        for text, href in candidates[:source['max_items']]:
+            try:
+                # 제목과 링크 추출
+                title = text.strip()
+                link = normalize_link(href, source['base_url'])
+                
+                # 빈 제목이나 링크 건너뛰기
+                if not title or not link or len(title) < 10:
+                    continue
+                
+                # 고정 기사 ID와 실제 발행 시각 (목록에 시각이 없으면 수집 시각, collect_news에서 최초 수집 시각으로 보정)
+                article_id = canonical_article_id(link)
+                published = find_publish_time(html, href, crawl_time)
+                news_time = published or crawl_time
+                
+                news_list.append({
+                    'title': title[:80],  # 제목 길이 제한
+                    'url': link,
+                    'time': news_time.strftime("%H:%M"),
+                    'timestamp': news_time.timestamp(),
+                    'published': published is not None,
+                    'article_id': article_id,
+                    'article_key': article_key(article_id),
+                    'source': source['name']
+                })
+                
+            except Exception as e:
+                logger.debug(f"개별 뉴스 파싱 오류: {e}")
+                continue
+        
+        if news_list:
+            break  # 성공했으면 다른 셀렉터 시도 안 함
+    
+    # 수집한 제목 전체를 한 번에 감정 분석
+    results = default_scorer.score_batch([news['title'] for news in news_list])
+    for news, result in zip(news_list, results):
+        news['sentiment'] = result.label
+        news['sentiment_score'] = result.score
+    
+    return news_list
+
+
+def normalize_link(link: str, base_url: str) -> str:
+    """상대 경로 링크를 절대 경로로 변환 (변환 불가시 빈 문자열)"""
+    if not link:
+        return ''
+    
+    # 링크 처리 개선
+    if link.startswith('//'):
+        link = f'https:{link}'
+    elif link.startswith('/'):
+        if 'news.naver.com' in link:
+            link = f'https://news.naver.com{link}'
+        else:
+            link = f'{base_url}{link}'
+    elif not link.startswith('http'):
+        return ''
+    
+    # 더 직접적인 뉴스 링크 찾기 시도
+    if 'news_read.naver' in link:
+        # finance.naver.com 뉴스를 실제 news.naver.com 링크로 변환 시도
+        try:
+            # URL에서 office_id와 article_id 추출
+            parsed = urlparse.urlparse(link)
+            params = urlparse.parse_qs(parsed.query)
+            
+            if 'office_id' in params and 'article_id' in params:
+                office_id = params['office_id'][0]
+                article_id = params['article_id'][0]
+                # 직접적인 뉴스 링크로 변환
+                link = f'https://news.naver.com/main/read.naver?mode=LSD&mid=sec&sid1=101&oid={office_id}&aid={article_id}'
+        except Exception:
+            pass  # 변환 실패시 원본 링크 유지
+    
+    return link
+
+
+def analyze_sentiment(title: str) -> str:
+    """간단한 감정 분석"""
+    return default_scorer.score(title).label
 
 
 class NewsCrawler:
-    def __init__(self):
-        self.session = None
-        self.news_sources = {
-            'naver_stock': 'https://finance.naver.com/news/news_list.naver?mode=LSS2D&section_id=101&section_id2=258',
-            'naver_economy': 'https://news.naver.com/main/list.naver?mode=LS2D&mid=shm&sid1=101&sid2=258',
-            'hankyung': 'https://www.hankyung.com/finance/stock-market',
-            'mk': 'https://www.mk.co.kr/news/stock/'
-        }
+    def __init__(self, session: aiohttp.ClientSession = None):
+        # 외부에서 받은 세션은 공유 풀이므로 닫지 않음
+        self.session = session
+        self._owns_session = session is None
+        self.news_sources = {key: config['url'] for key, config in NEWS_SOURCES.items()}
+        # 소스별 요청 제한 시간과 전체 수집 마감 시간 (초)
+        self.source_timeout = get_env_float("CRAWL_SOURCE_TIMEOUT", 6.0)
+        self.crawl_deadline = get_env_float("CRAWL_DEADLINE", 8.0)
         
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 시작"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=10),
-            headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-        )
+        if self.session is None:
+            self.session = create_http_session()
+            self._owns_session = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """비동기 컨텍스트 매니저 종료"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
     async def get_latest_news(self, limit: int = 5) -> List[Dict[str, Any]]:
-        """최신 뉴스 수집"""
+        """최신 뉴스 수집 (모든 소스가 비면 간단한 웹 크롤링, 실패시 대체 뉴스)"""
         try:
-            all_news = []
-            
-            # 네이버 증권 뉴스 크롤링
-            naver_news = await self._crawl_naver_finance()
-            all_news.extend(naver_news)
-            
-            # 한국경제 뉴스 크롤링 (간단 버전)
-            # hankyung_news = await self._crawl_hankyung()
-            # all_news.extend(hankyung_news)
-            
-            # 시간순으로 정렬 (최신순)
-            all_news.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
-            
-            # 중복 제거 (제목 기준)
-            seen_titles = set()
-            unique_news = []
-            for news in all_news:
-                title_clean = re.sub(r'[^\w\s]', '', news['title']).lower()
-                if title_clean not in seen_titles:
-                    seen_titles.add(title_clean)
-                    unique_news.append(news)
-                    
-            return unique_news[:limit]
+            news = await self.collect_news(limit)
+            if news:
+                return news
             
+            # 공유 캐시를 거치지 않는 단독 사용에서만 백업 크롤링 (캐시에는 실제 수집 결과만 저장)
+            news = await self._simple_web_crawl()
+            for item in news:
+                self._assign_identity(item)
+            return news[:limit]
         except Exception as e:
             logger.error(f"뉴스 크롤링 중 오류: {e}")
             return self._get_fallback_news(limit)
 
-    async def _crawl_naver_finance(self) -> List[Dict[str, Any]]:
-        """네이버 증권 뉴스 크롤링 (웹페이지 방식)"""
-        try:
-            # 네이버 증권 메인페이지에서 뉴스 추출
-            url = 'https://finance.naver.com'
-            
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    logger.warning(f"네이버 증권 페이지 접근 실패: {response.status}")
-                    return await self._crawl_daum_finance()  # 대안 시도
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                news_list = []
-                
-                # 실제 뉴스 기사 링크를 우선으로 크롤링
-                selectors = [
-                    'a[href*="news.naver.com/main/read"]',  # 실제 네이버 뉴스 기사 링크 우선
-                    'a[href*="/news/news_read"]',  # 증권 뉴스 상세 링크
-                    '.news_area a',      # 뉴스 영역
-                    'ul.newsList li a',  # 뉴스 리스트  
-                    'a[href*="/item/news"]',  # 종목 뉴스 링크
-                ]
-                
-                for selector in selectors:
-                    try:
-                        elements = soup.select(selector)[:10]
-                        
-                        if elements:
-                            logger.debug(f"'{selector}' 셀렉터로 {len(elements)}개 뉴스 발견")
-                            
-                            for elem in elements[:5]:
-                                try:
-                                    # 제목과 링크 추출
-                                    title = elem.text.strip()
-                                    link = elem.get('href', '')
-                                    
-                                    # 빈 제목이나 링크 건너뛰기
-                                    if not title or not link or len(title) < 10:
-                                        continue
-                                    
-                                    # 링크 처리 개선
-                                    if link.startswith('/'):
-                                        if '/news/news_read' in link:
-                                            # 네이버 증권 뉴스는 실제 뉴스 링크로 변환
-                                            link = f'https://finance.naver.com{link}'
-                                        elif 'news.naver.com' in link:
-                                            link = f'https://news.naver.com{link}'
-                                        else:
-                                            link = f'https://finance.naver.com{link}'
-                                    elif not link.startswith('http'):
-                                        continue
-                                    
-                                    # 더 직접적인 뉴스 링크 찾기 시도
-                                    if 'news_read.naver' in link:
-                                        # finance.naver.com 뉴스를 실제 news.naver.com 링크로 변환 시도
-                                        try:
-                                            # URL에서 office_id와 article_id 추출
-                                            import urllib.parse as urlparse
-                                            parsed = urlparse.urlparse(link)
-                                            params = urlparse.parse_qs(parsed.query)
-                                            
-                                            if 'office_id' in params and 'article_id' in params:
-                                                office_id = params['office_id'][0]
-                                                article_id = params['article_id'][0]
-                                                # 직접적인 뉴스 링크로 변환
-                                                link = f'https://news.naver.com/main/read.naver?mode=LSD&mid=sec&sid1=101&oid={office_id}&aid={article_id}'
-                                        except:
-                                            pass  # 변환 실패시 원본 링크 유지
-                                    
-                                    # 감정 분석
-                                    sentiment = self._analyze_sentiment(title)
-                                    
-                                    # 현재 시간 사용
-                                    current_time = datetime.now()
-                                    time_str = current_time.strftime("%H:%M")
-                                    timestamp = current_time.timestamp()
-                                    
-                                    news_list.append({
-                                        'title': title[:80],  # 제목 길이 제한
-                                        'url': link,
-                                        'time': time_str,
-                                        'sentiment': sentiment,
-                                        'timestamp': timestamp,
-                                        'source': '네이버증권'
-                                    })
-                                    
-                                except Exception as e:
-                                    logger.debug(f"개별 뉴스 파싱 오류: {e}")
-                                    continue
-                            
-                            if news_list:
-                                break  # 성공했으면 다른 셀렉터 시도 안 함
-                                
-                    except Exception as e:
-                        logger.debug(f"셀렉터 '{selector}' 처리 오류: {e}")
-                        continue
-                
-                logger.info(f"네이버 증권에서 {len(news_list)}개 뉴스 수집")
-                return news_list
+    async def collect_news(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """최신 뉴스 수집 (대체 뉴스 없이 실제 수집 결과만 반환, 오류는 호출자에게 전달)"""
+        # 모든 소스 동시 수집 (마감 시간 내 도착한 결과만 사용)
+        all_news = await self._crawl_all_sources()
+        
+        for news in all_news:
+            self._assign_identity(news)
+        
+        # 시간순으로 정렬 (최신순, 같은 시간이면 소스 우선순위 유지)
+        all_news.sort(key=lambda x: x.get('timestamp', 0), reverse=True)
+        
+        # 중복 제거 (같은 기사 ID, 표현만 조금 다른 같은 기사도 제거)
+        duplicate_index = NearDuplicateIndex(threshold=get_env_float("DEDUP_SIMILARITY", 0.6))
+        unique_news = []
+        for news in all_news:
+            if news['article_key'] in duplicate_index:
+                continue
+            if duplicate_index.check_and_add(news['article_key'], news['title']) is None:
+                unique_news.append(news)
+        
+        unique_news = unique_news[:limit]
+        
+        # 모델 감정 분석 (활성화된 경우에만, 이번 수집 제목 전체를 한 번에)
+        stage = get_model_stage()
+        if stage:
+            await stage.enrich(unique_news)
                 
-        except Exception as e:
-            logger.error(f"네이버 증권 크롤링 오류: {e}")
-            # 네이버 실패시 다음 사이트 시도
-            return await self._crawl_daum_finance()
+        return unique_news
 
-    async def _crawl_daum_finance(self) -> List[Dict[str, Any]]:
-        """다음 증권 뉴스 크롤링 (네이버 백업용)"""
+    def _assign_identity(self, news: Dict[str, Any]):
+        """기사 ID를 채우고, 발행 시각을 모르는 기사는 최초 수집 시각으로 고정"""
+        if 'article_key' not in news:
+            news['article_id'] = canonical_article_id(news['url'])
+            news['article_key'] = article_key(news['article_id'])
+        
+        if not news.get('published'):
+            first_seen = article_index.first_seen(news['article_key'], news.get('timestamp'))
+            news['timestamp'] = first_seen
+            news['time'] = datetime.fromtimestamp(first_seen, KST).strftime("%H:%M")
+
+    async def _crawl_all_sources(self) -> List[Dict[str, Any]]:
+        """설정된 모든 소스를 동시에 수집하고 마감 시간까지 도착한 결과 병합"""
+        crawl_time = now_kst()
+        tasks = {
+            key: asyncio.create_task(self._crawl_source(key, crawl_time))
+            for key in NEWS_SOURCES
+        }
+        
+        done, pending = await asyncio.wait(tasks.values(), timeout=self.crawl_deadline)
+        
+        # 마감 시간을 넘긴 소스는 취소 (결과가 줄어들 뿐 지연되지 않음)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            timed_out = [key for key, task in tasks.items() if task in pending]
+            logger.warning(f"수집 마감 시간({self.crawl_deadline}초) 초과 소스: {', '.join(timed_out)}")
+        
+        # 소스 우선순위 순서대로 병합
+        all_news = []
+        for key, task in tasks.items():
+            if task not in done:
+                continue
+            if task.exception():
+                logger.debug(f"{key} 수집 오류: {task.exception()}")
+                continue
+            all_news.extend(task.result())
+        
+        return all_news
+
+    async def _crawl_source(self, source_key: str, crawl_time: datetime) -> List[Dict[str, Any]]:
+        """단일 소스 페이지를 가져와 뉴스 목록 추출"""
+        source = NEWS_SOURCES[source_key]
+        url = source['url']
+        state = page_states.get(url)
+        
+        # 이전 응답의 검증자로 조건부 요청
+        headers = {}
+        if state:
+            if state.get('etag'):
+                headers['If-None-Match'] = state['etag']
+            if state.get('last_modified'):
+                headers['If-Modified-Since'] = state['last_modified']
+        
         try:
-            url = 'https://finance.daum.net/news'
-            
-            async with self.session.get(url) as response:
+            timeout = aiohttp.ClientTimeout(total=self.source_timeout)
+            async with self.session.get(url, headers=headers, timeout=timeout) as response:
+                if response.status == 304 and state:
+                    logger.debug(f"{source['name']}({source_key}) 변경 없음 (304)")
+                    return [dict(news) for news in state['news']]
+                
                 if response.status != 200:
-                    logger.warning(f"다음 증권 페이지 접근 실패: {response.status}")
-                    return await self._simple_web_crawl()
+                    logger.warning(f"{source['name']} 페이지 접근 실패: {response.status}")
+                    return []
                 
                 html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                news_list = []
-                
-                # 다음 뉴스 셀렉터
-                selectors = [
-                    'ul.list_news li a',  # 뉴스 리스트
-                    '.news_list a',       # 뉴스 영역
-                    'a[href*="/news/"]',  # 뉴스 링크
-                ]
-                
-                for selector in selectors:
-                    try:
-                        elements = soup.select(selector)[:10]
-                        
-                        if elements:
-                            logger.debug(f"다음에서 '{selector}' 셀렉터로 {len(elements)}개 뉴스 발견")
-                            
-                            for elem in elements[:3]:  # 다음에서는 3개만
-                                try:
-                                    title = elem.text.strip()
-                                    link = elem.get('href', '')
-                                    
-                                    if not title or not link or len(title) < 10:
-                                        continue
-                                    
-                                    if link.startswith('/'):
-                                        link = f'https://finance.daum.net{link}'
-                                    elif not link.startswith('http'):
-                                        continue
-                                    
-                                    sentiment = self._analyze_sentiment(title)
-                                    current_time = datetime.now()
-                                    
-                                    news_list.append({
-                                        'title': title[:80],
-                                        'url': link,
-                                        'time': current_time.strftime("%H:%M"),
-                                        'sentiment': sentiment,
-                                        'timestamp': current_time.timestamp(),
-                                        'source': '다음증권'
-                                    })
-                                    
-                                except Exception as e:
-                                    logger.debug(f"다음 뉴스 파싱 오류: {e}")
-                                    continue
-                            
-                            if news_list:
-                                break
-                                
-                    except Exception as e:
-                        logger.debug(f"다음 셀렉터 '{selector}' 처리 오류: {e}")
-                        continue
-                
-                logger.info(f"다음 증권에서 {len(news_list)}개 뉴스 수집")
-                return news_list
-                
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+            
+            # 해시 계산과 파싱은 워커 풀에서 실행 (봇 이벤트 루프를 막지 않음)
+            # 서버가 검증자를 무시해도 뉴스 영역이 같으면 파싱 생략
+            previous_hash = state['fragment_hash'] if state else None
+            page_hash, news_list = await get_parse_pool().run(
+                process_page, source_key, html, crawl_time, previous_hash
+            )
+            
+            if news_list is None:
+                state['etag'] = etag
+                state['last_modified'] = last_modified
+                logger.debug(f"{source['name']}({source_key}) 뉴스 영역 변경 없음, 파싱 생략")
+                return [dict(news) for news in state['news']]
+            
+            logger.info(f"{source['name']}({source_key})에서 {len(news_list)}개 뉴스 수집")
+            
+            if news_list:
+                page_states[url] = {
+                    'etag': etag,
+                    'last_modified': last_modified,
+                    'fragment_hash': page_hash,
+                    'news': [dict(news) for news in news_list]
+                }
+            return news_list
+            
+        except asyncio.TimeoutError:
+            logger.warning(f"{source['name']}({source_key}) 요청 시간 초과 ({self.source_timeout}초)")
+            return []
         except Exception as e:
-            logger.error(f"다음 증권 크롤링 오류: {e}")
-            return await self._simple_web_crawl()
+            logger.error(f"{source['name']}({source_key}) 크롤링 오류: {e}")
+            return []
 
     async def _simple_web_crawl(self) -> List[Dict[str, Any]]:
-        """간단한 웹 크롤링 (RSS 백업용)"""
+        """간단한 웹 크롤링 (모든 소스 실패시 백업용)"""
         try:
             # 간단한 뉴스 사이트 크롤링
             url = 'https://finance.naver.com'
             
-            async with self.session.get(url) as response:
+            timeout = aiohttp.ClientTimeout(total=self.source_timeout)
+            async with self.session.get(url, timeout=timeout) as response:
                 if response.status != 200:
                     return []
                 
@@ -265,12 +451,13 @@ class NewsCrawler:
                 if title_elem:
                     page_title = title_elem.text.strip()
                     
+                    crawl_time = now_kst()
                     return [{
                         'title': f"[실시간] {page_title[:50]}...",
                         'url': url,
-                        'time': datetime.now().strftime("%H:%M"),
+                        'time': crawl_time.strftime("%H:%M"),
                         'sentiment': 'neutral',
-                        'timestamp': datetime.now().timestamp(),
+                        'timestamp': crawl_time.timestamp(),
                         'source': '웹크롤링'
                     }]
                 
@@ -282,29 +469,7 @@ class NewsCrawler:
 
     def _analyze_sentiment(self, title: str) -> str:
         """간단한 감정 분석"""
-        positive_keywords = [
-            '상승', '급등', '호재', '성장', '증가', '확대', '개선', '호조', 
-            '플러스', '상향', '돌파', '신고가', '최고', '강세', '반등',
-            '급증', '폭등', '수익', '성과', '흑자', '실적', '성공'
-        ]
-        
-        negative_keywords = [
-            '하락', '급락', '악재', '감소', '하향', '위험', '부진', '약세',
-            '마이너스', '손실', '적자', '하락세', '폭락', '최저', '부정적',
-            '우려', '불안', '리스크', '문제', '지연', '취소'
-        ]
-        
-        title_lower = title.lower()
-        
-        positive_score = sum(1 for keyword in positive_keywords if keyword in title_lower)
-        negative_score = sum(1 for keyword in negative_keywords if keyword in title_lower)
-        
-        if positive_score > negative_score:
-            return 'positive'
-        elif negative_score > positive_score:
-            return 'negative'
-        else:
-            return 'neutral'
+        return analyze_sentiment(title)
 
     def _get_fallback_news(self, limit: int) -> List[Dict[str, Any]]:
         """크롤링 실패시 대체 뉴스 (실시간 생성)"""
@@ -406,11 +571,153 @@ class NewsCrawler:
         return generated_news
 
 
+# 전역 HTTP 세션 (봇이 시작/종료 시 생성하고 닫음)
+http_session = None
+
+async def init_http_session() -> aiohttp.ClientSession:
+    """공유 HTTP 세션 초기화"""
+    global http_session
+    if http_session is None or http_session.closed:
+        http_session = create_http_session()
+        logger.info("공유 HTTP 커넥션 풀 생성")
+    return http_session
+
+async def close_http_session():
+    """공유 HTTP 세션 종료"""
+    global http_session
+    if http_session and not http_session.closed:
+        await http_session.close()
+        logger.info("공유 HTTP 커넥션 풀 종료")
+    http_session = None
+
+
+class NewsCache:
+    """
+    get_stock_news 앞단의 공유 뉴스 캐시
+    - 동시에 들어온 요청은 하나의 크롤링으로 합침 (single-flight)
+    - ttl 이내 결과는 그대로 제공, ttl 이후 max_stale 이내면 이전 결과를 주고 백그라운드 갱신
+    - 크롤링 실패시 마지막 정상 수집 결과 제공
+    """
+
+    def __init__(self, ttl: float = 60, max_stale: float = 300, capacity: int = 20,
+                 failure_backoff: float = 30):
+        self.ttl = ttl  # 신선한 결과로 인정하는 시간 (초)
+        self.max_stale = max_stale  # ttl 이후에도 갱신 중 제공할 수 있는 시간 (초)
+        self.capacity = capacity  # 한 번에 수집해 보관할 뉴스 개수
+        self.failure_backoff = failure_backoff  # 실패 후 재시도 전 대기 시간 (초)
+        self._snapshot: List[Dict[str, Any]] = []  # 마지막 정상 수집 결과
+        self._fetched_at = None  # 마지막 정상 수집 시각 (monotonic)
+        self._retry_at = 0.0  # 실패 후 다음 크롤링 허용 시각 (monotonic)
+        self._inflight = None  # 진행 중인 크롤링 태스크
+        self.stats = {
+            'hits': 0,        # 신선한 캐시 제공
+            'stale_hits': 0,  # 오래된 캐시 제공 (백그라운드 갱신)
+            'misses': 0,      # 크롤링 대기
+            'coalesced': 0,   # 진행 중 크롤링에 합류
+            'crawls': 0,      # 실제 크롤링 횟수
+            'failures': 0,    # 크롤링 실패 횟수
+            'backoffs': 0     # 캐시 없이 실패한 뒤 대기 중이라 빈 결과 제공
+        }
+
+    def _age(self) -> float:
+        """캐시 나이 (초), 캐시가 없으면 무한대"""
+        if self._fetched_at is None:
+            return float('inf')
+        return asyncio.get_running_loop().time() - self._fetched_at
+
+    async def get(self, limit: int = 5) -> List[Dict[str, Any]]:
+        """캐시된 뉴스 조회 (필요하면 크롤링)"""
+        age = self._age()
+        now = asyncio.get_running_loop().time()
+        
+        if self._snapshot and (age <= self.ttl or now < self._retry_at):
+            self.stats['hits'] += 1
+            return self._snapshot[:limit]
+        
+        if not self._snapshot and now < self._retry_at:
+            # 첫 수집부터 실패했으면 failure_backoff 동안 다시 크롤링하지 않음 (호출자가 대체 뉴스 표시)
+            self.stats['backoffs'] += 1
+            return []
+        
+        if self._snapshot and age <= self.ttl + self.max_stale:
+            # 이전 결과를 바로 제공하고 백그라운드에서 갱신
+            self.stats['stale_hits'] += 1
+            self._start_refresh()
+            return self._snapshot[:limit]
+        
+        if self._inflight and not self._inflight.done():
+            self.stats['coalesced'] += 1
+        else:
+            self.stats['misses'] += 1
+        
+        news = await asyncio.shield(self._start_refresh())
+        return news[:limit]
+
+    async def refresh(self) -> List[Dict[str, Any]]:
+        """캐시 상태와 무관하게 크롤링 (진행 중이면 합류)"""
+        return await asyncio.shield(self._start_refresh())
+
+    def _start_refresh(self) -> asyncio.Task:
+        """진행 중 크롤링이 없으면 새로 시작"""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.create_task(self._crawl())
+        return self._inflight
+
+    async def _crawl(self) -> List[Dict[str, Any]]:
+        """실제 크롤링 수행 (예외를 밖으로 던지지 않음)"""
+        self.stats['crawls'] += 1
+        loop = asyncio.get_running_loop()
+        
+        try:
+            # 공유 세션이 있으면 재사용, 없으면 일회용 세션 생성
+            session = http_session if http_session and not http_session.closed else None
+            async with NewsCrawler(session) as crawler:
+                news = await crawler.collect_news(self.capacity)
+            
+            if news:
+                self._snapshot = news
+                self._fetched_at = loop.time()
+                return news
+            
+            logger.warning("뉴스 크롤링 결과 없음, 마지막 정상 결과 사용")
+            
+        except Exception as e:
+            logger.error(f"뉴스 크롤링 중 오류: {e}, 마지막 정상 결과 사용")
+        
+        self.stats['failures'] += 1
+        self._retry_at = loop.time() + self.failure_backoff
+        return self._snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        stats = dict(self.stats)
+        requests = stats['hits'] + stats['stale_hits'] + stats['misses'] + stats['coalesced'] + stats['backoffs']
+        saved = requests - stats['crawls']
+        stats['requests'] = requests
+        stats['crawls_saved'] = max(0, saved)
+        stats['hit_rate'] = round((stats['hits'] + stats['stale_hits'] + stats['coalesced']) / requests, 3) if requests else 0.0
+        stats['age'] = round(self._age(), 1) if self._fetched_at is not None else None
+        return stats
+
+
+# 전역 뉴스 캐시 인스턴스
+news_cache = None
+
+def get_news_cache() -> NewsCache:
+    """공유 뉴스 캐시 조회 (최초 호출시 생성)"""
+    global news_cache
+    if news_cache is None:
+        news_cache = NewsCache(
+            ttl=get_env_float("NEWS_CACHE_TTL", 60),
+            max_stale=get_env_float("NEWS_CACHE_MAX_STALE", 300)
+        )
+    return news_cache
+
+
 # 간편한 사용을 위한 함수
 async def get_stock_news(limit: int = 5) -> List[Dict[str, Any]]:
-    """주식 뉴스 가져오기 (간편 함수)"""
-    async with NewsCrawler() as crawler:
-        return await crawler.get_latest_news(limit)
+    """주식 뉴스 가져오기 (간편 함수, 공유 캐시 경유)"""
+    return await get_news_cache().get(limit)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+"""
+파싱 워커 풀
+HTML 파싱과 감정 분석처럼 CPU를 쓰는 작업을 봇 이벤트 루프 밖(스레드/프로세스)에서 실행
+"""
+
+import asyncio
+import multiprocessing
+import sys
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from loguru import logger
+
+from src.utils.config import get_env_int, get_env_str
+
+
+def _init_process_worker():
+    """프로세스 워커 로깅 설정 (spawn된 프로세스는 메인 로깅 설정을 물려받지 않음)"""
+    logger.remove()
+    logger.add(sys.stderr, level=get_env_str("LOG_LEVEL", "INFO"))
+
+
+class ParsePool:
+    """
+    크기가 제한된 파싱 작업 풀
+    - mode: 'thread' (기본), 'process' (GIL 영향 없음), 'inline' (이벤트 루프에서 직접 실행)
+    - 동시에 제출 가능한 작업은 workers + queue_size 개로 제한 (초과시 대기)
+    - 작업 함수는 모듈 수준 함수여야 하며 일반 dict/list 결과만 돌려줘야 함
+    """
+
+    def __init__(self, mode: str = 'thread', workers: int = 2, queue_size: int = 8):
+        self.mode = mode
+        self.workers = workers
+        self.queue_size = queue_size
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(workers + queue_size)
+
+    def _get_executor(self) -> Executor:
+        """실행기 생성 (최초 사용시)"""
+        if self._executor is None:
+            if self.mode == 'process':
+                # 실행 중인 이벤트 루프를 fork하지 않도록 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_process_worker
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='news-parse'
+                )
+            logger.info(f"파싱 워커 풀 시작: {self.mode} x {self.workers} (대기열 {self.queue_size})")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """작업 실행 후 결과 반환"""
+        if self.mode == 'inline':
+            return func(*args)
+
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self):
+        """실행기 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            logger.info("파싱 워커 풀 종료")
+
+
+# 전역 파싱 풀 인스턴스
+parse_pool = None
+
+def get_parse_pool() -> ParsePool:
+    """공유 파싱 풀 조회 (최초 호출시 생성)"""
+    global parse_pool
+    if parse_pool is None:
+        parse_pool = ParsePool(
+            mode=get_env_str("PARSE_POOL_MODE", "thread"),
+            workers=get_env_int("PARSE_POOL_WORKERS", 2),
+            queue_size=get_env_int("PARSE_POOL_QUEUE", 8)
+        )
+    return parse_pool
+
+def shutdown_parse_pool():
+    """공유 파싱 풀 종료"""
+    global parse_pool
+    if parse_pool is not None:
+        parse_pool.shutdown()
+        parse_pool = None
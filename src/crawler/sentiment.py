@@ -0,0 +1,119 @@
+"""
+키워드 기반 감정 분석
+가중치가 있는 감정 사전을 하나의 정규식으로 컴파일해 한 번의 스캔으로 점수 계산
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Tuple
+
+
+# 긍정 키워드와 가중치
+POSITIVE_KEYWORDS = {
+    '상승': 1.0, '급등': 2.0, '호재': 1.5, '성장': 1.0, '증가': 1.0, '확대': 1.0,
+    '개선': 1.0, '호조': 1.0, '플러스': 1.0, '상향': 1.0, '돌파': 1.0, '신고가': 2.0,
+    '최고': 1.0, '강세': 1.0, '반등': 1.0, '급증': 1.5, '폭등': 2.0, '수익': 0.5,
+    '성과': 0.5, '흑자': 1.5, '실적': 0.5, '성공': 1.0
+}
+
+# 부정 키워드와 가중치
+NEGATIVE_KEYWORDS = {
+    '하락': 1.0, '급락': 2.0, '악재': 1.5, '감소': 1.0, '하향': 1.0, '위험': 1.0,
+    '부진': 1.0, '약세': 1.0, '마이너스': 1.0, '손실': 1.0, '적자': 1.5, '하락세': 1.0,
+    '폭락': 2.0, '최저': 1.0, '부정적': 1.0, '우려': 1.0, '불안': 1.0, '리스크': 1.0,
+    '문제': 0.5, '지연': 0.5, '취소': 1.0
+}
+
+
+def _trie_pattern(terms: List[str]) -> str:
+    """
+    키워드 목록을 접두사 트리 형태의 정규식으로 변환
+    (예: 하락, 하락세, 하향 -> 하(?:락(?:세)?|향)) 위치마다 첫 글자 한 번만 비교하고 가장 긴 키워드를 우선 매칭
+    """
+    trie: Dict[str, dict] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[''] = {}  # 키워드 끝 표시
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:  # 여기서 끝나는 키워드가 있으면 더 긴 키워드를 먼저 시도
+            pattern = f'(?:{pattern})?' if len(branches) == 1 else pattern + '?'
+        return pattern
+
+    return build(trie)
+
+
+class SentimentResult(NamedTuple):
+    """감정 분석 결과"""
+    label: str                # positive, negative, neutral
+    score: float              # 긍정 가중치 합 - 부정 가중치 합
+    matched: Tuple[str, ...]  # 매칭된 키워드 (등장 순서)
+
+
+class SentimentScorer:
+    """
+    컴파일된 감정 사전
+    - 가장 긴 키워드를 먼저 매칭하는 단일 정규식이라 겹치는 키워드는 한 번만 계산 ('하락세'는 '하락'으로 중복 계산되지 않음)
+    - score_batch는 여러 제목을 이어 붙여 한 번에 스캔
+    """
+
+    SEPARATOR = '\n'  # 제목 사이 구분자
+
+    def __init__(self, positive: Dict[str, float] = None, negative: Dict[str, float] = None):
+        positive = POSITIVE_KEYWORDS if positive is None else positive
+        negative = NEGATIVE_KEYWORDS if negative is None else negative
+
+        # 키워드 -> 부호가 붙은 가중치
+        self.weights: Dict[str, float] = {term.lower(): weight for term, weight in positive.items()}
+        self.weights.update({term.lower(): -weight for term, weight in negative.items()})
+
+        self.pattern = re.compile(_trie_pattern(list(self.weights)))
+        # 배치용: 구분자를 트리에 함께 넣어 정규식 엔진의 첫 글자 최적화를 유지
+        self.batch_pattern = re.compile(_trie_pattern(list(self.weights) + [self.SEPARATOR]))
+
+    @staticmethod
+    def _label(score: float) -> str:
+        if score > 0:
+            return 'positive'
+        elif score < 0:
+            return 'negative'
+        return 'neutral'
+
+    def score(self, title: str) -> SentimentResult:
+        """제목 하나의 감정 분석"""
+        matched = tuple(self.pattern.findall(title.lower()))
+        score = sum(self.weights[term] for term in matched)
+        return SentimentResult(self._label(score), score, matched)
+
+    def score_batch(self, titles: List[str]) -> List[SentimentResult]:
+        """여러 제목을 한 번의 스캔으로 감정 분석"""
+        if not titles:
+            return []
+
+        # 구분자도 함께 매칭해 제목 경계를 추적 (매치 객체 없이 findall 한 번으로 처리)
+        text = self.SEPARATOR.join(title.lower().replace(self.SEPARATOR, ' ') for title in titles)
+        weights = self.weights
+        
+        scores = [0.0] * len(titles)
+        matched: List[List[str]] = [[] for _ in titles]
+        index = 0
+        for term in self.batch_pattern.findall(text):
+            if term == self.SEPARATOR:
+                index += 1
+                continue
+            scores[index] += weights[term]
+            matched[index].append(term)
+
+        return [
+            SentimentResult(self._label(score), score, tuple(terms))
+            for score, terms in zip(scores, matched)
+        ]
+
+
+# 기본 감정 사전 인스턴스
+default_scorer = SentimentScorer()
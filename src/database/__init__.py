@@ -0,0 +1 @@
+# 데이터베이스 패키지
@@ -0,0 +1,213 @@
+"""
+발송 대기열 (아웃박스)
+보낼 메시지를 SQLite(WAL)에 먼저 기록하고 전송 워커가 꺼내 보내는 영속 큐
+- 멱등 키(알림 ID:채팅 ID)가 같은 메시지는 한 번만 등록 (재시작 후 같은 알림을 다시 등록해도 중복 없음)
+- 카드 내용은 알림당 한 번만 저장하고 메시지는 카드 ID만 참조
+- 상태: pending(대기) -> sending(전송 중) -> sent(완료) / failed(포기)
+- 메시지는 전송 요청 직전에 하나씩 sending으로 바꿈 (조회만 하고 아직 보내지 않은 메시지는 pending 유지)
+- 재시작시 sending 상태로 남은 메시지는 전송됐는지 알 수 없으므로 다시 보내지 않고 unknown으로 표시 (중복 발송 방지)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+from loguru import logger
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox_cards (
+    card_id TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    reply_markup TEXT,
+    parse_mode TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS outbox_messages (
+    id INTEGER PRIMARY KEY,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    chat_id NOT NULL,
+    card_id TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox_messages (status, next_attempt_at);
+"""
+
+
+class OutboxMessage(NamedTuple):
+    """전송할 메시지 한 건"""
+    id: int
+    chat_id: Union[int, str]  # 채팅 ID 또는 @채널명
+    card_id: str
+    attempts: int
+
+
+class OutboxCard(NamedTuple):
+    """저장된 카드 내용"""
+    text: str
+    reply_markup: Optional[Dict[str, Any]]  # InlineKeyboardMarkup.to_dict() 결과
+    parse_mode: Optional[str]
+
+
+class Outbox:
+    """SQLite 기반 발송 대기열"""
+
+    def __init__(self, path: str = "data/outbox.db", max_attempts: int = 5,
+                 backoff_base: float = 2.0, backoff_max: float = 300.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base  # 재시도 대기 = backoff_base ^ 시도 횟수 (초)
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()  # 연결 하나를 여러 스레드에서 순서대로 사용
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def enqueue(self, broadcast_id: str, card: OutboxCard, chat_ids: Iterable[Union[int, str]]) -> int:
+        """알림 등록 (이미 등록된 채팅은 건너뜀, 새로 등록한 메시지 수 반환)"""
+        now = time.time()
+        rows = [(f"{broadcast_id}:{chat_id}", chat_id, broadcast_id, now, now, now) for chat_id in chat_ids]
+        markup = json.dumps(card.reply_markup, ensure_ascii=False) if card.reply_markup else None
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO outbox_cards (card_id, text, reply_markup, parse_mode, created_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (broadcast_id, card.text, markup, card.parse_mode, now)
+                )
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO outbox_messages "
+                    "(idempotency_key, chat_id, card_id, next_attempt_at, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                added = self._conn.total_changes - before
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return added
+
+    def fetch_due(self, limit: int = 200) -> List[OutboxMessage]:
+        """보낼 때가 된 메시지 조회 (상태는 그대로 두고 실제로 보낼 때 mark_sending으로 바꿈)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, chat_id, card_id, attempts FROM outbox_messages "
+                "WHERE status = 'pending' AND next_attempt_at <= ? ORDER BY next_attempt_at, id LIMIT ?",
+                (time.time(), limit)
+            ).fetchall()
+        return [OutboxMessage(*row) for row in rows]
+
+    def mark_sending(self, message_id: int):
+        """전송 직전에 sending으로 표시 (종료되면 이 메시지만 unknown 처리됨)"""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox_messages SET status = 'sending', updated_at = ? WHERE id = ? AND status = 'pending'",
+                (time.time(), message_id)
+            )
+
+    def get_card(self, card_id: str) -> Optional[OutboxCard]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, reply_markup, parse_mode FROM outbox_cards WHERE card_id = ?", (card_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return OutboxCard(row[0], json.loads(row[1]) if row[1] else None, row[2])
+
+    def complete(self, sent: List[int], retry: List[OutboxMessage], failed: List[int], error: str = None):
+        """전송 결과 반영 (재시도 대상은 지수 백오프, 최대 시도 횟수를 넘으면 failed)"""
+        now = time.time()
+        retry_rows, give_up = [], list(failed)
+        for message in retry:
+            attempts = message.attempts + 1
+            if attempts >= self.max_attempts:
+                give_up.append(message.id)
+            else:
+                delay = min(self.backoff_max, self.backoff_base ** attempts)
+                retry_rows.append((attempts, now + delay, now, error, message.id))
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "UPDATE outbox_messages SET status = 'sent', attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    [(now, message_id) for message_id in sent]
+                )
+                self._conn.executemany(
+                    "UPDATE outbox_messages SET status = 'pending', attempts = ?, next_attempt_at = ?, "
+                    "updated_at = ?, last_error = ? WHERE id = ?",
+                    retry_rows
+                )
+                self._conn.executemany(
+                    "UPDATE outbox_messages SET status = 'failed', attempts = attempts + 1, updated_at = ?, "
+                    "last_error = ? WHERE id = ?",
+                    [(now, error, message_id) for message_id in give_up]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def recover(self) -> int:
+        """이전 실행에서 전송 중이던 메시지를 unknown으로 표시 (다시 보내지 않음)"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE outbox_messages SET status = 'unknown', updated_at = ? WHERE status = 'sending'",
+                (time.time(),)
+            )
+            count = cursor.rowcount
+        if count:
+            logger.warning(f"전송 중 종료된 메시지 {count}건은 중복 발송을 피하기 위해 다시 보내지 않음")
+        return count
+
+    def purge(self, older_than: float) -> int:
+        """처리가 끝난 오래된 메시지와 참조가 없는 카드 삭제"""
+        cutoff = time.time() - older_than
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "DELETE FROM outbox_messages WHERE status IN ('sent', 'failed', 'unknown') AND updated_at < ?",
+                    (cutoff,)
+                )
+                deleted = cursor.rowcount
+                self._conn.execute(
+                    "DELETE FROM outbox_cards WHERE created_at < ? AND card_id NOT IN "
+                    "(SELECT DISTINCT card_id FROM outbox_messages)",
+                    (cutoff,)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def count_pending(self) -> int:
+        """대기 중인 메시지 수 (재시도 대기 포함)"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM outbox_messages WHERE status = 'pending'").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, int]:
+        """상태별 메시지 수"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox_messages GROUP BY status").fetchall()
+        return dict(rows)
@@ -0,0 +1,276 @@
+"""
+구독자 저장소
+정기 알림 구독자와 종목/키워드 구독을 SQLite(WAL)에 저장해 재시작해도 유지
+- 조회는 스케줄러/구독 색인의 메모리 데이터를 사용하고, 저장소는 시작할 때 한 번만 전부 읽음
+- 변경은 바로 쓰지 않고 모았다가 짧은 간격(flush_interval)마다 한 트랜잭션으로 기록 (그룹 커밋)
+- 같은 사용자/구독의 변경이 한 번에 여러 개 쌓이면 마지막 상태만 기록
+- sync()는 그때까지의 변경이 디스크에 기록될 때까지 기다림 (명령어 응답 전에 호출하면 응답한 변경은 유실되지 않음)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from loguru import logger
+
+from src.utils.config import get_env_float, get_env_str
+
+
+# PRD의 users/subscriptions 테이블을 SQLite에 맞게 옮김
+# (notification_times: 'HH:MM,HH:MM,...', NULL이면 기본 알림 시간)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    notification_times TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subscriptions (
+    user_id INTEGER NOT NULL,
+    subscription_type TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (user_id, subscription_type, value)
+) WITHOUT ROWID;
+"""
+
+
+class UserRow(NamedTuple):
+    """정기 알림 구독자 한 명"""
+    id: int
+    is_active: bool
+    notification_times: Optional[str]  # 'HH:MM,...' (None이면 기본 알림 시간)
+    created_at: float
+
+
+class SubscriptionRow(NamedTuple):
+    """종목/키워드 구독 한 건"""
+    user_id: int
+    subscription_type: str
+    value: str
+
+
+class SubscriberStore:
+    """SQLite 기반 구독자 저장소 (그룹 커밋 방식 쓰기)"""
+
+    def __init__(self, path: str = "data/subscribers.db", flush_interval: float = 0.05):
+        self.path = path
+        self.flush_interval = flush_interval  # 변경을 모으는 시간 (초)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")  # 커밋이 끝나면 전원이 꺼져도 유지 (그룹 커밋으로 비용 분산)
+        self._conn.executescript(SCHEMA)
+
+        # 기록 대기 중인 변경 (None이면 삭제)
+        self._pending_users: Dict[int, Optional[UserRow]] = {}
+        self._pending_subscriptions: Dict[SubscriptionRow, Optional[float]] = {}
+        self._waiters: List[asyncio.Future] = []
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self.commits = 0
+        self.written = 0
+
+    # 읽기 (시작시 한 번)
+
+    def load_users(self) -> List[UserRow]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, is_active, notification_times, created_at FROM users"
+            ).fetchall()
+        return [UserRow(*row) for row in rows]
+
+    def load_subscriptions(self) -> List[SubscriptionRow]:
+        with self._lock:
+            rows = self._conn.execute("SELECT user_id, subscription_type, value FROM subscriptions").fetchall()
+        return [SubscriptionRow(*row) for row in rows]
+
+    # 쓰기 (메모리에 모았다가 그룹 커밋)
+
+    def put_user(self, row: UserRow):
+        self._pending_users[row.id] = row
+        self._notify()
+
+    def delete_user(self, user_id: int):
+        self._pending_users[user_id] = None
+        self._notify()
+
+    def add_subscription(self, row: SubscriptionRow):
+        self._pending_subscriptions[row] = time.time()
+        self._notify()
+
+    def remove_subscription(self, row: SubscriptionRow):
+        self._pending_subscriptions[row] = None
+        self._notify()
+
+    def _notify(self):
+        if self._wake is not None:
+            self._wake.set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending_users) + len(self._pending_subscriptions)
+
+    async def sync(self, timeout: float = 5.0) -> bool:
+        """
+        지금까지의 변경이 기록될 때까지 대기 (쓰기 태스크가 없으면 바로 기록)
+        timeout 안에 기록되지 않거나 기록에 실패하면 False (변경은 남겨 두고 다시 시도)
+        """
+        if self._task is None:
+            try:
+                await asyncio.to_thread(self._flush_pending)
+                return True
+            except Exception as e:
+                logger.error(f"구독자 저장 실패 (대기 {self.pending}건): {e}")
+                return False
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        self._wake.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"구독자 저장이 {timeout}초 안에 끝나지 않음 (대기 {self.pending}건)")
+            return False
+
+    def _take_pending(self) -> Tuple[Dict[int, Optional[UserRow]], Dict[SubscriptionRow, Optional[float]]]:
+        users, subscriptions = self._pending_users, self._pending_subscriptions
+        self._pending_users, self._pending_subscriptions = {}, {}
+        return users, subscriptions
+
+    def _restore_pending(self, users: Dict[int, Optional[UserRow]],
+                         subscriptions: Dict[SubscriptionRow, Optional[float]]):
+        """기록 실패시 되돌림 (그 사이 새로 들어온 변경이 우선)"""
+        for key, value in users.items():
+            self._pending_users.setdefault(key, value)
+        for key, value in subscriptions.items():
+            self._pending_subscriptions.setdefault(key, value)
+
+    def _flush_pending(self):
+        users, subscriptions = self._take_pending()
+        try:
+            self.write(users, subscriptions)
+        except Exception:
+            self._restore_pending(users, subscriptions)
+            raise
+
+    def write(self, users: Dict[int, Optional[UserRow]], subscriptions: Dict[SubscriptionRow, Optional[float]]):
+        """변경 묶음을 한 트랜잭션으로 기록"""
+        if not users and not subscriptions:
+            return
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO users (id, is_active, notification_times, created_at) VALUES (?, ?, ?, ?)",
+                    [row for row in users.values() if row is not None]
+                )
+                self._conn.executemany(
+                    "DELETE FROM users WHERE id = ?",
+                    [(user_id,) for user_id, row in users.items() if row is None]
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO subscriptions (user_id, subscription_type, value, created_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(*row, created_at) for row, created_at in subscriptions.items() if created_at is not None]
+                )
+                self._conn.executemany(
+                    "DELETE FROM subscriptions WHERE user_id = ? AND subscription_type = ? AND value = ?",
+                    [row for row, created_at in subscriptions.items() if created_at is None]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.commits += 1
+        self.written += len(users) + len(subscriptions)
+
+    async def _run(self):
+        while True:
+            await self._wake.wait()
+            await asyncio.sleep(self.flush_interval)  # 그 사이 들어온 변경을 함께 기록
+            self._wake.clear()
+
+            users, subscriptions = self._take_pending()
+            waiters, self._waiters = self._waiters, []
+            try:
+                await asyncio.to_thread(self.write, users, subscriptions)
+            except asyncio.CancelledError:
+                # 기록 도중 stop()으로 취소: 변경과 대기자를 되돌려 stop()의 마지막 기록에서 처리
+                # (이미 기록됐더라도 같은 내용을 다시 쓸 뿐이라 안전)
+                self._restore_pending(users, subscriptions)
+                self._waiters = waiters + self._waiters
+                raise
+            except Exception as e:
+                logger.error(f"구독자 저장 실패 ({len(users) + len(subscriptions)}건, 다시 시도): {e}")
+                self._restore_pending(users, subscriptions)
+                self._waiters = waiters + self._waiters
+                self._wake.set()
+                await asyncio.sleep(1)
+                continue
+
+            for future in waiters:
+                if not future.done():
+                    future.set_result(None)
+
+    def start(self):
+        """그룹 커밋 태스크 시작"""
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        if self.pending:
+            self._wake.set()
+
+    async def stop(self):
+        """남은 변경을 기록하고 종료"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await asyncio.to_thread(self._flush_pending)
+        except Exception as e:
+            # 종료 과정은 계속 진행 (기록하지 못한 변경은 로그로 남김)
+            logger.error(f"종료 전 구독자 저장 실패, 변경 {self.pending}건 유실: {e}")
+        finally:
+            for future in self._waiters:
+                if not future.done():
+                    future.set_result(None)
+            self._waiters = []
+            self._wake = None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def get_stats(self) -> Dict[str, int]:
+        return {'pending': self.pending, 'commits': self.commits, 'written': self.written}
+
+
+# 전역 구독자 저장소 인스턴스
+subscriber_store = None
+
+def get_subscriber_store() -> SubscriberStore:
+    """구독자 저장소 조회 (최초 호출시 생성)"""
+    global subscriber_store
+    if subscriber_store is None:
+        subscriber_store = SubscriberStore(
+            path=get_env_str("SUBSCRIBER_DB_PATH", "data/subscribers.db"),
+            flush_interval=get_env_float("SUBSCRIBER_FLUSH_INTERVAL", 0.05)
+        )
+    return subscriber_store
+
+async def stop_subscriber_store():
+    """남은 변경 기록 후 저장소 닫기"""
+    global subscriber_store
+    if subscriber_store:
+        await subscriber_store.stop()
+        subscriber_store.close()
+        subscriber_store = None
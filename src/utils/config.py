@@ -0,0 +1,51 @@
+"""
+환경 변수 설정 헬퍼
+.env 값에 붙은 인라인 주석(예: `CRAWLING_INTERVAL=300  # 5분`)을 안전하게 처리
+"""
+
+import os
+from typing import Optional
+
+
+def get_env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    """문자열 환경 변수 조회 (인라인 주석 제거)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+
+    # 주석이 있다면 제거
+    if '#' in value:
+        value = value.split('#')[0]
+    value = value.strip()
+
+    return value if value else default
+
+
+def get_env_int(name: str, default: int) -> int:
+    """정수 환경 변수 조회"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default  # 기본값
+
+
+def get_env_float(name: str, default: float) -> float:
+    """실수 환경 변수 조회"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default  # 기본값
+
+
+def get_env_bool(name: str, default: bool) -> bool:
+    """불리언 환경 변수 조회"""
+    value = get_env_str(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
@@ -0,0 +1,222 @@
+"""
+한국거래소(KRX) 장 운영 시간
+시각을 장 시작 전/정규장/장 마감 후/휴장 구간으로 나누어 뉴스 수집 주기, 정기 알림 등에 사용
+- 주말과 KRX 휴장일(내장 표)은 휴장
+- 내장 표는 확정된 공휴일 기준이므로 임시공휴일 등은 로컬 파일(MARKET_HOLIDAYS_PATH)로 추가/취소
+"""
+
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+from loguru import logger
+
+from src.utils.config import get_env_str
+
+
+KST = ZoneInfo("Asia/Seoul")
+
+PRE_MARKET = 'pre_market'    # 장 시작 전 (시간외/동시호가)
+REGULAR = 'regular'          # 정규장
+AFTER_HOURS = 'after_hours'  # 장 마감 후 (시간외 거래)
+CLOSED = 'closed'            # 휴장 (야간, 주말)
+
+# 평일 구간 (시작, 끝, 구간)
+SESSIONS = [
+    (time(8, 0), time(9, 0), PRE_MARKET),
+    (time(9, 0), time(15, 30), REGULAR),
+    (time(15, 30), time(18, 0), AFTER_HOURS),
+]
+BOUNDARIES = sorted({t for start, end, _ in SESSIONS for t in (start, end)})
+
+# KRX 휴장일 (주말 제외, 대체공휴일/선거일/연말 휴장 포함)
+KRX_HOLIDAYS: Dict[date, str] = {
+    date(2025, 1, 1): "신정",
+    date(2025, 1, 27): "임시공휴일",
+    date(2025, 1, 28): "설날",
+    date(2025, 1, 29): "설날",
+    date(2025, 1, 30): "설날",
+    date(2025, 3, 3): "삼일절 대체공휴일",
+    date(2025, 5, 1): "근로자의 날",
+    date(2025, 5, 5): "어린이날/부처님오신날",
+    date(2025, 5, 6): "대체공휴일",
+    date(2025, 6, 3): "대통령 선거",
+    date(2025, 6, 6): "현충일",
+    date(2025, 8, 15): "광복절",
+    date(2025, 10, 3): "개천절",
+    date(2025, 10, 6): "추석",
+    date(2025, 10, 7): "추석",
+    date(2025, 10, 8): "추석 대체공휴일",
+    date(2025, 10, 9): "한글날",
+    date(2025, 12, 25): "성탄절",
+    date(2025, 12, 31): "연말 휴장",
+    date(2026, 1, 1): "신정",
+    date(2026, 2, 16): "설날",
+    date(2026, 2, 17): "설날",
+    date(2026, 2, 18): "설날",
+    date(2026, 3, 2): "삼일절 대체공휴일",
+    date(2026, 5, 1): "근로자의 날",
+    date(2026, 5, 5): "어린이날",
+    date(2026, 5, 25): "부처님오신날 대체공휴일",
+    date(2026, 6, 3): "전국동시지방선거",
+    date(2026, 8, 17): "광복절 대체공휴일",
+    date(2026, 9, 24): "추석",
+    date(2026, 9, 25): "추석",
+    date(2026, 10, 5): "개천절 대체공휴일",
+    date(2026, 10, 9): "한글날",
+    date(2026, 12, 25): "성탄절",
+    date(2026, 12, 31): "연말 휴장",
+    date(2027, 1, 1): "신정",
+    date(2027, 2, 8): "설날",
+    date(2027, 2, 9): "설날 대체공휴일",
+    date(2027, 3, 1): "삼일절",
+    date(2027, 5, 5): "어린이날",
+    date(2027, 5, 13): "부처님오신날",
+    date(2027, 8, 16): "광복절 대체공휴일",
+    date(2027, 9, 14): "추석",
+    date(2027, 9, 15): "추석",
+    date(2027, 9, 16): "추석",
+    date(2027, 10, 4): "개천절 대체공휴일",
+    date(2027, 10, 11): "한글날 대체공휴일",
+    date(2027, 12, 27): "성탄절 대체공휴일",
+    date(2027, 12, 31): "연말 휴장",
+}
+HOLIDAY_TABLE_YEARS = {day.year for day in KRX_HOLIDAYS}
+
+
+def now_kst() -> datetime:
+    """현재 한국 시각"""
+    return datetime.now(KST)
+
+
+def _to_kst(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return now_kst()
+    if now.tzinfo is None:
+        return now.replace(tzinfo=KST)  # 시간대 없는 시각은 한국 시각으로 간주
+    return now.astimezone(KST)
+
+
+def load_holiday_overrides(path: str) -> Tuple[Dict[date, str], set]:
+    """
+    로컬 휴장일 파일 읽기 (한 줄에 하나, # 뒤는 주석)
+    `2026-07-17 제헌절`은 휴장일 추가, `!2026-06-03`은 내장 표의 휴장일 취소 (정상 개장)
+    """
+    added: Dict[date, str] = {}
+    removed = set()
+    with open(path, encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            line = line.split('#')[0].strip()
+            if not line:
+                continue
+            cancel = line.startswith('!')
+            value, _, name = line.lstrip('!').strip().partition(' ')
+            try:
+                day = date.fromisoformat(value)
+            except ValueError:
+                logger.warning(f"휴장일 파일 {path}:{number} 날짜 형식 오류: {line}")
+                continue
+            if cancel:
+                removed.add(day)
+                added.pop(day, None)
+            else:
+                added[day] = name.strip() or "휴장"
+                removed.discard(day)
+    return added, removed
+
+
+_holidays: Optional[Dict[date, str]] = None
+_warned_years = set()
+
+def get_holidays() -> Dict[date, str]:
+    """휴장일 표 (내장 표 + 로컬 파일, 최초 호출시 구성)"""
+    global _holidays
+    if _holidays is None:
+        holidays = dict(KRX_HOLIDAYS)
+        path = get_env_str("MARKET_HOLIDAYS_PATH", "data/market_holidays.txt")
+        if path and os.path.exists(path):
+            try:
+                added, removed = load_holiday_overrides(path)
+                holidays.update(added)
+                for day in removed:
+                    holidays.pop(day, None)
+                logger.info(f"로컬 휴장일 파일 적용: 추가 {len(added)}일, 취소 {len(removed)}일 ({path})")
+            except OSError as e:
+                logger.error(f"로컬 휴장일 파일 읽기 실패: {e}")
+        _holidays = holidays
+    return _holidays
+
+def reload_holidays():
+    """휴장일 표 다시 구성 (로컬 파일 수정 후)"""
+    global _holidays
+    _holidays = None
+    return get_holidays()
+
+
+def holiday_name(day: Union[date, datetime]) -> Optional[str]:
+    """휴장일 이름 (휴장일이 아니면 None)"""
+    if isinstance(day, datetime):
+        day = _to_kst(day).date()
+    return get_holidays().get(day)
+
+
+def is_trading_day(day: Union[date, datetime]) -> bool:
+    """거래일 여부 (주말, KRX 휴장일 휴장)"""
+    if isinstance(day, datetime):
+        day = _to_kst(day).date()
+    if day.weekday() >= 5:
+        return False
+    if day.year not in HOLIDAY_TABLE_YEARS and day.year not in _warned_years:
+        _warned_years.add(day.year)
+        logger.warning(f"{day.year}년 KRX 휴장일이 내장 표에 없음 (주말만 휴장으로 처리, MARKET_HOLIDAYS_PATH로 추가 가능)")
+    return day not in get_holidays()
+
+
+def next_trading_day(day: Union[date, datetime], include_today: bool = False) -> date:
+    """다음 거래일"""
+    if isinstance(day, datetime):
+        day = _to_kst(day).date()
+    if not include_today:
+        day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    return day
+
+
+def get_session(now: Optional[datetime] = None) -> str:
+    """현재 장 운영 구간"""
+    now = _to_kst(now)
+    if not is_trading_day(now):
+        return CLOSED
+
+    current = now.time()
+    for start, end, session in SESSIONS:
+        if start <= current < end:
+            return session
+    return CLOSED
+
+
+def next_session_change(now: Optional[datetime] = None) -> Tuple[datetime, str]:
+    """다음 구간이 바뀌는 시각과 바뀐 뒤의 구간"""
+    now = _to_kst(now)
+    current = get_session(now)
+
+    # 구간 경계는 하루에 몇 개뿐이라 앞으로 15일간(긴 연휴 포함)의 경계를 순서대로 확인
+    for day_offset in range(15):
+        day = (now + timedelta(days=day_offset)).date()
+        for boundary in BOUNDARIES:
+            moment = datetime.combine(day, boundary, tzinfo=KST)
+            if moment <= now:
+                continue
+            session = get_session(moment)
+            if session != current:
+                return moment, session
+
+    return now + timedelta(days=15), current
+
+
+def seconds_until_session_change(now: Optional[datetime] = None) -> float:
+    """다음 구간 변경까지 남은 시간 (초)"""
+    now = _to_kst(now)
+    moment, _ = next_session_change(now)
+    return max(0.0, (moment - now).total_seconds())
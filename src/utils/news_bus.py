@@ -0,0 +1,133 @@
+"""
+뉴스 버스
+한 번 수집/분석한 뉴스를 모니터, 스케줄러, 통계 등 여러 기능에 나눠 주는 프로세스 내 발행/구독 버스
+- 수집기(뉴스 모니터)가 수집할 때마다 NewsBatch를 발행
+- 구독자마다 크기가 정해진 큐를 가지며, 큐가 차면 발행자가 기다리거나(기본) 가장 오래된 묶음을 버림
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+from loguru import logger
+
+from src.utils.config import get_env_float
+
+
+class NewsBatch(NamedTuple):
+    """한 번의 수집 결과"""
+    new: List[Dict[str, Any]]     # 처음 보는 기사 (중복 제거 후)
+    latest: List[Dict[str, Any]]  # 이번 수집의 최신 기사 목록 (최신순)
+    crawled_at: float             # 수집 시각 (epoch 초)
+
+
+class Subscription:
+    """구독자 큐와 전달 통계"""
+
+    def __init__(self, name: str, maxsize: int, drop_oldest: bool):
+        self.name = name
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.drop_oldest = drop_oldest  # True면 큐가 찼을 때 가장 오래된 묶음을 버림
+        self.delivered = 0
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class NewsBus:
+    """뉴스 발행/구독 버스"""
+
+    def __init__(self, publish_timeout: float = 5.0):
+        self.publish_timeout = publish_timeout  # 큐가 찬 구독자를 기다리는 최대 시간 (초)
+        self._subscriptions: Dict[str, Subscription] = {}
+        self.last_batch: Optional[NewsBatch] = None
+        self.published = 0
+
+    def subscribe(self, name: str, maxsize: int = 100, drop_oldest: bool = False) -> Subscription:
+        """구독 추가 (같은 이름이 있으면 교체)"""
+        self.unsubscribe(name)
+        subscription = Subscription(name, maxsize, drop_oldest)
+        self._subscriptions[name] = subscription
+        return subscription
+
+    def unsubscribe(self, name: str):
+        """구독 해제 (소비 태스크도 취소)"""
+        subscription = self._subscriptions.pop(name, None)
+        if subscription and subscription.task:
+            subscription.task.cancel()
+
+    def consume(self, name: str, handler: Callable[[NewsBatch], Awaitable[None]],
+                maxsize: int = 100, drop_oldest: bool = False) -> Subscription:
+        """구독 후 큐에 들어오는 묶음마다 handler를 실행하는 소비 태스크 시작"""
+        subscription = self.subscribe(name, maxsize, drop_oldest)
+        subscription.task = asyncio.create_task(self._run_consumer(subscription, handler))
+        return subscription
+
+    async def _run_consumer(self, subscription: Subscription, handler: Callable[[NewsBatch], Awaitable[None]]):
+        while True:
+            batch = await subscription.queue.get()
+            try:
+                await handler(batch)
+            except Exception as e:
+                logger.error(f"뉴스 버스 구독자 {subscription.name} 처리 오류: {e}")
+            finally:
+                subscription.queue.task_done()
+
+    async def publish(self, batch: NewsBatch):
+        """모든 구독자에게 묶음 전달 (큐가 찬 구독자는 publish_timeout까지 기다림)"""
+        self.last_batch = batch
+        self.published += 1
+        subscriptions = list(self._subscriptions.values())
+        if subscriptions:
+            await asyncio.gather(*(self._deliver(subscription, batch) for subscription in subscriptions))
+
+    async def _deliver(self, subscription: Subscription, batch: NewsBatch):
+        queue = subscription.queue
+        if subscription.drop_oldest:
+            while queue.full():
+                queue.get_nowait()
+                queue.task_done()
+                subscription.dropped += 1
+            queue.put_nowait(batch)
+            subscription.delivered += 1
+            return
+
+        try:
+            await asyncio.wait_for(queue.put(batch), timeout=self.publish_timeout)
+            subscription.delivered += 1
+        except asyncio.TimeoutError:
+            subscription.dropped += 1
+            logger.warning(f"뉴스 버스 구독자 {subscription.name} 큐가 가득 차서 묶음을 버림 "
+                           f"(대기 {queue.qsize()}개)")
+
+    async def close(self):
+        """모든 소비 태스크 중지"""
+        tasks = [sub.task for sub in self._subscriptions.values() if sub.task]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._subscriptions.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """발행 수와 구독자별 대기/전달/버림 수"""
+        return {
+            'published': self.published,
+            'last_published_at': self.last_batch.crawled_at if self.last_batch else None,
+            'subscribers': {
+                name: {
+                    'pending': sub.queue.qsize(),
+                    'delivered': sub.delivered,
+                    'dropped': sub.dropped
+                }
+                for name, sub in self._subscriptions.items()
+            }
+        }
+
+
+# 전역 뉴스 버스 인스턴스
+news_bus = None
+
+def get_news_bus() -> NewsBus:
+    """뉴스 버스 조회 (최초 호출시 생성)"""
+    global news_bus
+    if news_bus is None:
+        news_bus = NewsBus(publish_timeout=get_env_float("NEWS_BUS_PUBLISH_TIMEOUT", 5.0))
+    return news_bus
@@ -0,0 +1,58 @@
+"""
+뉴스 통계
+뉴스 버스를 구독해서 새 기사 수, 소스/감정별 분포, 발행 후 감지까지 걸린 시간을 집계
+"""
+
+from collections import Counter
+from typing import Any, Dict
+from loguru import logger
+
+from src.utils.news_bus import NewsBatch, get_news_bus
+
+
+class NewsMetrics:
+    """새 기사 통계 집계기"""
+
+    def __init__(self):
+        self.batches = 0
+        self.new_articles = 0
+        self.by_source: Counter = Counter()
+        self.by_sentiment: Counter = Counter()
+        self._lag_total = 0.0  # 발행 시각을 아는 기사의 발행 -> 감지 지연 합 (초)
+        self._lag_count = 0
+
+    async def on_batch(self, batch: NewsBatch):
+        """뉴스 버스 묶음 집계"""
+        self.batches += 1
+        for news in batch.new:
+            self.new_articles += 1
+            self.by_source[news.get('source', '알 수 없음')] += 1
+            self.by_sentiment[news.get('sentiment', 'neutral')] += 1
+            if news.get('published'):
+                self._lag_total += max(0.0, batch.crawled_at - news['timestamp'])
+                self._lag_count += 1
+
+    def start(self):
+        """뉴스 버스 구독 시작 (통계는 늦어도 되므로 큐가 차면 오래된 묶음부터 버림)"""
+        get_news_bus().consume('metrics', self.on_batch, maxsize=20, drop_oldest=True)
+        logger.info("뉴스 통계 구독 시작")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'batches': self.batches,
+            'new_articles': self.new_articles,
+            'by_source': dict(self.by_source.most_common()),
+            'by_sentiment': dict(self.by_sentiment),
+            'avg_detect_lag': self._lag_total / self._lag_count if self._lag_count else None
+        }
+
+
+# 전역 뉴스 통계 인스턴스
+news_metrics = None
+
+def get_news_metrics() -> NewsMetrics:
+    """뉴스 통계 조회 (최초 호출시 생성)"""
+    global news_metrics
+    if news_metrics is None:
+        news_metrics = NewsMetrics()
+    return news_metrics
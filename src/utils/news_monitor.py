@@ -1,32 +1,184 @@
 """
 뉴스 모니터링 모듈
+주기적으로 뉴스를 수집해서 새 기사를 뉴스 버스에 발행하고,
 새로운 뉴스가 3개 이상 쌓이면 자동으로 알림을 전송하는 시스템
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Set
+import json
+import struct
+import time
+import zlib
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from loguru import logger
-import hashlib
+
+from src.bot.news_cards import render_card
+from src.crawler.article_id import article_key, canonical_article_id
+from src.crawler.dedup import NearDuplicateIndex
+from src.utils.config import get_env_float, get_env_int, get_env_str
+from src.utils.market_calendar import AFTER_HOURS, CLOSED, PRE_MARKET, REGULAR, get_session, seconds_until_session_change
+from src.utils.news_bus import NewsBatch, get_news_bus
+from src.utils.seen_store import SeenStore
+from src.utils.state_file import read_snapshot, write_snapshot
+
+
+STATE_MAGIC = b'NMS1'  # 모니터 상태 스냅샷 형식
+
+
+URGENT_MARKERS = ('속보', '긴급', '단독', '특보')  # 제목에 있으면 중요도 가산
+
+
+def news_importance(news: Dict[str, Any]) -> float:
+    """
+    알림 우선순위 점수
+    감정 강도(|감정 점수|) + 속보/단독 가산점 + 최신성 (30분 늦게 나온 기사는 1점 높음)
+    최신성 항을 발행 시각에 비례하게 두어 시간이 지나도 기사끼리의 순서가 바뀌지 않음
+    """
+    title = news.get('title', '')
+    score = abs(news.get('sentiment_score', 0.0))
+    if any(marker in title for marker in URGENT_MARKERS):
+        score += 3.0
+    return score + news.get('timestamp', 0) / 1800
+
+
+class AlertBuffer:
+    """
+    긴급 알림 대기 버퍼
+    - 중요도 순서로 최대 capacity개 유지 (넘치면 중요도가 가장 낮은 기사 제거)
+    - 같은 기사(기사 키)가 다시 들어오면 새 내용으로 교체
+    - max_age초보다 오래된 기사는 꺼낼 때 제외
+    """
+    
+    def __init__(self, capacity: int = 20, max_age: float = 3600):
+        self.capacity = capacity
+        self.max_age = max_age
+        self._items: Dict[Any, Tuple[float, Dict[str, Any]]] = {}  # 기사 키 -> (중요도, 뉴스)
+        self.evicted = 0
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def add(self, news: Dict[str, Any]):
+        key = news.get('article_key', news.get('url'))
+        self._items[key] = (news_importance(news), news)
+        if len(self._items) > self.capacity:
+            lowest = min(self._items, key=lambda k: self._items[k][0])
+            del self._items[lowest]
+            self.evicted += 1
+    
+    def extend(self, news_list: List[Dict[str, Any]]):
+        for news in news_list:
+            self.add(news)
+    
+    def prune(self, now: float = None):
+        """오래된 기사 제거"""
+        now = time.time() if now is None else now
+        for key in [k for k, (_, news) in self._items.items() if now - news.get('timestamp', now) > self.max_age]:
+            del self._items[key]
+    
+    def top(self, limit: int) -> List[Dict[str, Any]]:
+        """중요도 높은 순으로 최대 limit개"""
+        ranked = sorted(self._items.values(), key=lambda item: item[0], reverse=True)
+        return [news for _, news in ranked[:limit]]
+    
+    def items(self) -> List[Dict[str, Any]]:
+        """전체 기사 (중요도 순)"""
+        return self.top(len(self._items))
+    
+    def drain(self) -> List[Dict[str, Any]]:
+        """전체 기사를 중요도 순으로 꺼내고 버퍼 비우기"""
+        news_list = self.items()
+        self._items.clear()
+        return news_list
+    
+    def clear(self):
+        self._items.clear()
+
+
+class AdaptivePollInterval:
+    """
+    새 기사 도착률과 장 운영 구간에 따라 수집 간격 결정
+    - 수집 1회당 새 기사 수의 지수가중이동평균(EWMA)을 유지
+    - 구간별 기본 간격을 (1 + 도착률)로 나눠 기사가 많이 들어올수록 자주 수집
+    - 도착률이 quiet_rate보다 낮으면(변화 없음) 기본 간격의 quiet_factor배로 늘림
+    - 결과는 [min_interval, max_interval] 범위로 제한
+    """
+    
+    def __init__(self, base_intervals: Dict[str, float], min_interval: float = 30,
+                 max_interval: float = 1800, alpha: float = 0.3, quiet_rate: float = 0.2,
+                 quiet_factor: float = 2.0):
+        self.base_intervals = base_intervals
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.alpha = alpha
+        self.quiet_rate = quiet_rate
+        self.quiet_factor = quiet_factor
+        self.rate = 1.0  # 수집 1회당 새 기사 수 EWMA (시작은 보통 수준으로 가정)
+    
+    def update(self, new_count: int, now: datetime = None) -> float:
+        """이번 수집의 새 기사 수를 반영하고 다음 수집까지 간격(초) 반환"""
+        self.rate = self.alpha * new_count + (1 - self.alpha) * self.rate
+        return self.interval(now)
+    
+    def interval(self, now: datetime = None) -> float:
+        base = self.base_intervals[get_session(now)]
+        if self.rate < self.quiet_rate:
+            interval = base * self.quiet_factor
+        else:
+            interval = base / (1 + self.rate)
+        return min(self.max_interval, max(self.min_interval, interval))
 
 
 class NewsMonitor:
     def __init__(self, bot_instance, check_interval: int = 300):  # 5분마다 체크
         self.bot = bot_instance
-        self.check_interval = check_interval  # 체크 간격 (초)
-        self.known_news_hashes: Set[str] = set()  # 알려진 뉴스 해시
-        self.new_news_buffer: List[Dict[str, Any]] = []  # 새 뉴스 버퍼
+        self.check_interval = check_interval  # 현재 체크 간격 (초, 수집할 때마다 조정)
+        self.poll_interval = AdaptivePollInterval(
+            base_intervals={
+                PRE_MARKET: get_env_float("MONITOR_INTERVAL_EXTENDED", 120),
+                REGULAR: get_env_float("MONITOR_INTERVAL_REGULAR", 60),
+                AFTER_HOURS: get_env_float("MONITOR_INTERVAL_EXTENDED", 120),
+                CLOSED: get_env_float("MONITOR_INTERVAL_CLOSED", 900),
+            },
+            min_interval=get_env_float("MONITOR_MIN_INTERVAL", 30),
+            max_interval=get_env_float("MONITOR_MAX_INTERVAL", 1800),
+            alpha=get_env_float("MONITOR_RATE_ALPHA", 0.3)
+        )
+        # 알려진 기사 (고정 기사 키, 보존 기간이 있는 고정 크기 저장소)
+        self.known_articles = SeenStore(
+            capacity=get_env_int("MONITOR_SEEN_CAPACITY", 100000),
+            error_rate=get_env_float("MONITOR_SEEN_ERROR_RATE", 0.001),
+            retention_seconds=get_env_float("MONITOR_SEEN_RETENTION_HOURS", 48) * 3600
+        )
+        # 새 뉴스 버퍼 (중요도 순, 크기 제한)
+        self.new_news_buffer = AlertBuffer(
+            capacity=get_env_int("ALERT_BUFFER_SIZE", 20),
+            max_age=get_env_float("ALERT_MAX_AGE", 3600)
+        )
+        self.alert_batch_size = 5  # 알림 1회에 보내는 최대 뉴스 수
+        self._flush_task = None  # 알림 간격이 끝나는 시각에 보내는 지연 알림
         self.min_news_threshold = 3  # 최소 뉴스 개수 임계값
         self.is_running = False
         self.monitor_task = None
         self.last_notification_time = None
         self.min_notification_interval = 600  # 최소 알림 간격 (10분)
+        # 최근 기사 유사 중복 인덱스 (여러 언론사가 같은 기사를 조금씩 바꿔 낸 경우 한 번만 알림)
+        self.duplicate_index = NearDuplicateIndex(
+            threshold=get_env_float("DEDUP_SIMILARITY", 0.6),
+            window_size=get_env_int("DEDUP_WINDOW_SIZE", 10000),
+            window_seconds=get_env_float("DEDUP_WINDOW_SECONDS", 86400)
+        )
+        # 상태 스냅샷 (재시작시 초기 크롤링 없이 복원)
+        self.state_path = get_env_str("MONITOR_STATE_PATH", "data/monitor_state.bin")
+        self.state_save_interval = get_env_float("MONITOR_STATE_INTERVAL", 300)
+        self._last_state_save = 0.0
         
-    def _generate_news_hash(self, news: Dict[str, Any]) -> str:
-        """뉴스 고유 해시 생성"""
-        # 제목과 시간을 조합해서 고유 해시 생성
-        content = f"{news.get('title', '')}{news.get('time', '')}"
-        return hashlib.md5(content.encode()).hexdigest()
+    def _news_key(self, news: Dict[str, Any]) -> int:
+        """뉴스 고유 키 (크롤러가 붙인 고정 기사 키, 없으면 링크에서 계산)"""
+        if 'article_key' in news:
+            return news['article_key']
+        return article_key(canonical_article_id(news.get('url', '')))
     
     async def start_monitoring(self):
         """뉴스 모니터링 시작"""
@@ -35,8 +187,11 @@ class NewsMonitor:
             return
         
         self.is_running = True
+        # 알림은 뉴스 버스 구독자로 처리 (큐가 차면 수집 루프가 기다림)
+        get_news_bus().consume('monitor', self._on_news_batch, maxsize=get_env_int("NEWS_BUS_QUEUE_SIZE", 100))
         self.monitor_task = asyncio.create_task(self._monitoring_loop())
-        logger.info(f"🔍 뉴스 모니터링 시작 - {self.check_interval}초마다 체크, {self.min_news_threshold}개 이상 새 뉴스시 알림")
+        logger.info(f"🔍 뉴스 모니터링 시작 - {self.poll_interval.min_interval:.0f}~{self.poll_interval.max_interval:.0f}초 간격으로 체크, "
+                    f"{self.min_news_threshold}개 이상 새 뉴스시 알림")
     
     async def stop_monitoring(self):
         """뉴스 모니터링 중지"""
@@ -47,18 +202,30 @@ class NewsMonitor:
                 await self.monitor_task
             except asyncio.CancelledError:
                 pass
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        get_news_bus().unsubscribe('monitor')
+        await self.save_state()
         logger.info("🛑 뉴스 모니터링 중지됨")
     
     async def _monitoring_loop(self):
         """뉴스 모니터링 메인 루프"""
         try:
-            # 첫 실행시 기존 뉴스들로 해시 초기화
-            await self._initialize_known_news()
+            # 저장된 상태가 있으면 복원, 없으면 기존 뉴스들로 초기화
+            if not await self._restore_state():
+                await self._initialize_known_news()
             
             while self.is_running:
                 try:
-                    await self._check_for_new_news()
-                    await asyncio.sleep(self.check_interval)
+                    new_count = await self._check_for_new_news()
+                    if time.time() - self._last_state_save >= self.state_save_interval:
+                        await self.save_state()
+                    
+                    # 도착률/장 구간으로 다음 간격 결정 (구간이 바뀌면 바로 다시 계산하도록 경계에서 깨어남)
+                    if new_count is not None:
+                        self.check_interval = self.poll_interval.update(new_count)
+                    await asyncio.sleep(min(self.check_interval, seconds_until_session_change() + 1))
                 except Exception as e:
                     logger.error(f"뉴스 모니터링 중 오류: {e}")
                     await asyncio.sleep(60)  # 오류시 1분 대기
@@ -71,59 +238,151 @@ class NewsMonitor:
     async def _initialize_known_news(self):
         """기존 뉴스로 해시 초기화"""
         try:
-            from src.crawler.news_crawler import get_stock_news
-            current_news = await get_stock_news(20)  # 더 많은 뉴스로 초기화
+            from src.crawler.news_crawler import get_news_cache
+            current_news = (await get_news_cache().refresh())[:20]  # 더 많은 뉴스로 초기화
             
             for news in current_news:
-                news_hash = self._generate_news_hash(news)
-                self.known_news_hashes.add(news_hash)
+                news_key = self._news_key(news)
+                self.known_articles.add(news_key)
+                self.duplicate_index.add(news_key, news.get('title', ''))
             
-            logger.info(f"📋 기존 뉴스 {len(self.known_news_hashes)}개로 모니터링 초기화")
+            logger.info(f"📋 기존 뉴스 {len(self.known_articles)}개로 모니터링 초기화")
             
         except Exception as e:
             logger.error(f"뉴스 초기화 오류: {e}")
     
-    async def _check_for_new_news(self):
-        """새로운 뉴스 확인"""
+    def _encode_state(self) -> bytes:
+        """스냅샷 내용 (JSON 메타데이터 길이 + JSON + 본 기사 필터, 비어 있는 비트가 많아 zlib 압축)"""
+        meta = json.dumps({
+            'saved_at': time.time(),
+            'last_notification_time': self.last_notification_time.isoformat() if self.last_notification_time else None,
+            'new_news_buffer': self.new_news_buffer.items()
+        }, ensure_ascii=False).encode()
+        return zlib.compress(struct.pack('<I', len(meta)) + meta + self.known_articles.dump(), 1)
+    
+    async def save_state(self):
+        """모니터 상태 스냅샷 저장 (파일 쓰기는 스레드에서 실행)"""
+        try:
+            payload = self._encode_state()
+            await asyncio.to_thread(write_snapshot, self.state_path, STATE_MAGIC, payload)
+            self._last_state_save = time.time()
+            logger.debug(f"모니터 상태 저장: {self.state_path} ({len(payload):,}바이트)")
+        except Exception as e:
+            logger.error(f"모니터 상태 저장 오류: {e}")
+    
+    async def _restore_state(self) -> bool:
+        """저장된 상태 복원 (없거나 손상됐으면 False)"""
+        try:
+            payload = await asyncio.to_thread(read_snapshot, self.state_path, STATE_MAGIC)
+            if payload is None:
+                return False
+            payload = zlib.decompress(payload)
+            
+            (meta_length,) = struct.unpack_from('<I', payload)
+            meta = json.loads(payload[4:4 + meta_length].decode())
+            if not self.known_articles.restore(payload[4 + meta_length:]):
+                logger.warning("저장된 본 기사 필터 설정이 현재 설정과 달라 복원하지 않음")
+                return False
+            
+            self.new_news_buffer.extend(meta.get('new_news_buffer', []))
+            if meta.get('last_notification_time'):
+                self.last_notification_time = datetime.fromisoformat(meta['last_notification_time'])
+            
+            # 종료 전에 미뤄 둔 알림이 있으면 남은 알림 간격 뒤에 전송
+            if len(self.new_news_buffer) >= self.min_news_threshold:
+                self._schedule_flush(self._cooldown_remaining(datetime.now()))
+            
+            age = time.time() - meta.get('saved_at', 0)
+            logger.info(f"📋 모니터 상태 복원: 기사 {len(self.known_articles)}개, "
+                        f"대기 뉴스 {len(self.new_news_buffer)}개 ({age / 60:.0f}분 전 저장)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"모니터 상태 복원 오류: {e}")
+            return False
+    
+    async def _check_for_new_news(self) -> Optional[int]:
+        """새로운 뉴스 확인 후 뉴스 버스에 발행 (새 뉴스 수 반환, 수집 실패시 None)"""
         try:
-            from src.crawler.news_crawler import get_stock_news
-            current_news = await get_stock_news(10)
+            # 캐시 TTL 안에서는 같은 결과만 돌아오므로 매 확인마다 새로 크롤링 (명령어 조회와는 결과 공유)
+            from src.crawler.news_crawler import get_news_cache
+            current_news = (await get_news_cache().refresh())[:10]
             
             if not current_news:
-                return
+                return None
             
             new_news_count = 0
             new_news_list = []
             
             # 새로운 뉴스 감지
             for news in current_news:
-                news_hash = self._generate_news_hash(news)
+                news_key = self._news_key(news)
                 
-                if news_hash not in self.known_news_hashes:
+                if self.known_articles.add(news_key):
+                    # 최근 알린 기사와 거의 같은 기사면 건너뛰기
+                    if self.duplicate_index.check_and_add(news_key, news.get('title', '')) is not None:
+                        logger.debug(f"유사 중복 뉴스 제외: {news.get('title', '')}")
+                        continue
+                    
                     # 새로운 뉴스 발견!
-                    self.known_news_hashes.add(news_hash)
                     new_news_list.append(news)
                     new_news_count += 1
             
             if new_news_count > 0:
                 logger.info(f"🆕 새로운 뉴스 {new_news_count}개 감지")
-                self.new_news_buffer.extend(new_news_list)
-                
-                # 임계값 도달 확인
-                if len(self.new_news_buffer) >= self.min_news_threshold:
-                    await self._send_new_news_notification()
+            
+            # 새 뉴스가 없어도 최신 목록은 발행 (스케줄러 등이 다시 수집하지 않도록)
+            await get_news_bus().publish(NewsBatch(new_news_list, current_news, time.time()))
+            return new_news_count
             
         except Exception as e:
             logger.error(f"새 뉴스 확인 중 오류: {e}")
+            return None
+    
+    async def _on_news_batch(self, batch: NewsBatch):
+        """뉴스 버스 구독: 새 뉴스를 버퍼에 쌓고 임계값 도달시 알림"""
+        if not batch.new:
+            return
+        
+        self.new_news_buffer.extend(batch.new)
+        
+        # 임계값 도달 확인
+        if len(self.new_news_buffer) >= self.min_news_threshold:
+            await self._send_new_news_notification()
+    
+    def _cooldown_remaining(self, current_time: datetime) -> float:
+        """최소 알림 간격까지 남은 시간 (초)"""
+        if not self.last_notification_time:
+            return 0.0
+        elapsed = (current_time - self.last_notification_time).total_seconds()
+        return max(0.0, self.min_notification_interval - elapsed)
+    
+    def _schedule_flush(self, delay: float):
+        """delay초 뒤 대기 중인 뉴스 알림 예약 (이미 예약돼 있으면 유지)"""
+        if self._flush_task and not self._flush_task.done():
+            return
+        self._flush_task = asyncio.create_task(self._deferred_flush(delay))
+    
+    async def _deferred_flush(self, delay: float):
+        await asyncio.sleep(delay)
+        self._flush_task = None
+        if len(self.new_news_buffer) >= self.min_news_threshold:
+            await self._send_new_news_notification()
     
     async def _send_new_news_notification(self):
         """새 뉴스 알림 전송"""
         try:
-            # 최소 알림 간격 체크
+            # 최소 알림 간격 체크 (미충족이면 간격이 끝나는 시각에 전송 예약)
             current_time = datetime.now()
-            if (self.last_notification_time and 
-                (current_time - self.last_notification_time).total_seconds() < self.min_notification_interval):
-                logger.info(f"⏰ 최소 알림 간격({self.min_notification_interval}초) 미충족, 알림 지연")
+            remaining = self._cooldown_remaining(current_time)
+            if remaining > 0:
+                self._schedule_flush(remaining)
+                logger.info(f"⏰ 최소 알림 간격({self.min_notification_interval}초) 미충족, {remaining:.0f}초 뒤 알림 예약")
+                return
+            
+            # 너무 오래된 뉴스는 알리지 않음
+            self.new_news_buffer.prune()
+            if len(self.new_news_buffer) < self.min_news_threshold:
                 return
             
             # 활성 구독자 확인
@@ -131,91 +390,43 @@ class NewsMonitor:
                 logger.warning("스케줄러가 없어서 구독자 확인 불가")
                 return
             
-            active_subscribers = []
-            for user_id, info in self.bot.scheduler.subscribers.items():
-                if info.get('enabled', True):
-                    active_subscribers.append(user_id)
+            active_subscribers = self.bot.scheduler.get_enabled_subscribers()
+            
+            # 알림 대상 (채널 방식이면 채널 하나)
+            from src.bot.delivery import broadcast_targets, enqueue_broadcast
+            targets = broadcast_targets(active_subscribers)
             
-            if not active_subscribers:
+            if not targets:
                 logger.info("📭 활성 구독자가 없어서 알림 전송 안함")
                 self.new_news_buffer.clear()  # 버퍼 비우기
                 return
             
-            # 새 뉴스 알림 전송
-            news_count = len(self.new_news_buffer)
-            logger.info(f"🚨 긴급 뉴스 알림 전송: {news_count}개 뉴스, {len(active_subscribers)}명에게")
+            # 새 뉴스 알림 전송 (중요도 높은 순으로 최대 5개, 나머지는 이번 알림으로 대체된 것으로 보고 버림)
+            # 전송 중 들어오는 뉴스는 다음 알림에 포함되도록 먼저 버퍼를 비우고 시간 업데이트
+            pending_news = self.new_news_buffer.drain()
+            news_count = len(pending_news)
+            top_news = pending_news[:self.alert_batch_size]
+            self.last_notification_time = current_time
+            logger.info(f"🚨 긴급 뉴스 알림 전송: {news_count}개 뉴스, 대상 {len(targets)}곳")
             
-            success_count = 0
-            for user_id in active_subscribers:
-                try:
-                    await self._send_urgent_news_to_user(user_id, self.new_news_buffer[:5])  # 최대 5개
-                    success_count += 1
-                    await asyncio.sleep(0.1)  # API 제한 고려
-                except Exception as e:
-                    logger.error(f"사용자 {user_id}에게 긴급 알림 전송 실패: {e}")
+            # 카드는 한 번만 만들고 발송 대기열에 등록 (전송 워커가 한도 안에서 동시 전송)
+            card = render_card('urgent', top_news)
+            broadcast_id = f"urgent:{current_time.strftime('%Y%m%d%H%M%S')}"
+            queued = await enqueue_broadcast(broadcast_id, card, targets)
             
-            logger.info(f"🚨 긴급 뉴스 알림 완료: {success_count}/{len(active_subscribers)}명")
-            
-            # 버퍼 비우기 및 시간 업데이트
-            self.new_news_buffer.clear()
-            self.last_notification_time = current_time
+            logger.info(f"🚨 긴급 뉴스 알림 발송 등록: {queued}/{len(targets)}곳")
             
         except Exception as e:
             logger.error(f"새 뉴스 알림 전송 중 오류: {e}")
     
-    async def _send_urgent_news_to_user(self, user_id: int, news_list: List[Dict[str, Any]]):
-        """특정 사용자에게 긴급 뉴스 전송"""
-        try:
-            current_time = datetime.now().strftime("%m월 %d일 %H:%M")
-            message_text = f"🚨 **긴급 뉴스 알림** ({current_time})\n\n"
-            message_text += f"📈 **새로운 주요 뉴스 {len(news_list)}건 감지!**\n\n"
-            
-            # 인라인 버튼 생성
-            from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-            buttons = []
-            
-            for i, news in enumerate(news_list, 1):
-                # 감정 분석 아이콘
-                sentiment_icon = "📈" if news["sentiment"] == "positive" else "📉" if news["sentiment"] == "negative" else "📊"
-                sentiment_text = "긍정적" if news["sentiment"] == "positive" else "부정적" if news["sentiment"] == "negative" else "중립"
-                
-                # 메시지 텍스트에 뉴스 추가
-                message_text += f"{i}️⃣ {news['title']}\n   {sentiment_icon} {sentiment_text} | ⏰ {news['time']}\n\n"
-                
-                # 각 뉴스별 버튼 생성
-                button_text = f"{i}️⃣ 뉴스 보기"
-                buttons.append([InlineKeyboardButton(button_text, url=news["url"])])
-            
-            # 추가 액션 버튼
-            action_buttons = [
-                InlineKeyboardButton("🔄 새로고침", callback_data="refresh"),
-                InlineKeyboardButton("⚙️ 알림설정", callback_data="notification_settings")
-            ]
-            buttons.append(action_buttons)
-            
-            message_text += "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.\n"
-            message_text += "🔍 새로운 뉴스가 감지되어 즉시 알림을 보내드렸습니다."
-            
-            keyboard = InlineKeyboardMarkup(buttons)
-            
-            # 봇을 통해 메시지 전송
-            await self.bot.app.bot.send_message(
-                chat_id=user_id,
-                text=message_text,
-                reply_markup=keyboard,
-                parse_mode='Markdown'
-            )
-            
-        except Exception as e:
-            logger.error(f"사용자 {user_id}에게 긴급 뉴스 전송 중 오류: {e}")
-            raise
-    
     def get_status(self) -> Dict[str, Any]:
         """모니터링 상태 반환"""
         return {
             "is_running": self.is_running,
             "check_interval": self.check_interval,
-            "known_news_count": len(self.known_news_hashes),
+            "market_session": get_session(),
+            "arrival_rate": self.poll_interval.rate,
+            "known_news_count": len(self.known_articles),
             "new_news_buffer_count": len(self.new_news_buffer),
             "min_news_threshold": self.min_news_threshold,
             "last_notification_time": self.last_notification_time.strftime("%Y-%m-%d %H:%M:%S") if self.last_notification_time else None
@@ -1,21 +1,84 @@
 """
 스케줄러 모듈
 주기적으로 뉴스를 전송하고 사용자 알림을 관리하는 기능
+- 알림 시각은 한국 시각 기준, 장 운영 달력(KRX 휴장일)에 따라 휴장일은 건너뛰거나 줄여서 전송
 """
 
 import asyncio
-from datetime import datetime, time
-from typing import List, Dict, Any, Callable
+import time as time_module
+from datetime import datetime, time, timedelta
+from types import MappingProxyType
+from collections import deque
+from typing import List, Dict, Any, Deque, Mapping, Optional, Set, Tuple
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.base import BaseTrigger
 from loguru import logger
 
+from src.bot.news_cards import render_card
+from src.utils.config import get_env_float, get_env_str
+from src.utils.market_calendar import KST, is_trading_day, now_kst
+from src.utils.news_bus import NewsBatch, get_news_bus
+from src.utils.subscriber_records import Schedule, SubscriberRecord, make_schedule, minute_of_day
+
+
+def parse_notification_time(value: str) -> Optional[time]:
+    """'HH:MM' 문자열을 알림 시각으로 변환 (형식이 틀리면 None)"""
+    try:
+        return datetime.strptime(value.strip(), "%H:%M").time()
+    except ValueError:
+        return None
+
+
+# 휴장일 알림 방식
+CLOSED_DAY_SKIP = 'skip'  # 보내지 않음
+CLOSED_DAY_THIN = 'thin'  # 정해진 몇 개 시각(SCHEDULE_CLOSED_DAY_TIMES)만 전송
+CLOSED_DAY_ALL = 'all'    # 거래일과 같이 전송
+CLOSED_DAY_MODES = (CLOSED_DAY_SKIP, CLOSED_DAY_THIN, CLOSED_DAY_ALL)
+
+
+class CalendarTrigger(BaseTrigger):
+    """
+    NewsScheduler.next_fire_times를 따르는 트리거 (offset초만큼 앞당기거나 늦춰서 실행)
+    알림 시각이 바뀌면 NewsScheduler가 작업을 다시 예약
+    앞으로 알림 시각이 없으면 None을 돌려줘 작업을 멈추고, 알림 시각이 생기면 NewsScheduler가 다시 등록
+    """
+
+    def __init__(self, news_scheduler: "NewsScheduler", offset: float = 0.0):
+        self.news_scheduler = news_scheduler
+        self.offset = timedelta(seconds=offset)
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        after = now if previous_fire_time is None else max(now, previous_fire_time)
+        fire_times = self.news_scheduler.next_fire_times(1, after=after - self.offset)
+        if fire_times:
+            return fire_times[0] + self.offset
+        return None
+
+    def __str__(self):
+        return f"calendar[offset={self.offset.total_seconds():+.0f}s]"
+
 
 class NewsScheduler:
     def __init__(self, bot_instance):
         self.bot = bot_instance
         self.scheduler = AsyncIOScheduler()
-        self.subscribers = {}  # user_id: {times: [time_list], enabled: bool}
+        self.subscribers: Dict[int, SubscriberRecord] = {}
+        # 알림 시각 색인 (구독 변경시 바로 갱신)
+        # 시간표 -> 활성 구독자, 하루 중 분 -> 그 시각이 들어 있는 시간표
+        self.schedule_groups: Dict[Schedule, Set[int]] = {}
+        self.schedule_index: Dict[int, Set[Schedule]] = {}
+        self.store = None  # 구독자 저장소 (load_subscribers 이후 변경을 기록)
+        # 뉴스 버스로 받은 최신 기사 목록 (정기 알림시 다시 수집하지 않고 사용)
+        self.latest_news: List[Dict[str, Any]] = []
+        self.latest_news_at = 0.0
+        self.latest_news_max_age = get_env_float("NEWS_BUS_MAX_AGE", 360)
+        # 알림 시각 전에 미리 수집/렌더링한 뉴스 (알림 시각 -> (뉴스 목록, 준비 완료 시각))
+        self.prewarm_lead = get_env_float("SCHEDULE_PREWARM_LEAD", 45)  # 알림 시각보다 먼저 수집을 시작하는 시간 (초)
+        self._prepared: Dict[datetime, Tuple[List[Dict[str, Any]], float]] = {}
+        self._preparing: Dict[datetime, asyncio.Task] = {}
+        self.prewarm_hits = 0
+        self.prewarm_misses = 0
+        self.prewarm_leads: Deque[float] = deque(maxlen=50)  # 최근 준비 완료 -> 알림 시각 간격 (초, 음수면 늦음)
         # 30분 간격 알림 시간 설정
         self.default_times = [
             time(9, 0),   # 오전 9시
@@ -38,6 +101,19 @@ class NewsScheduler:
             time(17, 30), # 오후 5시 30분
             time(18, 0),  # 오후 6시
         ]
+        self.default_minutes = {minute_of_day(t) for t in self.default_times}
+        self.default_schedule = make_schedule(self.default_times)
+        # 휴장일(주말/KRX 휴장일) 알림 방식
+        self.closed_day_mode = get_env_str("SCHEDULE_CLOSED_DAY_MODE", CLOSED_DAY_SKIP).lower()
+        if self.closed_day_mode not in CLOSED_DAY_MODES:
+            logger.warning(f"알 수 없는 SCHEDULE_CLOSED_DAY_MODE '{self.closed_day_mode}', skip 사용")
+            self.closed_day_mode = CLOSED_DAY_SKIP
+        self.closed_day_minutes = {
+            minute_of_day(value)
+            for value in map(parse_notification_time, get_env_str("SCHEDULE_CLOSED_DAY_TIMES", "09:00,18:00").split(','))
+            if value is not None
+        }
+        self.skipped_ticks = 0  # 예약한 뒤 휴장일 표/알림 시각이 바뀌어 건너뛴 실행 수
         
     async def start(self):
         """스케줄러 시작"""
@@ -45,6 +121,9 @@ class NewsScheduler:
             # 기본 뉴스 전송 스케줄 설정
             self._setup_default_schedules()
             
+            # 최신 기사 목록만 필요하므로 큐 크기 1 (밀린 묶음은 버림)
+            get_news_bus().consume('scheduler', self._on_news_batch, maxsize=1, drop_oldest=True)
+            
             self.scheduler.start()
             logger.info("뉴스 스케줄러 시작됨")
             
@@ -54,166 +133,398 @@ class NewsScheduler:
     async def stop(self):
         """스케줄러 중지"""
         try:
+            get_news_bus().unsubscribe('scheduler')
             self.scheduler.shutdown()
             logger.info("뉴스 스케줄러 중지됨")
         except Exception as e:
             logger.error(f"스케줄러 중지 오류: {e}")
     
     def _setup_default_schedules(self):
-        """30분 간격 뉴스 전송 스케줄 설정"""
-        logger.info("📅 30분 간격 뉴스 알림 스케줄 설정 중...")
+        """
+        알림 스케줄 설정
+        작업 하나가 장 운영 달력과 알림 시각 색인으로 계산한 다음 알림 시각에만 실행
+        (사용자별 알림 시각을 바꿔도 작업을 추가/삭제할 필요 없음, 휴장일은 건너뜀)
+        """
+        self._add_jobs()
+        
+        default_times = ', '.join(t.strftime('%H:%M') for t in self.default_times)
+        next_times = ', '.join(moment.strftime('%m-%d %H:%M') for moment in self.next_fire_times(3))
+        logger.info(f"✅ 뉴스 알림 스케줄 설정 완료 (기본 알림 시각 {len(self.default_times)}개: {default_times}, "
+                    f"휴장일 {self.closed_day_mode}, 다음 알림: {next_times or '없음'})")
+    
+    def _add_jobs(self):
+        """알림 작업과 미리 수집 작업 등록 (같은 ID의 작업은 교체)"""
+        self.scheduler.add_job(
+            self._send_scheduled_news,
+            CalendarTrigger(self),
+            id="news_tick",
+            name="뉴스 전송",
+            replace_existing=True,
+            misfire_grace_time=30,
+            coalesce=True
+        )
         
-        # 30분 간격 알림 스케줄 추가
-        for schedule_time in self.default_times:
+        # 알림 시각 prewarm_lead초 전에 미리 수집
+        if self.prewarm_lead > 0:
             self.scheduler.add_job(
-                self._send_scheduled_news,
-                CronTrigger(hour=schedule_time.hour, minute=schedule_time.minute),
-                id=f"news_{schedule_time.hour}_{schedule_time.minute}",
-                name=f"뉴스 전송 {schedule_time.strftime('%H:%M')}",
-                replace_existing=True
+                self._prewarm_news,
+                CalendarTrigger(self, offset=-self.prewarm_lead),
+                id="news_prewarm",
+                name="알림 뉴스 미리 수집",
+                replace_existing=True,
+                misfire_grace_time=10,
+                coalesce=True
             )
-            logger.info(f"⏰ 뉴스 알림 스케줄 추가: {schedule_time.strftime('%H:%M')}")
+    
+    def _reschedule(self):
+        """
+        알림 시각 후보가 바뀌면 작업의 다음 실행 시각 다시 계산
+        알림 시각이 없어 삭제된 작업은 다시 등록
+        """
+        if not self.scheduler.running:
+            return
+        job_ids = ["news_tick"] + (["news_prewarm"] if self.prewarm_lead > 0 else [])
+        jobs = [self.scheduler.get_job(job_id) for job_id in job_ids]
+        if None in jobs:
+            self._add_jobs()
+            return
+        for job in jobs:
+            job.reschedule(job.trigger)
+    
+    def _scheduled_minutes(self) -> Set[int]:
+        """알림을 보낼 대상이 있는 시각 (하루 중 분)"""
+        minutes = set(self.schedule_index)
+        from src.bot.delivery import broadcast_targets
+        if broadcast_targets([]):  # 채널 방식이면 구독자가 없어도 기본 알림 시각에 채널 게시
+            minutes |= self.default_minutes
+        return minutes
+    
+    def _minutes_on(self, day, minutes: Set[int]) -> List[int]:
+        """그날 실제로 알림을 보낼 시각 (휴장일 방식 반영, 오름차순)"""
+        if not is_trading_day(day):
+            if self.closed_day_mode == CLOSED_DAY_SKIP:
+                return []
+            if self.closed_day_mode == CLOSED_DAY_THIN:
+                minutes = minutes & self.closed_day_minutes
+        return sorted(minutes)
+    
+    def next_fire_times(self, count: int = 5, after: Optional[datetime] = None,
+                        schedule: Optional[Schedule] = None) -> List[datetime]:
+        """
+        after 이후의 알림 시각 count개 (한국 시각, 휴장일 방식 반영)
+        schedule을 주면 그 시간표의 알림 시각만 계산 (사용자별 다음 알림)
+        """
+        after = (after or now_kst()).astimezone(KST)
+        minutes = set(schedule.minutes()) if schedule is not None else self._scheduled_minutes()
+        fire_times: List[datetime] = []
+        day = after.date()
+        for _ in range(15):  # 긴 연휴도 넘을 수 있게 15일까지 확인
+            for minute in self._minutes_on(day, minutes):
+                moment = datetime(day.year, day.month, day.day, minute // 60, minute % 60, tzinfo=KST)
+                if moment > after:
+                    fire_times.append(moment)
+                    if len(fire_times) >= count:
+                        return fire_times
+            day += timedelta(days=1)
+        return fire_times
+    
+    def is_fire_time(self, moment: datetime) -> bool:
+        """그 시각(분 단위)이 알림 시각인지 (휴장일 방식 반영)"""
+        moment = moment.astimezone(KST)
+        return minute_of_day(moment.time()) in self._minutes_on(moment.date(), self._scheduled_minutes())
+    
+    async def _on_news_batch(self, batch: NewsBatch):
+        """뉴스 버스 구독: 최신 기사 목록 갱신"""
+        if batch.latest:
+            self.latest_news = batch.latest
+            self.latest_news_at = batch.crawled_at
+    
+    async def _get_news(self, limit: int) -> List[Dict[str, Any]]:
+        """정기 알림용 뉴스 (뉴스 버스 목록이 충분히 최신이면 사용, 아니면 수집)"""
+        if self.latest_news and time_module.time() - self.latest_news_at <= self.latest_news_max_age:
+            return self.latest_news[:limit]
+        
+        from src.crawler.news_crawler import get_stock_news
+        return await get_stock_news(limit)
+    
+    def _get_tick_targets(self, tick: datetime) -> Tuple[List[int], List[Any]]:
+        """알림 시각의 구독자와 실제 전송 대상"""
+        recipients = self._get_active_subscribers_for_time(tick.strftime("%H:%M"))
+        
+        # 기본 알림 시각은 채널 방식이면 채널 하나에 게시, 사용자가 따로 정한 시각은 개인 메시지로만 전송
+        from src.bot.delivery import broadcast_targets
+        if minute_of_day(tick.time()) in self.default_minutes:
+            return recipients, broadcast_targets(recipients)
+        return recipients, recipients
+    
+    async def _prewarm_news(self):
+        """prewarm_lead초 뒤 알림 시각에 보낼 대상이 있으면 뉴스를 미리 수집하고 카드를 렌더링"""
+        now = time_module.time()
+        for old in [moment for moment in self._prepared if moment.timestamp() < now - 60]:
+            del self._prepared[old]  # 전송하지 않고 지나간 알림 시각의 준비분 정리
+        
+        tick = datetime.fromtimestamp(round((now + self.prewarm_lead) / 60) * 60, KST)
+        if not self.is_fire_time(tick):
+            return
+        if tick in self._prepared or tick in self._preparing:
+            return
+        _, targets = self._get_tick_targets(tick)
+        if not targets:
+            return
         
-        logger.info(f"✅ 총 {len(self.default_times)}개 알림 시간 설정 완료 (30분 간격)")
+        task = asyncio.create_task(self._prepare_news(tick))
+        self._preparing[tick] = task
+        task.add_done_callback(lambda _: self._preparing.pop(tick, None))
+    
+    async def _prepare_news(self, tick: datetime):
+        try:
+            news_list = await self._get_news(5)
+            if news_list:
+                render_card('scheduled', news_list, now=tick)  # 알림 시각 카드 캐시에 미리 저장
+                self._prepared[tick] = (news_list, time_module.time())
+                logger.debug(f"{tick.strftime('%H:%M')} 알림 뉴스 준비 완료 ({len(news_list)}건)")
+        except Exception as e:
+            logger.error(f"{tick.strftime('%H:%M')} 알림 뉴스 미리 수집 실패: {e}")
+    
+    async def _take_prepared_news(self, tick: datetime) -> Optional[List[Dict[str, Any]]]:
+        """알림 시각에 준비된 뉴스 (수집 중이면 끝날 때까지 대기, 준비된 것이 없으면 None)"""
+        task = self._preparing.get(tick)
+        if task is not None:
+            await asyncio.shield(task)
+        
+        # 지난 알림 시각의 준비분 정리
+        for old in [moment for moment in self._prepared if moment < tick]:
+            del self._prepared[old]
+        
+        prepared = self._prepared.pop(tick, None)
+        if prepared is None:
+            self.prewarm_misses += 1
+            return None
+        
+        news_list, ready_at = prepared
+        if self.latest_news and self.latest_news_at > ready_at:
+            news_list = self.latest_news[:len(news_list)]  # 그 사이 뉴스 버스로 더 최신 목록이 들어왔으면 사용
+        lead = tick.timestamp() - ready_at
+        self.prewarm_hits += 1
+        self.prewarm_leads.append(lead)
+        if lead >= 0:
+            logger.info(f"미리 수집한 뉴스 사용: 알림 시각 {lead:.1f}초 전에 준비 완료")
+        else:
+            logger.warning(f"미리 수집한 뉴스가 알림 시각보다 {-lead:.1f}초 늦게 준비됨 (SCHEDULE_PREWARM_LEAD 조정 필요)")
+        return news_list
+    
+    def get_prewarm_stats(self) -> Dict[str, Any]:
+        """미리 수집 통계 (사용/미사용 횟수, 최근 준비 완료 -> 알림 시각 간격)"""
+        leads = list(self.prewarm_leads)
+        return {
+            'lead_setting': self.prewarm_lead,
+            'hits': self.prewarm_hits,
+            'misses': self.prewarm_misses,
+            'last_lead': leads[-1] if leads else None,
+            'min_lead': min(leads) if leads else None,
+            'avg_lead': sum(leads) / len(leads) if leads else None
+        }
     
     async def _send_scheduled_news(self):
-        """스케줄된 뉴스 전송"""
+        """스케줄된 뉴스 전송 (달력 트리거가 계산한 알림 시각에 실행, 그 사이 알림 시각이 바뀌었으면 건너뜀)"""
         try:
-            current_time = datetime.now().strftime("%H:%M")
-            logger.info(f"스케줄된 뉴스 전송 시작: {current_time}")
-            
-            # 활성화된 구독자들에게 뉴스 전송
-            active_subscribers = self._get_active_subscribers_for_time(current_time)
+            tick = now_kst().replace(second=0, microsecond=0)
+            if not self.is_fire_time(tick):  # 작업 예약 후 휴장일 표/알림 시각이 바뀐 경우
+                self.skipped_ticks += 1
+                logger.info(f"{tick.strftime('%m-%d %H:%M')} 알림 건너뜀 (휴장일 또는 알림 시각 아님)")
+                return
+            recipients, targets = self._get_tick_targets(tick)
             
-            if not active_subscribers:
-                logger.info("현재 시간에 알림을 받을 구독자가 없습니다")
+            if not targets:
                 return
             
-            # 최신 뉴스 가져오기
-            from src.crawler.news_crawler import get_stock_news
-            news_list = await get_stock_news(5)
+            current_time = tick.strftime("%H:%M")
+            logger.info(f"스케줄된 뉴스 전송 시작: {current_time} (구독자 {len(recipients)}명)")
+            
+            # 미리 수집한 뉴스가 있으면 바로 사용, 없으면 지금 가져오기
+            news_list = await self._take_prepared_news(tick)
+            if news_list is None:
+                news_list = await self._get_news(5)
             
             if not news_list:
                 logger.warning("스케줄된 뉴스 전송: 뉴스를 가져올 수 없음")
                 return
             
-            # 각 구독자에게 뉴스 전송
-            success_count = 0
-            for user_id in active_subscribers:
-                try:
-                    await self._send_news_to_user(user_id, news_list)
-                    success_count += 1
-                    # 봇 API 제한을 위해 잠시 대기
-                    await asyncio.sleep(0.1)
-                except Exception as e:
-                    logger.error(f"사용자 {user_id}에게 뉴스 전송 실패: {e}")
+            # 카드는 한 번만 만들고 발송 대기열에 등록 (전송 워커가 한도 안에서 동시 전송, 재시작 후에도 이어서 전송)
+            from src.bot.delivery import enqueue_broadcast
+            card = render_card('scheduled', news_list, now=tick)
+            broadcast_id = f"scheduled:{tick.strftime('%Y%m%d%H%M')}"
+            queued = await enqueue_broadcast(broadcast_id, card, targets)
             
-            logger.info(f"스케줄된 뉴스 전송 완료: {success_count}/{len(active_subscribers)}명")
+            logger.info(f"스케줄된 뉴스 발송 등록: {queued}/{len(targets)}곳 ({broadcast_id})")
             
         except Exception as e:
             logger.error(f"스케줄된 뉴스 전송 중 오류: {e}")
     
-    async def _send_news_to_user(self, user_id: int, news_list: List[Dict[str, Any]]):
-        """특정 사용자에게 뉴스 전송"""
-        try:
-            # 뉴스 카드 생성
-            current_time = datetime.now().strftime("%m월 %d일 %H:%M")
-            message_text = f"📰 주식 뉴스 알림 ({current_time})\n\n🔥 주요 뉴스 {len(news_list)}건:\n\n"
-            
-            # 인라인 버튼 생성
-            from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-            buttons = []
-            
-            for i, news in enumerate(news_list, 1):
-                # 감정 분석 아이콘
-                sentiment_icon = "📈" if news["sentiment"] == "positive" else "📉" if news["sentiment"] == "negative" else "📊"
-                sentiment_text = "긍정적" if news["sentiment"] == "positive" else "부정적" if news["sentiment"] == "negative" else "중립"
-                
-                # 메시지 텍스트에 뉴스 추가
-                message_text += f"{i}️⃣ {news['title']}\n   {sentiment_icon} {sentiment_text} | ⏰ {news['time']}\n\n"
-                
-                # 각 뉴스별 버튼 생성
-                button_text = f"{i}️⃣ 뉴스 보기"
-                buttons.append([InlineKeyboardButton(button_text, url=news["url"])])
-            
-            # 추가 액션 버튼
-            action_buttons = [
-                InlineKeyboardButton("🔄 새로고침", callback_data="refresh"),
-                InlineKeyboardButton("⚙️ 알림설정", callback_data="notification_settings")
-            ]
-            buttons.append(action_buttons)
-            
-            message_text += "💡 각 뉴스를 클릭하면 원문을 확인할 수 있습니다.\n📲 정기 알림을 받고 계십니다."
-            
-            keyboard = InlineKeyboardMarkup(buttons)
-            
-            # 봇을 통해 메시지 전송
-            await self.bot.app.bot.send_message(
-                chat_id=user_id,
-                text=message_text,
-                reply_markup=keyboard,
-                parse_mode='Markdown'
-            )
-            
-        except Exception as e:
-            logger.error(f"사용자 {user_id}에게 뉴스 전송 중 오류: {e}")
-            raise
-    
     def _get_active_subscribers_for_time(self, current_time: str) -> List[int]:
-        """현재 시간에 알림을 받을 활성 구독자 목록"""
-        # 활성화된 구독자들만 반환
-        active_subscribers = []
-        
-        for user_id, info in self.subscribers.items():
-            if info.get('enabled', True):  # enabled가 없으면 기본값 True
-                active_subscribers.append(user_id)
+        """현재 시간('HH:MM')에 알림을 받을 활성 구독자 목록 (알림 시각 색인 조회)"""
+        current = parse_notification_time(current_time)
+        if current is None:
+            return []
         
+        schedules = self.schedule_index.get(minute_of_day(current), ())
+        active_subscribers = [user_id for schedule in schedules for user_id in self.schedule_groups[schedule]]
         if active_subscribers:
-            logger.info(f"🔔 알림 대상 구독자: {len(active_subscribers)}명 - {active_subscribers}")
-        else:
-            logger.info("📭 현재 활성화된 구독자가 없습니다. /notify_on 명령어로 알림을 활성화하세요.")
-        
+            logger.debug(f"🔔 {current_time} 알림 대상 구독자: {len(active_subscribers)}명")
         return active_subscribers
     
+    async def load_subscribers(self, store):
+        """저장소의 구독자를 불러오고 이후 변경은 저장소에 기록"""
+        rows = await asyncio.to_thread(store.load_users)
+        parsed: Dict[str, Schedule] = {}  # 같은 알림 시간 문자열은 한 번만 변환
+        active: Dict[Schedule, Set[int]] = {}
+        for row in rows:
+            if row.notification_times is None:
+                schedule = self.default_schedule
+            else:
+                schedule = parsed.get(row.notification_times)
+                if schedule is None:
+                    schedule = parsed[row.notification_times] = make_schedule(
+                        parse_notification_time(value) for value in row.notification_times.split(',')
+                    )
+            self.subscribers[row.id] = SubscriberRecord(schedule, bool(row.is_active), row.created_at)
+            if row.is_active:
+                active.setdefault(schedule, set()).add(row.id)
+        
+        # 색인은 시간표별로 한 번에 추가
+        for schedule, user_ids in active.items():
+            self._add_schedule_group(schedule).update(user_ids)
+        self.store = store
+        logger.info(f"구독자 {len(rows):,}명 불러옴 (활성 {self.enabled_count:,}명, 시간표 {len(self.schedule_groups)}종)")
+    
+    def _persist(self, user_id: int):
+        """구독자 변경을 저장소 기록 대기열에 추가"""
+        if self.store is None:
+            return
+        from src.database.subscriber_store import UserRow
+        record = self.subscribers.get(user_id)
+        if record is None:
+            self.store.delete_user(user_id)
+            return
+        encoded = None if record.schedule == self.default_schedule else record.schedule.encode()
+        self.store.put_user(UserRow(user_id, record.enabled, encoded, record.added_at))
+    
+    async def sync(self) -> bool:
+        """구독자 변경이 저장소에 기록될 때까지 대기 (명령어 응답 전에 호출)"""
+        if self.store is None:
+            return True
+        return await self.store.sync()
+    
+    @property
+    def enabled_count(self) -> int:
+        """알림이 활성화된 구독자 수"""
+        return sum(len(user_ids) for user_ids in self.schedule_groups.values())
+    
+    def get_enabled_subscribers(self) -> List[int]:
+        """알림이 활성화된 구독자 목록"""
+        return [user_id for user_ids in self.schedule_groups.values() for user_id in user_ids]
+    
+    def _add_schedule_group(self, schedule: Schedule) -> Set[int]:
+        """시간표의 구독자 집합 (처음 쓰는 시간표면 알림 시각 색인에 등록)"""
+        user_ids = self.schedule_groups.get(schedule)
+        if user_ids is None:
+            user_ids = self.schedule_groups[schedule] = set()
+            new_minute = False
+            for minute in schedule.minutes():
+                new_minute |= minute not in self.schedule_index
+                self.schedule_index.setdefault(minute, set()).add(schedule)
+            if new_minute:
+                self._reschedule()
+        return user_ids
+    
+    def _index_subscriber(self, user_id: int, schedule: Schedule):
+        self._add_schedule_group(schedule).add(user_id)
+    
+    def _unindex_subscriber(self, user_id: int, schedule: Schedule):
+        user_ids = self.schedule_groups.get(schedule)
+        if user_ids is None:
+            return
+        user_ids.discard(user_id)
+        if user_ids:
+            return
+        # 아무도 쓰지 않는 시간표는 색인에서 제거
+        del self.schedule_groups[schedule]
+        removed_minute = False
+        for minute in schedule.minutes():
+            schedules = self.schedule_index.get(minute)
+            if schedules is not None:
+                schedules.discard(schedule)
+                if not schedules:
+                    del self.schedule_index[minute]
+                    removed_minute = True
+        if removed_minute:
+            self._reschedule()
+    
     def add_subscriber(self, user_id: int, notification_times: List[time] = None):
-        """구독자 추가"""
-        if notification_times is None:
-            notification_times = self.default_times
+        """구독자 추가 (이미 있으면 알림 시간을 새로 설정하고 활성화)"""
+        schedule = self.default_schedule if notification_times is None else make_schedule(notification_times)
         
-        self.subscribers[user_id] = {
-            'times': notification_times,
-            'enabled': True,
-            'added_at': datetime.now()
-        }
+        previous = self.subscribers.get(user_id)
+        if previous and previous.enabled:
+            self._unindex_subscriber(user_id, previous.schedule)
         
-        logger.info(f"구독자 추가: {user_id}, 알림시간: {[t.strftime('%H:%M') for t in notification_times]}")
+        added_at = previous.added_at if previous else time_module.time()
+        self.subscribers[user_id] = SubscriberRecord(schedule, True, added_at)
+        self._index_subscriber(user_id, schedule)
+        self._persist(user_id)
+        
+        logger.info(f"구독자 추가: {user_id}, 알림시간: {schedule.encode()}")
+    
+    def enable_subscriber(self, user_id: int):
+        """알림 활성화 (처음이면 기본 알림 시간으로 추가, 이미 있으면 설정한 알림 시간 유지)"""
+        if user_id in self.subscribers:
+            self.toggle_subscriber(user_id, True)
+        else:
+            self.add_subscriber(user_id)
     
     def remove_subscriber(self, user_id: int):
         """구독자 제거"""
         if user_id in self.subscribers:
-            del self.subscribers[user_id]
+            record = self.subscribers.pop(user_id)
+            if record.enabled:
+                self._unindex_subscriber(user_id, record.schedule)
+            self._persist(user_id)
             logger.info(f"구독자 제거: {user_id}")
     
     def update_subscriber_times(self, user_id: int, notification_times: List[time]):
         """구독자 알림 시간 업데이트"""
         if user_id in self.subscribers:
-            self.subscribers[user_id]['times'] = notification_times
-            logger.info(f"구독자 {user_id} 알림시간 업데이트: {[t.strftime('%H:%M') for t in notification_times]}")
+            record = self.subscribers[user_id]
+            schedule = make_schedule(notification_times)
+            if record.enabled:
+                self._unindex_subscriber(user_id, record.schedule)
+                self._index_subscriber(user_id, schedule)
+            record.schedule = schedule
+            self._persist(user_id)
+            logger.info(f"구독자 {user_id} 알림시간 업데이트: {schedule.encode()}")
     
     def toggle_subscriber(self, user_id: int, enabled: bool):
         """구독자 알림 활성화/비활성화"""
         if user_id in self.subscribers:
-            self.subscribers[user_id]['enabled'] = enabled
+            record = self.subscribers[user_id]
+            if record.enabled != enabled:
+                if enabled:
+                    self._index_subscriber(user_id, record.schedule)
+                else:
+                    self._unindex_subscriber(user_id, record.schedule)
+                record.enabled = enabled
+                self._persist(user_id)
             status = "활성화" if enabled else "비활성화"
             logger.info(f"구독자 {user_id} 알림 {status}")
     
-    def get_subscriber_info(self, user_id: int) -> Dict[str, Any]:
-        """구독자 정보 조회"""
-        return self.subscribers.get(user_id, None)
+    def get_subscriber_info(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """구독자 정보 조회 {times, enabled, added_at}"""
+        record = self.subscribers.get(user_id)
+        return record.to_info() if record else None
     
-    def get_all_subscribers(self) -> Dict[int, Dict[str, Any]]:
-        """모든 구독자 정보 조회"""
-        return self.subscribers.copy()
+    def get_all_subscribers(self) -> Mapping[int, SubscriberRecord]:
+        """모든 구독자 레코드 (복사하지 않는 읽기 전용 뷰)"""
+        return MappingProxyType(self.subscribers)
 
 
 # 전역 스케줄러 인스턴스 (나중에 봇에서 사용)
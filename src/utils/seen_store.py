@@ -0,0 +1,149 @@
+"""
+이미 본 뉴스 저장소
+오래 실행되는 모니터가 본 기사 키를 고정된 메모리 안에서 기억하기 위한 회전식 블룸 필터
+"""
+
+import hashlib
+import math
+import struct
+import time
+from typing import Union
+
+
+class BloomFilter:
+    """
+    64비트 키용 블룸 필터
+    - 비트 수 m = -n·ln(p) / (ln 2)², 해시 수 k = (m / n)·ln 2
+    - 키 하나에서 이중 해싱(h1 + i·h2)으로 k개 위치 계산
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0  # 추가한 키 수
+
+    def positions(self, key: int) -> list:
+        """키의 비트 위치 (크기와 해시 수가 같은 필터끼리는 재사용 가능)"""
+        h1 = key & 0xFFFFFFFF
+        h2 = (key >> 32) | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def has(self, positions: list) -> bool:
+        bits = self.bits
+        for pos in positions:
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def set(self, positions: list):
+        bits = self.bits
+        for pos in positions:
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: int) -> bool:
+        return self.has(self.positions(key))
+
+    def add(self, key: int):
+        self.set(self.positions(key))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.bits)
+
+
+STATE_HEADER = struct.Struct('<QddQQ')  # capacity, error_rate, rotated_at, current.count, previous.count
+
+
+class SeenStore:
+    """
+    회전식 블룸 필터 2개로 구성한 본 기사 집합
+    - 새 기사는 현재 필터에 추가, 조회는 현재/이전 필터 모두 확인
+    - 현재 필터가 capacity개 차거나 retention_seconds가 지나면 이전 필터를 버리고 현재 필터를 이전으로 교체
+      (기사는 최소 retention_seconds 동안 기억됨, 단 그 사이 capacity개가 넘게 들어오면 더 일찍 잊힘)
+    - 이전 필터에만 있는 기사를 다시 보면 현재 필터로 옮겨서 계속 보이는 기사는 잊히지 않음
+    - 메모리: 필터 2개 고정 (capacity=100,000, error_rate=0.001이면 약 360KB)
+    - 오탐률(처음 보는 기사를 본 것으로 판단할 확률): 필터 2개를 모두 확인하므로 최대 약 2 x error_rate
+    - 미탐(본 기사를 처음 보는 것으로 판단)은 보존 기간이 지난 경우에만 발생
+    """
+
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.001,
+                 retention_seconds: float = 172800):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.retention_seconds = retention_seconds
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.time()
+        self.rotations = 0
+
+    @staticmethod
+    def _key(item: Union[int, str, bytes]) -> int:
+        if isinstance(item, int):
+            return item & 0xFFFFFFFFFFFFFFFF
+        if isinstance(item, str):
+            item = item.encode()
+        return int.from_bytes(hashlib.blake2b(item, digest_size=8).digest(), 'big')
+
+    def _rotate_if_needed(self, now: float):
+        if self._current.count >= self.capacity or now - self._rotated_at >= self.retention_seconds:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = now
+            self.rotations += 1
+
+    def __contains__(self, item: Union[int, str, bytes]) -> bool:
+        positions = self._current.positions(self._key(item))
+        return self._current.has(positions) or self._previous.has(positions)
+
+    def __len__(self) -> int:
+        """기억 중인 기사 수 (근사값, 두 필터에 모두 있는 기사는 두 번 셈)"""
+        return self._current.count + self._previous.count
+
+    def add(self, item: Union[int, str, bytes], now: float = None) -> bool:
+        """기사 추가 (처음 보는 기사면 True)"""
+        now = time.time() if now is None else now
+        self._rotate_if_needed(now)
+
+        positions = self._current.positions(self._key(item))
+        if self._current.has(positions):
+            return False
+
+        seen = self._previous.has(positions)
+        self._current.set(positions)
+        return not seen
+
+    @property
+    def nbytes(self) -> int:
+        """필터 메모리 (바이트)"""
+        return self._current.nbytes + self._previous.nbytes
+
+    def dump(self) -> bytes:
+        """저장용 바이트 (설정, 회전 시각, 두 필터의 비트)"""
+        header = STATE_HEADER.pack(self.capacity, self.error_rate, self._rotated_at,
+                                   self._current.count, self._previous.count)
+        return header + bytes(self._current.bits) + bytes(self._previous.bits)
+
+    def restore(self, data: bytes) -> bool:
+        """dump 결과로 상태 복원 (설정이 다르거나 크기가 맞지 않으면 False)"""
+        if len(data) < STATE_HEADER.size:
+            return False
+        capacity, error_rate, rotated_at, current_count, previous_count = STATE_HEADER.unpack_from(data)
+        if capacity != self.capacity or error_rate != self.error_rate:
+            return False
+
+        size = self._current.nbytes
+        bits = data[STATE_HEADER.size:]
+        if len(bits) != size * 2:
+            return False
+
+        self._current.bits[:] = bits[:size]
+        self._current.count = current_count
+        self._previous.bits[:] = bits[size:]
+        self._previous.count = previous_count
+        self._rotated_at = rotated_at
+        return True
@@ -0,0 +1,66 @@
+"""
+상태 스냅샷 파일
+재시작 후 복원할 상태를 원자적으로 저장하고 손상 여부를 검사해서 읽음
+- 저장: 임시 파일에 쓰고 fsync 후 os.replace로 교체 (쓰는 도중 종료돼도 이전 스냅샷 유지)
+- 형식: 매직(4) + 길이(8) + CRC32(4) + 내용, 길이나 CRC가 맞지 않으면 손상으로 보고 무시
+"""
+
+import os
+import struct
+import zlib
+from typing import Optional
+from loguru import logger
+
+
+HEADER = struct.Struct('<4sQI')
+
+
+def write_snapshot(path: str, magic: bytes, payload: bytes):
+    """스냅샷 원자적 저장"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(magic, len(payload), zlib.crc32(payload)))
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+    # 교체 결과(디렉터리 항목)도 디스크에 반영
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass  # 디렉터리 fsync를 지원하지 않는 플랫폼
+
+
+def read_snapshot(path: str, magic: bytes) -> Optional[bytes]:
+    """스냅샷 내용 읽기 (없거나 손상됐으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"스냅샷 읽기 실패 ({path}): {e}")
+        return None
+
+    if len(data) < HEADER.size:
+        logger.warning(f"스냅샷 손상 ({path}): 헤더 불완전")
+        return None
+
+    file_magic, length, checksum = HEADER.unpack_from(data)
+    payload = data[HEADER.size:]
+    if file_magic != magic:
+        logger.warning(f"스냅샷 형식 불일치 ({path})")
+        return None
+    if len(payload) != length or zlib.crc32(payload) != checksum:
+        logger.warning(f"스냅샷 손상 ({path}): 길이 또는 체크섬 불일치")
+        return None
+
+    return payload
@@ -0,0 +1,73 @@
+"""
+구독자 레코드
+정기 알림 구독자 한 명을 작게 표현해서 수백만 명도 메모리에 올릴 수 있게 함
+- 알림 시간은 30분 단위 48비트 마스크 (비트 i = i * 30분) + 30분 단위가 아닌 시각 튜플
+- 같은 알림 시간표는 객체 하나를 공유 (대부분의 구독자는 기본 시간표 하나를 가리킴)
+- 레코드는 __slots__ 클래스, 가입 시각은 datetime 대신 epoch 초
+"""
+
+from datetime import datetime, time
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+
+HALF_HOUR_SLOTS = 48
+
+
+def minute_of_day(value: time) -> int:
+    """하루 중 분 단위 위치 (00:00 -> 0, 23:59 -> 1439)"""
+    return value.hour * 60 + value.minute
+
+
+class Schedule(NamedTuple):
+    """알림 시간표"""
+    mask: int                    # 30분 단위 알림 시각 비트
+    extra: Tuple[int, ...] = ()  # 30분 단위가 아닌 알림 시각 (하루 중 분, 오름차순)
+
+    def minutes(self) -> List[int]:
+        """알림 시각 (하루 중 분, 오름차순)"""
+        slots = [slot * 30 for slot in range(HALF_HOUR_SLOTS) if self.mask >> slot & 1]
+        return sorted(slots + list(self.extra)) if self.extra else slots
+
+    def times(self) -> List[time]:
+        return [time(minute // 60, minute % 60) for minute in self.minutes()]
+
+    def encode(self) -> str:
+        """저장용 문자열 ('HH:MM,HH:MM,...')"""
+        return ','.join(f"{minute // 60:02d}:{minute % 60:02d}" for minute in self.minutes())
+
+    def __len__(self) -> int:
+        return bin(self.mask).count('1') + len(self.extra)
+
+
+_schedules: Dict[Schedule, Schedule] = {}  # 같은 시간표는 한 객체로 공유
+
+def make_schedule(times: Iterable[time]) -> Schedule:
+    """알림 시각 목록을 공유 시간표로 변환"""
+    mask, extra = 0, set()
+    for value in times:
+        minute = minute_of_day(value)
+        if minute % 30 == 0:
+            mask |= 1 << (minute // 30)
+        else:
+            extra.add(minute)
+    schedule = Schedule(mask, tuple(sorted(extra)))
+    return _schedules.setdefault(schedule, schedule)
+
+
+class SubscriberRecord:
+    """정기 알림 구독자"""
+
+    __slots__ = ('schedule', 'enabled', 'added_at')
+
+    def __init__(self, schedule: Schedule, enabled: bool, added_at: float):
+        self.schedule = schedule
+        self.enabled = enabled
+        self.added_at = added_at  # 가입 시각 (epoch 초)
+
+    def to_info(self) -> Dict[str, Any]:
+        """기존 구독자 정보 형식 {times, enabled, added_at}"""
+        return {
+            'times': self.schedule.times(),
+            'enabled': self.enabled,
+            'added_at': datetime.fromtimestamp(self.added_at)
+        }
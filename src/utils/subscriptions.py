@@ -0,0 +1,286 @@
+"""
+종목/키워드 구독
+사용자가 구독한 종목코드와 키워드로 새 기사를 골라 개인 메시지로 보내는 기능
+- 역색인: 검색어(종목명/종목코드/키워드) -> 구독 항목 -> 사용자 ID 집합 (구독 변경시 바로 갱신)
+- 기사 제목은 검색어 접두사 트리를 따라 한 번만 훑으므로 구독자 수와 관계없이 제목 길이와 매칭 수에 비례하는 시간에 처리
+"""
+
+import asyncio
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+from loguru import logger
+
+from src.utils.config import get_env_int
+from src.utils.news_bus import NewsBatch, get_news_bus
+
+
+STOCK = 'stock'
+KEYWORD = 'keyword'
+
+STOCK_CODE_PATTERN = re.compile(r'^\d{6}$')
+
+# 종목코드 -> 제목에 등장하는 이름 (없는 종목은 종목코드로만 매칭)
+STOCK_NAMES = {
+    '005930': ['삼성전자'],
+    '000660': ['SK하이닉스', '하이닉스'],
+    '035420': ['네이버', 'NAVER'],
+    '035720': ['카카오'],
+    '005380': ['현대차', '현대자동차'],
+    '000270': ['기아'],
+    '373220': ['LG에너지솔루션', 'LG엔솔'],
+    '207940': ['삼성바이오로직스', '삼성바이오'],
+    '005490': ['POSCO홀딩스', '포스코홀딩스'],
+    '006400': ['삼성SDI'],
+    '051910': ['LG화학'],
+    '068270': ['셀트리온'],
+    '105560': ['KB금융'],
+    '055550': ['신한지주'],
+    '323410': ['카카오뱅크'],
+}
+
+Subscription = Tuple[str, str]  # (구독 종류, 값) 예: ('stock', '005930'), ('keyword', '반도체')
+
+_END = ''  # 접두사 트리에서 검색어 끝 표시 (값: 해당 검색어로 찾는 구독 항목 집합)
+
+
+def parse_subscription(value: str) -> Optional[Subscription]:
+    """명령어 인자를 구독 항목으로 변환 (6자리 숫자는 종목코드, 그 외는 키워드)"""
+    value = value.strip()
+    if STOCK_CODE_PATTERN.match(value):
+        return (STOCK, value)
+    keyword = value.lower()
+    if len(keyword) < 2:  # 한 글자 키워드는 거의 모든 기사에 매칭되므로 받지 않음
+        return None
+    return (KEYWORD, keyword)
+
+
+def subscription_label(subscription: Subscription) -> str:
+    """구독 항목 표시 이름 (예: 005930 삼성전자, #반도체)"""
+    kind, value = subscription
+    if kind == STOCK:
+        names = STOCK_NAMES.get(value)
+        return f"{value} {names[0]}" if names else value
+    return f"#{value}"
+
+
+def _search_terms(subscription: Subscription) -> List[str]:
+    """구독 항목을 찾을 때 제목에서 검색할 문자열 (소문자)"""
+    kind, value = subscription
+    if kind == STOCK:
+        return [value] + [name.lower() for name in STOCK_NAMES.get(value, [])]
+    return [value]
+
+
+class SubscriptionIndex:
+    """구독 역색인"""
+
+    def __init__(self, max_per_user: int = 20):
+        self.max_per_user = max_per_user
+        self._subscribers: Dict[Subscription, Set[int]] = {}  # 구독 항목 -> 사용자 ID
+        self._by_user: Dict[int, Set[Subscription]] = {}      # 사용자 ID -> 구독 항목
+        self._trie: Dict[str, dict] = {}                       # 검색어 접두사 트리
+        self.store = None  # 구독자 저장소 (load 이후 변경을 기록)
+
+    def __len__(self) -> int:
+        """구독 중인 사용자 수"""
+        return len(self._by_user)
+
+    def _trie_add(self, term: str, subscription: Subscription):
+        node = self._trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node.setdefault(_END, set()).add(subscription)
+
+    def _trie_remove(self, term: str, subscription: Subscription):
+        path = []
+        node = self._trie
+        for char in term:
+            path.append((node, char))
+            node = node.get(char)
+            if node is None:
+                return
+        targets = node.get(_END)
+        if not targets:
+            return
+        targets.discard(subscription)
+        if not targets:
+            del node[_END]
+        # 더 이상 쓰지 않는 가지 정리
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def _insert(self, user_id: int, subscription: Subscription):
+        users = self._subscribers.get(subscription)
+        if users is None:  # 처음 구독되는 항목만 검색어 트리에 추가
+            users = self._subscribers[subscription] = set()
+            for term in _search_terms(subscription):
+                self._trie_add(term, subscription)
+        users.add(user_id)
+        self._by_user.setdefault(user_id, set()).add(subscription)
+
+    def add(self, user_id: int, subscription: Subscription) -> bool:
+        """구독 추가 (이미 구독 중이거나 최대 개수를 넘으면 False)"""
+        subscriptions = self._by_user.get(user_id, set())
+        if subscription in subscriptions or len(subscriptions) >= self.max_per_user:
+            return False
+
+        self._insert(user_id, subscription)
+        if self.store is not None:
+            from src.database.subscriber_store import SubscriptionRow
+            self.store.add_subscription(SubscriptionRow(user_id, *subscription))
+        return True
+
+    def remove(self, user_id: int, subscription: Subscription) -> bool:
+        """구독 해제 (구독 중이 아니면 False)"""
+        subscriptions = self._by_user.get(user_id)
+        if not subscriptions or subscription not in subscriptions:
+            return False
+
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._by_user[user_id]
+
+        users = self._subscribers[subscription]
+        users.discard(user_id)
+        if not users:  # 마지막 구독자가 나가면 검색어 트리에서도 제거
+            del self._subscribers[subscription]
+            for term in _search_terms(subscription):
+                self._trie_remove(term, subscription)
+        if self.store is not None:
+            from src.database.subscriber_store import SubscriptionRow
+            self.store.remove_subscription(SubscriptionRow(user_id, *subscription))
+        return True
+
+    def clear_user(self, user_id: int) -> int:
+        """사용자의 모든 구독 해제 (해제한 개수 반환)"""
+        subscriptions = list(self._by_user.get(user_id, ()))
+        for subscription in subscriptions:
+            self.remove(user_id, subscription)
+        return len(subscriptions)
+
+    async def load(self, store):
+        """저장소의 구독을 불러오고 이후 변경은 저장소에 기록"""
+        rows = await asyncio.to_thread(store.load_subscriptions)
+        for row in rows:  # 저장된 구독은 최대 개수와 관계없이 모두 복원
+            self._insert(row.user_id, (row.subscription_type, row.value))
+        self.store = store
+        logger.info(f"종목/키워드 구독 {len(rows):,}건 불러옴 (사용자 {len(self._by_user):,}명)")
+
+    async def sync(self) -> bool:
+        """구독 변경이 저장소에 기록될 때까지 대기 (명령어 응답 전에 호출)"""
+        if self.store is None:
+            return True
+        return await self.store.sync()
+
+    def get_user_subscriptions(self, user_id: int) -> List[Subscription]:
+        """사용자의 구독 항목 (종목, 키워드 순)"""
+        return sorted(self._by_user.get(user_id, ()))
+
+    def match_subscriptions(self, title: str) -> Set[Subscription]:
+        """제목에 등장하는 구독 항목"""
+        text = title.lower()
+        root = self._trie
+        found: Set[Subscription] = set()
+        for start in range(len(text)):
+            node = root.get(text[start])
+            index = start + 1
+            while node is not None:
+                targets = node.get(_END)
+                if targets:
+                    found.update(targets)
+                if index >= len(text):
+                    break
+                node = node.get(text[index])
+                index += 1
+        return found
+
+    def match(self, news: Dict[str, Any]) -> Set[int]:
+        """기사를 받아야 하는 사용자 ID"""
+        users: Set[int] = set()
+        for subscription in self.match_subscriptions(news.get('title', '')):
+            users |= self._subscribers[subscription]
+        return users
+
+    def route(self, news_list: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """사용자별로 받아야 하는 기사 목록 (입력 순서 유지)"""
+        routed: Dict[int, List[Dict[str, Any]]] = {}
+        for news in news_list:
+            for user_id in self.match(news):
+                routed.setdefault(user_id, []).append(news)
+        return routed
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'users': len(self._by_user),
+            'subscriptions': sum(len(subs) for subs in self._by_user.values()),
+            'terms': len(self._subscribers)
+        }
+
+
+class SubscriptionNotifier:
+    """뉴스 버스의 새 기사를 구독자에게 개인 메시지로 전송"""
+
+    def __init__(self, index: SubscriptionIndex, max_articles: int = 5):
+        self.index = index
+        self.max_articles = max_articles  # 한 번에 보내는 최대 기사 수
+        self.routed_articles = 0
+        self.sent_cards = 0
+
+    async def on_batch(self, batch: NewsBatch):
+        """새 기사를 구독자별로 나눠 발송 대기열에 등록"""
+        if not batch.new or not len(self.index):
+            return
+
+        routed = self.index.route(batch.new)
+        if not routed:
+            return
+
+        from src.bot.delivery import enqueue_broadcast
+        from src.bot.news_cards import news_set_key, render_card
+
+        # 같은 기사 묶음을 받는 사용자끼리 모아 카드는 묶음당 한 번만 렌더링
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        positions = {id(news): i for i, news in enumerate(batch.new)}
+        for user_id, news_list in routed.items():
+            key = tuple(positions[id(news)] for news in news_list[:self.max_articles])
+            groups.setdefault(key, []).append(user_id)
+
+        stamp = time.strftime('%Y%m%d%H%M%S', time.localtime(batch.crawled_at))
+        for key, user_ids in groups.items():
+            news_list = [batch.new[i] for i in key]
+            card = render_card('subscription', news_list)
+            await enqueue_broadcast(f"subscription:{stamp}:{news_set_key(news_list)}", card, user_ids)
+            self.sent_cards += len(user_ids)
+
+        self.routed_articles += sum(len(news_list) for news_list in routed.values())
+        logger.info(f"구독 알림: 새 기사 {len(batch.new)}건 -> 사용자 {len(routed)}명 (카드 {len(groups)}종)")
+
+    def start(self):
+        """뉴스 버스 구독 시작"""
+        get_news_bus().consume('subscriptions', self.on_batch)
+        logger.info("구독 알림 시작")
+
+
+# 전역 구독 색인/알림 인스턴스
+subscription_index = None
+subscription_notifier = None
+
+def get_subscription_index() -> SubscriptionIndex:
+    """구독 색인 조회 (최초 호출시 생성)"""
+    global subscription_index
+    if subscription_index is None:
+        subscription_index = SubscriptionIndex(max_per_user=get_env_int("SUBSCRIPTION_MAX_PER_USER", 20))
+    return subscription_index
+
+def get_subscription_notifier() -> SubscriptionNotifier:
+    """구독 알림 조회 (최초 호출시 생성)"""
+    global subscription_notifier
+    if subscription_notifier is None:
+        subscription_notifier = SubscriptionNotifier(
+            get_subscription_index(),
+            max_articles=get_env_int("SUBSCRIPTION_MAX_ARTICLES", 5)
+        )
+    return subscription_notifier